@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Bucketing benchmark: time to build a flop bucket file, time to open it (header
+only) and the cost of looking up a precomputed hand state.
+
+Run from the repository root:
+    python benchmarks/bench_bucketing.py [flop states]
+"""
+
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import Card
+from src.bucketing import BucketIndex, decode_keys
+
+
+def main():
+    n_states = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'flop.tcb'
+        start = time.perf_counter()
+        BucketIndex.build(path, n_board=3, n_states=n_states, n_buckets=50)
+        print(f'build, {n_states:,} flop states into 50 buckets: {time.perf_counter() - start:.1f} s '
+              f'({path.stat().st_size / n_states:.1f} bytes/state)')
+
+        start = time.perf_counter()
+        index = BucketIndex(path)
+        print(f'open: {(time.perf_counter() - start) * 1e6:.0f} us')
+
+        index._map()
+        hole, board = decode_keys(index._keys[0:1000], 3)
+        states = [([Card.from_id(int(card)) for card in hole_row], [Card.from_id(int(card)) for card in board_row])
+                  for hole_row, board_row in zip(hole, board)]
+        start = time.perf_counter()
+        for hole_cards, board_cards in states:
+            index.bucket(hole_cards, board_cards)
+        print(f'lookup: {(time.perf_counter() - start) / len(states) * 1e6:.0f} us')
+
+
+if __name__ == '__main__':
+    main()
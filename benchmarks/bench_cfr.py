@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Push/fold CFR benchmark: time to estimate the 169 x 169 equity matrix, CFR+
+iterations per second, and the cost of a strategy table lookup.
+
+Run from the repository root:
+    python benchmarks/bench_cfr.py [boards per class pair]
+"""
+
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.cfr import PushFoldSolver, deal_weights, equity_matrix
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    start = time.perf_counter()
+    equities = equity_matrix(samples=samples)
+    print(f'equity matrix, {samples} boards per class pair: {time.perf_counter() - start:.1f} s')
+
+    solver = PushFoldSolver(equities, deal_weights())
+    iterations = 2000
+    start = time.perf_counter()
+    table = solver.solve_table([5, 10, 15, 20], iterations)
+    elapsed = time.perf_counter() - start
+    print(f'CFR+: {4 * iterations / elapsed:,.0f} iterations/s over 169 classes')
+
+    n_lookups = 1_000_000
+    start = time.perf_counter()
+    for idx in range(n_lookups):
+        table.push_probability(12.5, idx % 169)
+    print(f'table lookup: {(time.perf_counter() - start) / n_lookups * 1e9:.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
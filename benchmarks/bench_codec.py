@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Codec benchmark: bulk parsing of a text file of 7 card hands into card ids,
+compared with making Card objects per card, and card formatting.
+
+Run from the repository root:
+    python benchmarks/bench_codec.py [lines]
+"""
+
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import Card
+from src.codec import CARD_TEXT, format_cards, parse_card, parse_file
+
+
+def main():
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(0)
+    deals = np.argsort(rng.random((n_lines, 52)), axis=1)[:, 0:7]
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'hands.txt'
+        path.write_text('\n'.join(format_cards(deal) for deal in deals) + '\n')
+
+        start = time.perf_counter()
+        n_parsed = sum(len(chunk) for chunk in parse_file(path))
+        elapsed = time.perf_counter() - start
+        print(f'bulk parse: {n_parsed:,} lines in {elapsed:.2f} s ({elapsed / n_parsed / 7 * 1e9:.0f} ns/card)')
+
+        start = time.perf_counter()
+        with open(path) as file:
+            for line in file:
+                [Card.from_id(parse_card(text)) for text in line.split()]
+        elapsed = time.perf_counter() - start
+        print(f'per card objects: {elapsed:.2f} s ({elapsed / n_lines / 7 * 1e9:.0f} ns/card)')
+
+    cards = [Card.from_id(card_id) for card_id in range(52)]
+    n_calls = 1_000_000
+    start = time.perf_counter()
+    for idx in range(n_calls):
+        str(cards[idx % 52])
+    print(f'Card.__str__: {(time.perf_counter() - start) / n_calls * 1e9:.0f} ns')
+    start = time.perf_counter()
+    for idx in range(n_calls):
+        CARD_TEXT[idx % 52]
+    print(f'table format: {(time.perf_counter() - start) / n_calls * 1e9:.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
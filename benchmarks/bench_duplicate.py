@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Variance reduction benchmark for strategy comparison: standard error of the
+strict - rand chip difference per deal with independent hands, duplicate deals
+with common random numbers, and duplicate deals settled by equity. Stacks are
+short (10 big blinds) so that all in hands, which equity settlement smooths, are common.
+
+The hands needed for the same error grow with its square, so the reported
+factor is how many times more hands independent play needs.
+
+Run from the repository root:
+    python benchmarks/bench_duplicate.py [deals]
+"""
+
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.evaluation import DuplicateEvaluator
+
+STRATEGIES = ['strict', 'soft', 'rand']
+BANK = 40
+
+
+def main():
+    n_deals = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f'{n_deals} deals of {len(STRATEGIES)} hands each')
+    print(f'{"mode":<12} {"strict-rand":>12} {"std error":>10} {"hands factor":>13} {"s":>7}')
+    baseline = None
+    for mode, duplicate, equity in [('independent', False, False), ('duplicate', True, False), ('dup+equity', True, True)]:
+        start = time.perf_counter()
+        comparison = DuplicateEvaluator(STRATEGIES, bank=BANK, duplicate=duplicate, equity_runouts=equity).run(n_deals)
+        elapsed = time.perf_counter() - start
+        mean, std_error = comparison.difference('strict', 'rand')
+        baseline = std_error if baseline is None else baseline
+        print(f'{mode:<12} {mean:>12.2f} {std_error:>10.3f} {(baseline / std_error) ** 2:>13.1f} {elapsed:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
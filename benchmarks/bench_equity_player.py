@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Equity player benchmark: decision latency against its time budget and chips won
+per deal against the fixed weight strategies on duplicate deals, for a few budgets.
+
+Run from the repository root:
+    python benchmarks/bench_equity_player.py [deals]
+"""
+
+import statistics
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.equity_player import EquityPlayer
+from src.evaluation import DuplicateEvaluator
+
+BUDGETS = [0.0005, 0.002, 0.005]
+
+
+class TimedEquityPlayer(EquityPlayer):
+    """
+    Equity player that keeps the wall time and sample count of its decisions
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+        self.sample_counts = []
+
+    def get_action(self, min_bet:int) -> int:
+        start = time.perf_counter()
+        amount = super().get_action(min_bet)
+        self.latencies.append(time.perf_counter() - start)
+        self.sample_counts.append(self.samples)
+        return amount
+
+
+def main():
+    n_deals = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    print(f'{n_deals} deals vs strict, soft and rand')
+    print(f'{"budget ms":>9} {"p50 ms":>7} {"p99 ms":>7} {"max ms":>7} {"samples":>8} {"chips/deal":>11} {"std err":>8}')
+    for budget in BUDGETS:
+        made = []
+        def factory(bank, id):
+            made.append(TimedEquityPlayer(bank, id, time_budget=budget, max_samples=10**6))
+            return made[-1]
+        comparison = DuplicateEvaluator(['equity', 'strict', 'soft', 'rand'], params={'equity': factory}).run(n_deals)
+        result = comparison.result('equity')
+        latencies = sorted(made[0].latencies)
+        p50 = latencies[len(latencies) // 2] * 1e3
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+        samples = statistics.fmean(made[0].sample_counts)
+        print(f'{budget * 1e3:>9.1f} {p50:>7.2f} {p99:>7.2f} {latencies[-1] * 1e3:>7.2f} {samples:>8.0f} '
+              f'{result.mean:>11.2f} {result.std_error:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Exploitability of the built in strategies in the heads-up betting abstraction,
+with the time each exact best response takes.
+
+Run from the repository root:
+    python benchmarks/bench_exploitability.py [boards per class pair]
+"""
+
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.best_response import strategy_exploitability
+from src.cfr import deal_weights, equity_matrix
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    tables = {'equities': equity_matrix(samples=samples), 'weights': deal_weights()}
+    print(f'{"strategy":<8} {"chips/hand":>11} {"ms":>7}')
+    for strategy in ['strict', 'soft', 'rand']:
+        start = time.perf_counter()
+        value = strategy_exploitability(strategy, **tables)
+        print(f'{strategy:<8} {value:>11.2f} {(time.perf_counter() - start) * 1e3:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Text hand history import benchmark: hands per second streamed from one file in
+this process and parsed across worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_importer.py [hands] [workers]
+"""
+
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.importer import import_files, read_text_hands
+from tests.test_importer import CASH_HAND, TOURNAMENT_HAND
+
+
+def main():
+    n_hands = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'session.txt'
+        path.write_text((CASH_HAND + TOURNAMENT_HAND) * (n_hands // 2), encoding='utf-8')
+        size_mb = path.stat().st_size / 1e6
+
+        start = time.perf_counter()
+        count = sum(1 for _ in read_text_hands(path))
+        elapsed = time.perf_counter() - start
+        print(f'streamed: {count:,} hands ({size_mb:.0f} MB) in {elapsed:.2f} s, {count / elapsed:,.0f} hands/s')
+
+        start = time.perf_counter()
+        count = sum(1 for _ in import_files([path], workers=workers, chunk_size=1 << 22))
+        elapsed = time.perf_counter() - start
+        print(f'parallel: {count:,} hands in {elapsed:.2f} s, {count / elapsed:,.0f} hands/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for sustained simulation: plays many headless rounds either
+building a new GameRound, Deck (52 Cards) and Hands every round, as the Dealer
+used to, or resetting and reusing them in place, as the Dealer does now.
+
+Reports time per round and the growth in allocated memory blocks over the whole
+run (flat memory means no growth), then traces a sample of rounds to report the
+mean per-round allocation peak above the steady state.
+
+Run from the repository root:
+    python benchmarks/bench_memory.py [rounds]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import Hand
+from src import Player
+from src.round import GameRound
+
+STRATEGIES = ['strict', 'soft', 'rand']
+
+
+def prepare_players(players:list[Player], idx:int, reuse:bool) -> None:
+    """
+    Function to reset players between rounds the way the Dealer does
+
+    Args:
+        players (list[Player]): players at the table
+        idx (int): round index, moves the blinds
+        reuse (bool): empty existing hands instead of making new ones
+    """
+    for player in players:
+        player.bank = 10**6
+        if reuse is True:
+            player.hand.clear()
+        else:
+            player.hand = Hand([])
+        player._active = True
+        player.blind = None
+        player._clear_action()
+        player._clear_bet_amount()
+    players[idx % len(players)].blind = 'small'
+    players[(idx + 1) % len(players)].blind = 'large'
+
+
+def play(n_rounds:int, reuse:bool, traced:bool = False) -> tuple:
+    """
+    Function to play rounds and measure them
+
+    Args:
+        n_rounds (int): rounds to play
+        reuse (bool): reuse round, deck and hands
+        traced (bool, optional): trace each round's allocation peak. Defaults to False.
+
+    Returns:
+        tuple: (us per round, allocated block growth, mean per-round peak KiB)
+    """
+    random.seed(0)
+    players = [Player(0, i, STRATEGIES[i % 3]) for i in range(1, 7)]
+    for player in players:
+        player.hand = Hand([])
+    round = None
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    peaks = 0
+    if traced is True:
+        tracemalloc.start()
+    start = time.perf_counter()
+    for idx in range(n_rounds):
+        if traced is True:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        prepare_players(players, idx, reuse)
+        if (reuse is True) and (round is not None):
+            round.reset(players, 2, 4)
+        else:
+            round = GameRound(players, 2, 4, verbose=False)
+        round.play()
+        if traced is True:
+            peaks += tracemalloc.get_traced_memory()[1] - base
+    elapsed = time.perf_counter() - start
+    if traced is True:
+        tracemalloc.stop()
+    gc.collect()
+
+    return (elapsed / n_rounds * 1e6, sys.getallocatedblocks() - blocks, peaks / n_rounds / 1024)
+
+
+def main():
+    n_rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_traced = min(n_rounds, 2000)
+    print(f'{n_rounds} rounds timed, {n_traced} rounds traced')
+    print(f'{"mode":<8} {"us/round":>9} {"block growth":>13} {"KiB/round peak":>15}')
+    for mode, reuse in [('fresh', False), ('reuse', True)]:
+        us, growth, _ = play(n_rounds, reuse)
+        _, _, peak = play(n_traced, reuse, traced=True)
+        print(f'{mode:<8} {us:>9.1f} {growth:>13} {peak:>15.2f}')
+
+
+if __name__ == '__main__':
+    main()
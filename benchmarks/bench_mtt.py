@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Multi-table tournament benchmark: wall time of a large field across worker
+processes and the coordinator's share of it (eliminating, breaking and
+balancing tables), per hand played.
+
+Run from the repository root:
+    python benchmarks/bench_mtt.py [entrants] [workers]
+"""
+
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.mtt import MultiTableTournament
+
+
+def main():
+    n_entrants = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    strategies = [('strict', 'soft', 'rand')[idx % 3] for idx in range(n_entrants)]
+    tournament = MultiTableTournament(strategies, workers=workers)
+
+    start = time.perf_counter()
+    standings = tournament.run()
+    elapsed = time.perf_counter() - start
+    print(f'{n_entrants:,} entrants, {-(-n_entrants // tournament.table_size)} tables: '
+          f'{tournament.hands:,} hands in {tournament.steps} steps, {elapsed:.2f} s')
+    print(f'coordinator: {tournament.coordinator_seconds * 1e3:.1f} ms in total, '
+          f'{tournament.coordinator_seconds / tournament.hands * 1e6:.2f} us per hand')
+    print(f'winner: player {standings[0].id} ({standings[0].strategy})')
+
+
+if __name__ == '__main__':
+    main()
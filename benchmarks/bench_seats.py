@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Seat count benchmark: average cost of a headless GameRound as the table grows
+from 2 to 10 players.
+
+Run from the repository root:
+    python benchmarks/bench_seats.py [rounds per table size]
+"""
+
+import random
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import Hand
+from src import Player
+from src.round import GameRound
+
+STRATEGIES = ['strict', 'soft', 'rand']
+
+
+def time_rounds(n_seats:int, n_rounds:int) -> float:
+    """
+    Function to time headless rounds at a table size
+
+    Args:
+        n_seats (int): players at the table
+        n_rounds (int): rounds to play
+
+    Returns:
+        float: mean seconds per round
+    """
+    players = [Player(0, i, STRATEGIES[i % 3]) for i in range(1, n_seats + 1)]
+    elapsed = 0.0
+    for idx in range(n_rounds):
+        for player in players:
+            player.bank = 10**6
+            player.hand = Hand([])
+            player._active = True
+            player.blind = None
+            player._clear_action()
+            player._clear_bet_amount()
+        players[idx % n_seats].blind = 'small'
+        players[(idx + 1) % n_seats].blind = 'large'
+
+        start = time.perf_counter()
+        GameRound(players, 2, 4, verbose=False).play()
+        elapsed += time.perf_counter() - start
+
+    return elapsed / n_rounds
+
+
+def main():
+    n_rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    random.seed(0)
+    print(f'{"seats":>5} {"us/round":>10}')
+    for n_seats in range(2, 11):
+        print(f'{n_seats:>5} {time_rounds(n_seats, n_rounds) * 1e6:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
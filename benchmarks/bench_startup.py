@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: measures the import time of the core engine modules on their
+own, each in a fresh interpreter, and reports whether pygame was pulled in.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py [repeats]
+"""
+
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ['src.card', 'src.deck', 'src.hand', 'src.player', 'src.winner',
+           'src.round', 'src.dealer', 'src', 'src.gui', 'pygame']
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, 'pygame' in sys.modules)
+"""
+
+
+def time_import(module:str, repeats:int) -> tuple:
+    """
+    Function to time the import of a module in fresh interpreters
+
+    Args:
+        module (str): dotted module name to import
+        repeats (int): number of fresh interpreters to time
+
+    Returns:
+        tuple: (median seconds, bool if pygame was imported)
+    """
+    times = []
+    loaded_pygame = False
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, '-c', SNIPPET.format(module=module)],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        seconds, pygame_flag = out.stdout.split()[-2:]
+        times.append(float(seconds))
+        loaded_pygame = (pygame_flag == 'True')
+
+    return statistics.median(times), loaded_pygame
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f'{"module":<12} {"median ms":>10}  pygame loaded')
+    for module in MODULES:
+        seconds, loaded_pygame = time_import(module, repeats)
+        print(f'{module:<12} {seconds * 1000:>10.2f}  {loaded_pygame}')
+
+
+if __name__ == '__main__':
+    main()
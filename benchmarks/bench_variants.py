@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Variant benchmark: Omaha showdowns scored with the shared board evaluator,
+compared with evaluating all 60 five card hands of every player, and short
+deck scoring.
+
+Run from the repository root:
+    python benchmarks/bench_variants.py [showdowns] [players]
+"""
+
+import random
+import sys
+import time
+
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.evaluator import evaluate, evaluate_short_deck
+from src.variants import OMAHA
+
+
+def main():
+    n_showdowns = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    n_players = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    rng = random.Random(0)
+    deals = []
+    for _ in range(n_showdowns):
+        cards = rng.sample(range(52), 4 * n_players + 5)
+        deals.append(([cards[4 * idx:4 * idx + 4] for idx in range(n_players)], cards[-5:]))
+    n_hands = n_showdowns * n_players
+
+    start = time.perf_counter()
+    fast = [OMAHA.scores(holes, board) for holes, board in deals]
+    elapsed = time.perf_counter() - start
+    print(f'omaha board evaluator: {n_hands:,} hands in {elapsed:.2f} s ({elapsed / n_hands * 1e6:.1f} us/hand)')
+
+    n_brute = min(n_showdowns, 500)
+    start = time.perf_counter()
+    brute = [[max(evaluate(list(two) + list(three)) for two in combinations(hole, 2)
+                  for three in combinations(board, 3)) for hole in holes]
+             for holes, board in deals[0:n_brute]]
+    elapsed = time.perf_counter() - start
+    print(f'omaha 60 evaluations:  {n_brute * n_players:,} hands in {elapsed:.2f} s '
+          f'({elapsed / (n_brute * n_players) * 1e6:.1f} us/hand)')
+    assert brute == fast[0:n_brute]
+
+    short = [rng.sample(range(16, 52), 7) for _ in range(n_hands)]
+    start = time.perf_counter()
+    for cards in short:
+        evaluate_short_deck(cards)
+    elapsed = time.perf_counter() - start
+    print(f'short deck 7 cards:    {n_hands:,} hands in {elapsed:.2f} s ({elapsed / n_hands * 1e6:.1f} us/hand)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Searches computer strategy parameters by successive halving and prints the best ones.
+
+    python search_strategies.py [configs] [first rung deals] [workers]
+"""
+
+import sys
+
+from src.search import StrategySearch
+
+
+def main():
+    n_configs = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    min_deals = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    search = StrategySearch(workers=workers)
+    results = search.run(n_configs, min_deals)
+    for rung in search.rungs:
+        print(f'rung: {len(rung)} configs x {rung[0].deals} deals')
+    print(f'{"check":>6} {"bet":>6} {"fold":>6} {"cap":>6} {"deals":>6} {"chips/deal":>11} {"std err":>8}')
+    for result in results[0:10]:
+        print(f'{result.params.check:>6.3f} {result.params.bet:>6.3f} {result.params.fold:>6.3f} '
+              f'{result.params.bet_cap:>6.3f} {result.deals:>6} {result.mean:>11.2f} {result.std_error:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
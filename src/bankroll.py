@@ -0,0 +1,207 @@
+"""
+This file defines a recorder that summarizes how players' banks move over many
+hands and games in constant memory per player: mean and variance of the per-hand
+bank change, quantile sketches of the changes and of the banks, and how often
+players go broke or fall below a share of their starting bank.
+"""
+
+import math
+
+from .online_stats import QuantileSketch, RunningStats
+from .recorder import HandRecorder
+
+
+class BankrollStats:
+    def __init__(self, thresholds:tuple, relative_accuracy:float):
+        """
+        This class holds one player's bank statistics
+
+        Args:
+            thresholds (tuple[float]): shares of the starting bank counted as ruin levels
+            relative_accuracy (float): relative accuracy of the quantile sketches
+        """
+        self.thresholds = thresholds
+        self.deltas = RunningStats()
+        self.delta_sketch = QuantileSketch(relative_accuracy)
+        self.bank_sketch = QuantileSketch(relative_accuracy)
+        self.games = 0
+        self.busts = 0
+        self.games_below = [0] * len(thresholds)
+        self.max_drawdown = 0
+
+
+    def merge(self, other:"BankrollStats") -> None:
+        """
+        Method to add another tracker's statistics for the same player
+
+        Args:
+            other (BankrollStats): statistics to add
+
+        Raises:
+            ValueError: raised if the ruin levels differ
+        """
+        if other.thresholds != self.thresholds:
+            raise ValueError('Only statistics with the same ruin levels can be merged')
+
+        self.deltas.merge(other.deltas)
+        self.delta_sketch.merge(other.delta_sketch)
+        self.bank_sketch.merge(other.bank_sketch)
+        self.games += other.games
+        self.busts += other.busts
+        self.games_below = [mine + theirs for mine, theirs in zip(self.games_below, other.games_below)]
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown)
+
+
+    @property
+    def hands(self) -> int:
+        """
+        Hands played
+        """
+        return self.deltas.count
+
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """
+        Share of games the player was eliminated from, nan before a game is finished
+        """
+        return self.busts / self.games if self.games > 0 else math.nan
+
+
+    def risk_below(self, threshold:float) -> float:
+        """
+        Method to get the share of games the bank fell to a ruin level or lower
+
+        Args:
+            threshold (float): ruin level, one of the tracker's thresholds
+
+        Returns:
+            float: share of games, nan before a game is finished
+        """
+        if self.games == 0:
+            return math.nan
+        return self.games_below[self.thresholds.index(threshold)] / self.games
+
+
+    def __repr__(self) -> str:
+        return (f'BankrollStats(hands={self.hands}, mean_delta={self.deltas.mean:.2f}, '
+                f'median_delta={self.delta_sketch.quantile(0.5):.2f}, games={self.games}, '
+                f'risk_of_ruin={self.risk_of_ruin:.3f})')
+
+
+
+class BankrollTracker(HandRecorder):
+    def __init__(self, thresholds:tuple = (0.5, 0.25), relative_accuracy:float = 0.01):
+        """
+        This class follows the games run by the Dealers it is passed to (as a recorder)
+        and keeps a BankrollStats per player id, fed with each player's bank change at
+        the end of every hand. Trackers from worker processes are combined with merge().
+
+        Args:
+            thresholds (tuple[float], optional): shares of the starting bank counted as ruin
+                levels. Defaults to (0.5, 0.25).
+            relative_accuracy (float, optional): relative accuracy of the quantile sketches.
+                Defaults to 0.01.
+        """
+        self.thresholds = tuple(thresholds)
+        self.relative_accuracy = relative_accuracy
+        self.players = {}
+
+        # state of the game and hand being played, per player id
+        self._start_banks = {}
+        self._peaks = {}
+        self._lows = {}
+        self._hand_banks = {}
+
+
+    def __getitem__(self, player_id:int) -> BankrollStats:
+        """
+        Method to get a player's statistics, empty if the player has not been seen
+
+        Args:
+            player_id (int): player id
+
+        Returns:
+            BankrollStats: the player's statistics
+        """
+        return self.players.get(player_id, BankrollStats(self.thresholds, self.relative_accuracy))
+
+
+    def begin_game(self, dealer) -> None:
+        """
+        Method to save the starting banks of a game
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        self._start_banks = {player.id: player.bank for player in dealer.players}
+        self._peaks = dict(self._start_banks)
+        self._lows = dict(self._start_banks)
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Method to save the banks before the blinds
+
+        Args:
+            round (GameRound): round being played
+        """
+        self._hand_banks = {player.id: player.bank for player in round.players}
+
+
+    def end_hand(self, round) -> None:
+        """
+        Method to add every player's bank change
+
+        Args:
+            round (GameRound): round being played
+        """
+        for player in round.players:
+            stats = self._stats(player.id)
+            delta = player.bank - self._hand_banks.get(player.id, player.bank)
+            stats.deltas.add(delta)
+            stats.delta_sketch.add(delta)
+            stats.bank_sketch.add(player.bank)
+
+            peak = max(self._peaks.get(player.id, player.bank), player.bank)
+            self._peaks[player.id] = peak
+            self._lows[player.id] = min(self._lows.get(player.id, player.bank), player.bank)
+            stats.max_drawdown = max(stats.max_drawdown, peak - player.bank)
+
+
+    def end_game(self, dealer) -> None:
+        """
+        Method to count the finished game, players no longer seated were eliminated
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        seated = {player.id for player in dealer.players}
+        for player_id, start_bank in self._start_banks.items():
+            stats = self._stats(player_id)
+            stats.games += 1
+            stats.busts += player_id not in seated
+            low = self._lows.get(player_id, start_bank)
+            for idx, threshold in enumerate(self.thresholds):
+                stats.games_below[idx] += low <= start_bank * threshold
+
+
+    def merge(self, other:"BankrollTracker") -> None:
+        """
+        Method to add another tracker's statistics, e.g. from a worker process
+
+        Args:
+            other (BankrollTracker): tracker to add
+        """
+        for player_id, stats in other.players.items():
+            self._stats(player_id).merge(stats)
+
+
+    def _stats(self, player_id:int) -> BankrollStats:
+        """
+        Helper method to get a player's statistics, creating them the first time
+        """
+        stats = self.players.get(player_id)
+        if stats is None:
+            stats = self.players[player_id] = BankrollStats(self.thresholds, self.relative_accuracy)
+        return stats
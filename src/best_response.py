@@ -0,0 +1,292 @@
+"""
+This file defines best responses and exploitability for strategies in a simplified
+betting abstraction of GameRound: heads-up, one betting round (small blind first),
+fold / check-call / raise by a fixed size up to a raise cap, then a showdown.
+
+Values are computed exactly by walking the betting tree once with vectors over the
+169 starting hand classes, instead of simulating hands.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .cfr import N_CLASSES, deal_weights, equity_matrix
+from .player import StrategyParams, STRATEGIES
+
+FOLD, CALL, RAISE = range(3)
+ACTION_CODES = 'fcr'
+
+
+class BestResponse(NamedTuple):
+    seat: int
+    value: float
+    policy: dict
+
+
+class BettingAbstraction:
+    def __init__(self,
+                 stack:int = 200,
+                 small_blind:int = 2,
+                 big_blind:int = 4,
+                 raise_size:int = 8,
+                 max_raises:int = 3,
+                 equities:np.ndarray = None,
+                 weights:np.ndarray = None):
+        """
+        This class holds the betting tree of the abstraction and evaluates best
+        responses in it. Histories are strings of actions, 'f' fold, 'c' check or
+        call and 'r' raise, e.g. 'cr' is a small blind limp and a big blind raise.
+
+        Args:
+            stack (int, optional): both players' stacks before the blinds. Defaults to 200.
+            small_blind (int, optional): small blind, seat 0. Defaults to 2.
+            big_blind (int, optional): big blind, seat 1. Defaults to 4.
+            raise_size (int, optional): chips a raise adds on top of the call, capped
+                by the stack. Defaults to 8.
+            max_raises (int, optional): raises allowed before betting is capped. Defaults to 3.
+            equities (np.ndarray, optional): (169, 169) showdown equities, see equity_matrix().
+                Defaults to None, estimated with the default samples.
+            weights (np.ndarray, optional): (169, 169) deal weights, see deal_weights().
+                Defaults to None, counted.
+        """
+        self.stack = stack
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.raise_size = raise_size
+        self.max_raises = max_raises
+
+        equities = equities if equities is not None else equity_matrix()
+        weights = weights if weights is not None else deal_weights()
+        # joint deal probability of (responder class, opponent class) and its equity weighted twin
+        self.joint = weights / weights.sum()
+        self.joint_equity = self.joint * equities
+
+
+    def best_response(self, policy, seat:int) -> BestResponse:
+        """
+        Method to find the counter strategy that wins the most against a policy
+
+        Args:
+            policy (callable): function of (history, call amount, can raise) returning the
+                opponent's [fold, call, raise] probabilities, shape (3,) or (169, 3) by class
+            seat (int): seat of the best responder, 0 small blind or 1 big blind
+
+        Returns:
+            BestResponse: expected chips per hand won by the best responder and its
+                policy, history -> best action of each class
+        """
+        best_policy = {}
+        values = self._values('', 0, [self.small_blind, self.big_blind], 0, np.ones(N_CLASSES),
+                              policy, seat, best_policy)
+        return BestResponse(seat, float(values.sum()), best_policy)
+
+
+    def exploitability(self, policy) -> float:
+        """
+        Method to get how much a best responder wins against a policy per hand,
+        averaged over both seats as they alternate. It is zero for an equilibrium
+        and larger the more exploitable the policy is.
+
+        Args:
+            policy (callable): see best_response()
+
+        Returns:
+            float: chips per hand
+        """
+        return (self.best_response(policy, 0).value + self.best_response(policy, 1).value) / 2
+
+
+    def profile_value(self, policy_0, policy_1) -> float:
+        """
+        Method to get the expected chips per hand the small blind wins when each seat
+        plays a policy
+
+        Args:
+            policy_0 (callable): small blind policy, see best_response()
+            policy_1 (callable): big blind policy
+
+        Returns:
+            float: small blind's chips per hand, the big blind wins the negative
+        """
+        return self._profile('', 0, [self.small_blind, self.big_blind], 0,
+                             [np.ones(N_CLASSES), np.ones(N_CLASSES)], (policy_0, policy_1))
+
+
+    def _profile(self, history:str, to_act:int, bets:list[int], n_raises:int, reaches:list, policies:tuple) -> float:
+        """
+        Helper method to get the small blind's value of a node when both seats play
+        policies, see profile_value()
+
+        Args:
+            history (str): actions so far
+            to_act (int): seat to act
+            bets (list[int]): chips each seat has put in
+            n_raises (int): raises so far
+            reaches (list[np.ndarray]): probability each seat played to this node, per class
+            policies (tuple): policy of each seat
+
+        Returns:
+            float: small blind's value
+        """
+        call_amt = bets[1 - to_act] - bets[to_act]
+        raise_amt = min(call_amt + self.raise_size, self.stack - bets[to_act])
+        can_raise = (n_raises < self.max_raises) and (raise_amt > call_amt)
+        probs = self._probs(policies[to_act], history, call_amt, can_raise)
+
+        value = 0.0
+        for action in (FOLD, CALL, RAISE):
+            if not probs[:, action].any():
+                continue
+            child_reaches = list(reaches)
+            child_reaches[to_act] = reaches[to_act] * probs[:, action]
+            child_history = history + ACTION_CODES[action]
+            child_bets = list(bets)
+            if action == FOLD:
+                sign = -1 if to_act == 0 else 1
+                value += sign * bets[to_act] * (child_reaches[0] @ self.joint @ child_reaches[1])
+            elif action == CALL:
+                child_bets[to_act] += call_amt
+                if (call_amt > 0 and len(child_history) > 1) or (to_act == 1):
+                    value += child_reaches[0] @ (sum(child_bets) * self.joint_equity
+                                                 - child_bets[0] * self.joint) @ child_reaches[1]
+                else:
+                    value += self._profile(child_history, 1, child_bets, n_raises, child_reaches, policies)
+            else:
+                child_bets[to_act] += raise_amt
+                value += self._profile(child_history, 1 - to_act, child_bets, n_raises + 1, child_reaches, policies)
+        return float(value)
+
+
+    @staticmethod
+    def _probs(policy, history:str, call_amt:int, can_raise:bool) -> np.ndarray:
+        """
+        Helper method to get a policy's action probabilities per class at a node
+
+        Returns:
+            np.ndarray: (169, 3) [fold, call, raise] probabilities
+        """
+        probs = np.broadcast_to(np.asarray(policy(history, call_amt, can_raise), dtype=np.float64), (N_CLASSES, 3))
+        if can_raise is False:
+            # a raise that cannot be made is a call, as in GameRound
+            probs = np.column_stack([probs[:, FOLD], probs[:, CALL] + probs[:, RAISE], np.zeros(N_CLASSES)])
+        return probs / probs.sum(axis=1, keepdims=True)
+
+
+    def _values(self, history:str, to_act:int, bets:list[int], n_raises:int, reach:np.ndarray,
+                policy, seat:int, best_policy:dict) -> np.ndarray:
+        """
+        Helper method to get the best responder's value of a node for each of its classes,
+        weighted by the chance of being dealt that class
+
+        Args:
+            history (str): actions so far
+            to_act (int): seat to act
+            bets (list[int]): chips each seat has put in
+            n_raises (int): raises so far
+            reach (np.ndarray): probability the opponent played to this node, per opponent class
+            policy (callable): opponent policy
+            seat (int): best responder's seat
+            best_policy (dict): filled with the best action of each class per history
+
+        Returns:
+            np.ndarray: (169,) values
+        """
+        call_amt = bets[1 - to_act] - bets[to_act]
+        raise_amt = min(call_amt + self.raise_size, self.stack - bets[to_act])
+        can_raise = (n_raises < self.max_raises) and (raise_amt > call_amt)
+
+        actions = [action for action in (FOLD, CALL, RAISE) if (action != RAISE) or can_raise]
+
+        if to_act == seat:
+            options = np.full((3, N_CLASSES), -np.inf)
+            for action in actions:
+                options[action] = self._child(history, to_act, bets, n_raises, action, call_amt, raise_amt,
+                                              reach, policy, seat, best_policy)
+            best_policy[history] = options.argmax(axis=0)
+            return options.max(axis=0)
+
+        probs = self._probs(policy, history, call_amt, can_raise)
+
+        # the opponent's action only changes which of its classes reach each child
+        values = np.zeros(N_CLASSES)
+        for action in actions:
+            values += self._child(history, to_act, bets, n_raises, action, call_amt, raise_amt,
+                                  reach * probs[:, action], policy, seat, best_policy)
+        return values
+
+
+    def _child(self, history:str, to_act:int, bets:list[int], n_raises:int, action:int, call_amt:int,
+               raise_amt:int, reach:np.ndarray, policy, seat:int, best_policy:dict) -> np.ndarray:
+        """
+        Helper method to get the value of taking an action, see _values()
+        """
+        history = history + ACTION_CODES[action]
+        if action == FOLD:
+            # the folding seat loses what it put in
+            sign = 1 if to_act != seat else -1
+            return sign * bets[to_act] * (self.joint @ reach)
+
+        bets = list(bets)
+        if action == CALL:
+            bets[to_act] += call_amt
+            # a call, or the big blind checking behind a limp, closes the betting
+            if (call_amt > 0 and len(history) > 1) or (to_act == 1):
+                return self._showdown(bets, reach, seat)
+            return self._values(history, 1 - to_act, bets, n_raises, reach, policy, seat, best_policy)
+
+        bets[to_act] += raise_amt
+        return self._values(history, 1 - to_act, bets, n_raises + 1, reach, policy, seat, best_policy)
+
+
+    def _showdown(self, bets:list[int], reach:np.ndarray, seat:int) -> np.ndarray:
+        """
+        Helper method to get the best responder's showdown value: its equity of the
+        pot minus what it put in
+
+        Args:
+            bets (list[int]): chips each seat put in
+            reach (np.ndarray): opponent reach per class
+            seat (int): best responder's seat
+
+        Returns:
+            np.ndarray: (169,) values
+        """
+        return sum(bets) * (self.joint_equity @ reach) - bets[seat] * (self.joint @ reach)
+
+
+
+def params_policy(params:StrategyParams):
+    """
+    Function to get the policy of a fixed weight strategy: the same check/bet/fold
+    weights at every decision whatever the cards, folding even when checking is free
+
+    Args:
+        params (StrategyParams): strategy parameters
+
+    Returns:
+        callable: policy for BettingAbstraction
+    """
+    probs = np.array([params.fold, params.check, params.bet], dtype=np.float64)
+    probs = probs / probs.sum()
+    return lambda history, call_amt, can_raise: probs
+
+
+def strategy_exploitability(strategy:str, stack:int = 200, big_blind:int = 4, **kwargs) -> float:
+    """
+    Function to get the exploitability of a built in strategy in chips per hand,
+    with raises sized like the strategy's average raise.
+
+    Args:
+        strategy (str): strategy name, see STRATEGIES
+        stack (int, optional): stacks before the blinds. Defaults to 200.
+        big_blind (int, optional): big blind. Defaults to 4.
+        **kwargs: other BettingAbstraction arguments (equities, weights, max_raises)
+
+    Returns:
+        float: chips per hand a best responder wins
+    """
+    params = STRATEGIES[strategy]
+    raise_size = big_blind + int(stack * params.bet_cap / 2)
+    abstraction = BettingAbstraction(stack, big_blind // 2, big_blind, raise_size, **kwargs)
+    return abstraction.exploitability(params_policy(params))
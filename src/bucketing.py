@@ -0,0 +1,350 @@
+"""
+This file defines a hand strength bucketing abstraction: a pipeline that computes an
+equity histogram for canonical hand states (hole cards and a flop or turn board),
+clusters the histograms into buckets with k-means, and saves the bucket of every
+state in an indexed file that is memory-mapped on first use.
+
+File layout (little endian):
+    header:    magic b'TCEB', version (uint8), board cards (uint8), state count (uint32),
+               bucket count (uint16), histogram bins (uint16), runouts (uint16),
+               opponents (uint16), seed (uint64)
+    keys:      canonical state keys, ascending (int64 each)
+    buckets:   bucket of each key (uint16 each)
+    centroids: bucket centroids, cumulative histograms (bucket count x bins float32)
+"""
+
+import struct
+
+from itertools import permutations
+
+import numpy as np
+
+from .cfr import categories
+
+MAGIC = b'TCEB'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sBBIHHHHQ')
+_SUIT_TUPLES = list(permutations(range(4)))
+_SUIT_PERMUTATIONS = np.array(_SUIT_TUPLES, dtype=np.int64)
+
+
+def canonical_keys(hole:np.ndarray, board:np.ndarray) -> np.ndarray:
+    """
+    Function to get the canonical key of many hand states. States that only differ
+    by renaming suits get the same key: the smallest encoding over the 24 ways to
+    rename them, with hole and board cards each sorted.
+
+    Args:
+        hole (np.ndarray): (states, 2) hole card ids
+        board (np.ndarray): (states, board cards) board card ids
+
+    Returns:
+        np.ndarray: int64 key of each state
+    """
+    cards = np.concatenate([hole, board], axis=1).astype(np.int64)
+    best = None
+    for perm in _SUIT_PERMUTATIONS:
+        renamed = (cards >> 2 << 2) | perm[cards & 3]
+        keys = _encode(np.sort(renamed[:, 0:2], axis=1), np.sort(renamed[:, 2:], axis=1))
+        best = keys if best is None else np.minimum(best, keys)
+    return best
+
+
+def canonical_key(hole:list[int], board:list[int]) -> int:
+    """
+    Function to get the canonical key of one hand state without numpy, which is
+    faster for a single state, see canonical_keys()
+
+    Args:
+        hole (list[int]): hole card ids
+        board (list[int]): board card ids
+
+    Returns:
+        int: key
+    """
+    best = None
+    for perm in _SUIT_TUPLES:
+        key = 0
+        for card in sorted((card & ~3) | perm[card & 3] for card in hole):
+            key = (key << 6) | card
+        for card in sorted((card & ~3) | perm[card & 3] for card in board):
+            key = (key << 6) | card
+        if (best is None) or (key < best):
+            best = key
+    return best
+
+
+def decode_keys(keys:np.ndarray, n_board:int) -> tuple:
+    """
+    Function to get the cards of canonical keys
+
+    Args:
+        keys (np.ndarray): canonical keys
+        n_board (int): board cards per state
+
+    Returns:
+        tuple: ((states, 2) hole card ids, (states, n_board) board card ids)
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    n_cards = 2 + n_board
+    shifts = 6 * np.arange(n_cards - 1, -1, -1)
+    cards = (keys[:, None] >> shifts) & 63
+    return cards[:, 0:2], cards[:, 2:]
+
+
+def sample_states(n_board:int, n_states:int, seed:int = 0) -> np.ndarray:
+    """
+    Function to collect distinct canonical states from random deals
+
+    Args:
+        n_board (int): board cards, 3 for the flop or 4 for the turn
+        n_states (int): distinct states to collect
+        seed (int, optional): seed of the deals. Defaults to 0.
+
+    Returns:
+        np.ndarray: sorted canonical keys
+    """
+    rng = np.random.default_rng(seed)
+    found = np.empty(0, dtype=np.int64)
+    while len(found) < n_states:
+        deals = np.argpartition(rng.random((2 * n_states, 52)), 2 + n_board, axis=1)[:, 0:2 + n_board]
+        found = np.union1d(found, canonical_keys(deals[:, 0:2], deals[:, 2:]))
+    return np.sort(rng.choice(found, n_states, replace=False))
+
+
+def equity_histograms(keys:np.ndarray, n_board:int, bins:int = 8, runouts:int = 16,
+                      opponents:int = 8, seed:int = 0, chunk:int = 2000) -> np.ndarray:
+    """
+    Function to get the equity distribution of states: the hand's equity against a
+    random hand (ranked by type, ties split) on each of runouts random completions
+    of the board, as a histogram over [0, 1].
+
+    Args:
+        keys (np.ndarray): canonical keys
+        n_board (int): board cards per state
+        bins (int, optional): histogram bins. Defaults to 8.
+        runouts (int, optional): board completions per state. Defaults to 16.
+        opponents (int, optional): opponent hands per completion. Defaults to 8.
+        seed (int, optional): seed of the completions. Defaults to 0.
+        chunk (int, optional): states per batch. Defaults to 2000.
+
+    Returns:
+        np.ndarray: (states, bins) histograms, each summing to 1
+    """
+    rng = np.random.default_rng(seed)
+    n_rest = 5 - n_board
+    n_drawn = n_rest + 2 * opponents
+    histograms = np.zeros((len(keys), bins))
+
+    for start in range(0, len(keys), chunk):
+        hole, board = decode_keys(keys[start:start + chunk], n_board)
+        known = np.repeat(np.concatenate([hole, board], axis=1), runouts, axis=0)
+
+        # the rest of the board and the opponent hands are the smallest random keys of the unseen cards
+        draw_keys = rng.random((len(known), 52))
+        np.put_along_axis(draw_keys, known, 2.0, axis=1)
+        drawn = np.argpartition(draw_keys, n_drawn, axis=1)[:, 0:n_drawn]
+        full_board = np.concatenate([known[:, 2:], drawn[:, 0:n_rest]], axis=1)
+
+        mine = categories(np.concatenate([known[:, 0:2], full_board], axis=1))
+        theirs_holes = drawn[:, n_rest:].reshape(len(known) * opponents, 2)
+        theirs = categories(np.concatenate([theirs_holes, np.repeat(full_board, opponents, axis=0)], axis=1))
+        theirs = theirs.reshape(len(known), opponents)
+        equity = ((mine[:, None] > theirs) + 0.5 * (mine[:, None] == theirs)).mean(axis=1)
+
+        bin_idx = np.minimum((equity * bins).astype(np.int64), bins - 1).reshape(-1, runouts)
+        rows = np.repeat(np.arange(len(bin_idx)), runouts)
+        counts = np.zeros((len(bin_idx), bins))
+        np.add.at(counts, (rows, bin_idx.ravel()), 1)
+        histograms[start:start + len(bin_idx)] = counts / runouts
+
+    return histograms
+
+
+def kmeans(data:np.ndarray, k:int, iterations:int = 50, seed:int = 0) -> tuple:
+    """
+    Function to cluster rows with k-means, seeded with k-means++
+
+    Args:
+        data (np.ndarray): (rows, features) points
+        k (int): clusters
+        iterations (int, optional): most Lloyd iterations. Defaults to 50.
+        seed (int, optional): seed of the initial centroids. Defaults to 0.
+
+    Returns:
+        tuple: ((k, features) centroids, cluster of each row)
+    """
+    rng = np.random.default_rng(seed)
+    centroids = [data[rng.integers(len(data))]]
+    for _ in range(1, k):
+        distances = _sq_distances(data, np.array(centroids)).min(axis=1)
+        total = distances.sum()
+        pick = rng.choice(len(data), p=distances / total) if total > 0 else rng.integers(len(data))
+        centroids.append(data[pick])
+    centroids = np.array(centroids, dtype=np.float64)
+
+    labels = None
+    for _ in range(iterations):
+        new_labels = _sq_distances(data, centroids).argmin(axis=1)
+        if (labels is not None) and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(k):
+            members = data[labels == cluster]
+            if len(members) > 0:
+                centroids[cluster] = members.mean(axis=0)
+
+    return centroids, labels
+
+
+def _sq_distances(data:np.ndarray, centroids:np.ndarray) -> np.ndarray:
+    """
+    Helper function to get squared distances of every row to every centroid
+
+    Returns:
+        np.ndarray: (rows, centroids) squared distances
+    """
+    return ((data[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+
+
+def _encode(hole:np.ndarray, board:np.ndarray) -> np.ndarray:
+    """
+    Helper function to pack sorted hole and board card ids into keys, 6 bits a card
+
+    Returns:
+        np.ndarray: int64 keys
+    """
+    cards = np.concatenate([hole, board], axis=1)
+    shifts = 6 * np.arange(cards.shape[1] - 1, -1, -1)
+    return (cards << shifts).sum(axis=1)
+
+
+
+class BucketIndex:
+    def __init__(self, path:str):
+        """
+        This class looks up the bucket of hand states in a bucket file written by
+        BucketIndex.build(). Only the header is read when it is opened, the keys,
+        buckets and centroids are memory-mapped on the first lookup.
+
+        Args:
+            path (str): bucket file path
+
+        Raises:
+            ValueError: raised if the file is not a bucket file
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError('File is too short to be a bucket file')
+
+        (magic, version, self.n_board, self.n_states, self.n_buckets, self.bins,
+         self.runouts, self.opponents, self.seed) = _HEADER.unpack(header)
+        if (magic != MAGIC) or (version != VERSION):
+            raise ValueError('Please pass a valid bucket file')
+
+        self._keys = None
+        self._buckets = None
+        self._centroids = None
+
+
+    @classmethod
+    def build(cls, path:str, n_board:int, n_states:int, n_buckets:int, bins:int = 8,
+              runouts:int = 16, opponents:int = 8, seed:int = 0) -> "BucketIndex":
+        """
+        Method to run the pipeline: sample canonical states, compute their equity
+        histograms, cluster the cumulative histograms (so nearby equities count as
+        close) into buckets and write the bucket file.
+
+        Args:
+            path (str): bucket file path to write
+            n_board (int): board cards, 3 for the flop or 4 for the turn
+            n_states (int): canonical states to precompute
+            n_buckets (int): buckets
+            bins (int, optional): histogram bins. Defaults to 8.
+            runouts (int, optional): board completions per state. Defaults to 16.
+            opponents (int, optional): opponent hands per completion. Defaults to 8.
+            seed (int, optional): seed of the pipeline. Defaults to 0.
+
+        Returns:
+            BucketIndex: index over the written file
+        """
+        keys = sample_states(n_board, n_states, seed)
+        histograms = equity_histograms(keys, n_board, bins, runouts, opponents, seed)
+        centroids, labels = kmeans(np.cumsum(histograms, axis=1), n_buckets, seed=seed)
+
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, n_board, len(keys), n_buckets, bins,
+                                    runouts, opponents, seed))
+            file.write(keys.astype('<i8').tobytes())
+            file.write(labels.astype('<u2').tobytes())
+            file.write(centroids.astype('<f4').tobytes())
+        return cls(path)
+
+
+    def bucket(self, hole:list, board:list) -> int:
+        """
+        Method to get the bucket of a hand state. States that were not precomputed
+        get the bucket with the nearest centroid to their equity histogram.
+
+        Args:
+            hole (list[Card]): hole cards
+            board (list[Card]): board cards
+
+        Returns:
+            int: bucket
+        """
+        if len(board) != self.n_board:
+            raise ValueError(f'Please pass a board of {self.n_board} cards')
+
+        key = canonical_key([card.card_id for card in hole], [card.card_id for card in board])
+        self._map()
+        position = int(np.searchsorted(self._keys, key))
+        if (position < self.n_states) and (self._keys[position] == key):
+            return int(self._buckets[position])
+        return int(self.bucket_of_keys(np.array([key]))[0])
+
+
+    def bucket_of_keys(self, keys:np.ndarray) -> np.ndarray:
+        """
+        Method to get the buckets of canonical keys
+
+        Args:
+            keys (np.ndarray): canonical keys, see canonical_keys()
+
+        Returns:
+            np.ndarray: bucket of each key
+        """
+        self._map()
+        keys = np.asarray(keys, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._keys, keys), self.n_states - 1)
+        found = self._keys[positions] == keys
+        buckets = np.where(found, self._buckets[positions], 0).astype(np.int64)
+        if not found.all():
+            # the missing states are measured the way the stored ones were, so the centroids fit them
+            histograms = equity_histograms(keys[~found], self.n_board, self.bins, self.runouts,
+                                           self.opponents, self.seed)
+            buckets[~found] = _sq_distances(np.cumsum(histograms, axis=1), self._centroids).argmin(axis=1)
+        return buckets
+
+
+    def _map(self) -> None:
+        """
+        Helper method to memory-map the arrays the first time they are needed
+        """
+        if self._keys is not None:
+            return
+
+        offset = _HEADER.size
+        self._keys = np.memmap(self.path, dtype='<i8', mode='r', offset=offset, shape=(self.n_states,))
+        offset += 8 * self.n_states
+        self._buckets = np.memmap(self.path, dtype='<u2', mode='r', offset=offset, shape=(self.n_states,))
+        offset += 2 * self.n_states
+        self._centroids = np.memmap(self.path, dtype='<f4', mode='r', offset=offset,
+                                    shape=(self.n_buckets, self.bins)).astype(np.float64)
+
+
+    def __len__(self) -> int:
+        return self.n_states
@@ -2,6 +2,18 @@
 This file defines the Card class that will represent a playing card. 
 """
 
+# rank and suit orders used for compact integer card ids (0-51)
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('club', 'diamond', 'heart', 'spade')
+
+_RANK_IDX = {rank: idx for idx, rank in enumerate(RANKS)}
+_SUIT_IDX = {suit: idx for idx, suit in enumerate(SUITS)}
+
+# lookup tables built once instead of on every call
+SUIT_SYMBOLS = {"heart": "\u2665", "spade": "\u2660", "diamond": "\u2666", "club": "\u2663"}
+_VALID_RANKS = frozenset(['A', 'J', 'Q', 'K'] + [str(x) for x in range(1, 11)])
+
+
 class Card:
     def __init__(self, rank:str, suit:str):
         """
@@ -28,14 +40,31 @@ class Card:
         Returns:
             str: _string representation of suit symbol
         """
-        suite_dict = {"heart":"\u2665",
-                      "spade":"\u2660",
-                      "diamond":"\u2666",
-                      "club":"\u2663"}
+        return SUIT_SYMBOLS[suit_str]
         
-        return suite_dict[suit_str]
         
         
+    @classmethod
+    def from_id(cls, card_id:int) -> "Card":
+        """
+        Method to make a card from its integer id.
+
+        Args:
+            card_id (int): card id in 0-51, see card_id
+
+        Returns:
+            Card: card with the id's rank and suit
+        """
+        return cls(RANKS[card_id // 4], SUITS[card_id % 4])
+    
+    
+    @property
+    def card_id(self) -> int:
+        """
+        Compact integer id of the card, rank index * 4 + suit index
+        """
+        return _RANK_IDX[self.rank] * 4 + _SUIT_IDX[self.suit]
+        
         
     @property
     def rank(self): 
@@ -47,10 +76,7 @@ class Card:
         if isinstance(value, str) is False:
             raise TypeError("Rank must be a string")
         
-        valid_ranks = ['A','J','Q','K']
-        valid_ranks.extend([str(x) for x in range(1,11)])
-        
-        if value not in valid_ranks: 
+        if value not in _VALID_RANKS: 
             raise ValueError("Please provide a valid playing card rank")
         
         self._rank = value
@@ -65,12 +91,10 @@ class Card:
         if isinstance(value, str) is False:
             raise TypeError("Suit must be a string")
         
-        try:
-            self._get_suit_symbol(value)
-        except:
+        if value not in SUIT_SYMBOLS:
             raise ValueError("Please provide a valid playing card suit")
         
         self._suit = value
         
     def __str__(self):
-        return f"{self.rank}{self._get_suit_symbol(self.suit)}"
\ No newline at end of file
+        return self._rank + SUIT_SYMBOLS[self._suit]
\ No newline at end of file
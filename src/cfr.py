@@ -0,0 +1,432 @@
+"""
+This file defines a counterfactual regret minimization (CFR+) solver for heads-up
+push/fold: the small blind either goes all in or folds, and the big blind either
+calls or folds. Hands are grouped into the 169 starting hand classes (pairs,
+suited and offsuit rank pairs), and regrets, strategies and all in equities are
+NumPy arrays over those classes, so every iteration is a few matrix products.
+
+Equities follow the game's showdown rules: hands are ranked by type only and ties split.
+"""
+
+import os
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .card import RANKS
+from .evaluator import mask_tables
+
+N_CLASSES = 169
+
+
+@lru_cache(maxsize=None)
+def _mask_arrays() -> tuple:
+    """
+    Helper function to get the evaluator's rank mask tables as arrays, made on first use
+
+    Returns:
+        tuple: (straight top rank, rank count) arrays over all 13 bit rank masks
+    """
+    straight_high, popcount = mask_tables()
+    return np.array(straight_high, dtype=np.int8), np.array(popcount, dtype=np.int8)
+
+
+def hand_class(card_a:int, card_b:int) -> int:
+    """
+    Function to get the starting hand class of two card ids. Pairs sit on the
+    diagonal of a 13 x 13 grid, suited hands above it and offsuit hands below it.
+
+    Args:
+        card_a (int): first card id
+        card_b (int): second card id
+
+    Returns:
+        int: class index in 0-168
+    """
+    rank_a = card_a >> 2
+    rank_b = card_b >> 2
+    high, low = (rank_a, rank_b) if rank_a >= rank_b else (rank_b, rank_a)
+    if (card_a & 3) == (card_b & 3):
+        return high * 13 + low
+    return low * 13 + high
+
+
+def class_name(idx:int) -> str:
+    """
+    Function to get the usual name of a hand class, e.g. 'AA', 'AKs' or '72o'
+
+    Args:
+        idx (int): class index
+
+    Returns:
+        str: class name
+    """
+    row, col = divmod(idx, 13)
+    if row == col:
+        return RANKS[row] * 2
+    if row > col:
+        return f'{RANKS[row]}{RANKS[col]}s'
+    return f'{RANKS[col]}{RANKS[row]}o'
+
+
+def _make_combos() -> tuple:
+    """
+    Helper function to list the 1326 two card combos with their classes
+
+    Returns:
+        tuple: (combos (1326, 2), class of each combo, combos of each class padded to 12)
+    """
+    combos = np.array([(a, b) for a in range(52) for b in range(a + 1, 52)], dtype=np.int64)
+    classes = np.array([hand_class(a, b) for a, b in combos], dtype=np.int64)
+    by_class = np.zeros((N_CLASSES, 12), dtype=np.int64)
+    counts = np.bincount(classes, minlength=N_CLASSES)
+    for idx in range(N_CLASSES):
+        members = np.flatnonzero(classes == idx)
+        by_class[idx, 0:len(members)] = members
+    return combos, classes, by_class, counts
+
+
+COMBOS, COMBO_CLASSES, _CLASS_COMBOS, CLASS_COMBO_COUNTS = _make_combos()
+
+
+def categories(cards:np.ndarray) -> np.ndarray:
+    """
+    Function to get the hand type of many hands at once, the same type as
+    evaluate() gives each row.
+
+    Args:
+        cards (np.ndarray): card ids, one hand of 5-7 cards per row
+
+    Returns:
+        np.ndarray: hand type index of each row
+    """
+    ranks = cards >> 2
+    suits = cards & 3
+    bits = np.left_shift(1, ranks)
+    counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1)
+    suit_masks = np.stack([np.bitwise_or.reduce(np.where(suits == suit, bits, 0), axis=1)
+                           for suit in range(4)], axis=1)
+    rank_mask = np.bitwise_or.reduce(bits, axis=1)
+    straight_table, popcount_table = _mask_arrays()
+
+    n_pairs = (counts == 2).sum(axis=1)
+    n_trips = (counts == 3).sum(axis=1)
+    suited_high = straight_table[suit_masks].max(axis=1)
+    conditions = [suited_high == 12,
+                  suited_high >= 0,
+                  (counts == 4).any(axis=1),
+                  (n_trips >= 2) | ((n_trips >= 1) & (n_pairs >= 1)),
+                  (popcount_table[suit_masks] >= 5).any(axis=1),
+                  straight_table[rank_mask] >= 0,
+                  n_trips >= 1,
+                  n_pairs >= 2,
+                  n_pairs == 1]
+    return np.select(conditions, [9, 8, 7, 6, 5, 4, 3, 2, 1], 0)
+
+
+def deal_weights() -> np.ndarray:
+    """
+    Function to count the ways each pair of hand classes can be dealt together,
+    leaving out combos that share a card (card removal).
+
+    Returns:
+        np.ndarray: (169, 169) combo pair counts
+    """
+    masks = np.left_shift(1, COMBOS).sum(axis=1)
+    compatible = (masks[:, None] & masks[None, :]) == 0
+    onehot = (COMBO_CLASSES[:, None] == np.arange(N_CLASSES)).astype(np.float64)
+    return onehot.T @ compatible.astype(np.float64) @ onehot
+
+
+def equity_matrix(samples:int = 200, seed:int = 0, path:str = None, chunk:int = 100_000) -> np.ndarray:
+    """
+    Function to estimate the all in equity of every hand class against every other,
+    by dealing samples random boards to random compatible combos of each class pair.
+
+    Args:
+        samples (int, optional): boards per class pair. Defaults to 200.
+        seed (int, optional): seed of the deals. Defaults to 0.
+        path (str, optional): .npy cache, loaded if it exists and written otherwise. Defaults to None.
+        chunk (int, optional): deals evaluated per batch. Defaults to 100000.
+
+    Returns:
+        np.ndarray: (169, 169) equity of the row class against the column class
+    """
+    if (path is not None) and os.path.exists(path):
+        return np.load(path)
+
+    rng = np.random.default_rng(seed)
+    pairs = np.array([(i, j) for i in range(N_CLASSES) for j in range(i + 1, N_CLASSES)], dtype=np.int64)
+    rows = np.repeat(pairs, samples, axis=0)
+    totals = np.zeros((N_CLASSES, N_CLASSES))
+
+    for start in range(0, len(rows), chunk):
+        class_a = rows[start:start + chunk, 0]
+        class_b = rows[start:start + chunk, 1]
+        holes = np.concatenate([_sample_combos(rng, class_a), _sample_combos(rng, class_b)], axis=1)
+
+        # redrawing the second hand wherever the two share a card
+        clash = _has_clash(holes)
+        while clash.any():
+            holes[clash, 2:4] = _sample_combos(rng, class_b[clash])
+            clash = _has_clash(holes)
+
+        # boards are the 5 smallest random keys among the cards not in either hand
+        keys = rng.random((len(holes), 52))
+        np.put_along_axis(keys, holes, 2.0, axis=1)
+        board = np.argpartition(keys, 5, axis=1)[:, 0:5]
+
+        type_a = categories(np.concatenate([holes[:, 0:2], board], axis=1))
+        type_b = categories(np.concatenate([holes[:, 2:4], board], axis=1))
+        result = (type_a > type_b) + 0.5 * (type_a == type_b)
+        np.add.at(totals, (class_a, class_b), result)
+
+    equities = totals / samples
+    upper = np.triu_indices(N_CLASSES, 1)
+    equities.T[upper] = 1 - equities[upper]
+    np.fill_diagonal(equities, 0.5)
+
+    if path is not None:
+        np.save(path, equities)
+    return equities
+
+
+def _sample_combos(rng:np.random.Generator, classes:np.ndarray) -> np.ndarray:
+    """
+    Helper function to draw a random combo of each class
+
+    Args:
+        rng (np.random.Generator): random generator
+        classes (np.ndarray): class of each row
+
+    Returns:
+        np.ndarray: (rows, 2) card ids
+    """
+    picks = (rng.random(len(classes)) * CLASS_COMBO_COUNTS[classes]).astype(np.int64)
+    return COMBOS[_CLASS_COMBOS[classes, picks]]
+
+
+def _has_clash(holes:np.ndarray) -> np.ndarray:
+    """
+    Helper function to find rows where the two hands share a card
+
+    Args:
+        holes (np.ndarray): (rows, 4) card ids of both hands
+
+    Returns:
+        np.ndarray: True for rows with a shared card
+    """
+    return (holes[:, 0:2, None] == holes[:, None, 2:4]).any(axis=(1, 2))
+
+
+
+class PushFoldTable:
+    def __init__(self, depths:np.ndarray, push:np.ndarray, call:np.ndarray):
+        """
+        This class holds solved push/fold strategies for a range of stack depths
+        and looks them up in constant time.
+
+        Args:
+            depths (np.ndarray): stack depths in big blinds, ascending
+            push (np.ndarray): (depths, 169) small blind push probability
+            call (np.ndarray): (depths, 169) big blind call probability
+        """
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.push = np.asarray(push, dtype=np.float64)
+        self.call = np.asarray(call, dtype=np.float64)
+
+        # nearest solved depth of every whole big blind up to the deepest one
+        steps = np.arange(int(np.ceil(self.depths[-1])) + 1)
+        self._nearest = np.abs(steps[:, None] - self.depths[None, :]).argmin(axis=1).tolist()
+        self._push_rows = self.push.tolist()
+        self._call_rows = self.call.tolist()
+
+
+    def push_probability(self, stack_bb:float, hand_idx:int) -> float:
+        """
+        Method to get how often the small blind should go all in
+
+        Args:
+            stack_bb (float): effective stack in big blinds
+            hand_idx (int): hand class, see hand_class()
+
+        Returns:
+            float: push probability
+        """
+        return self._push_rows[self._depth_idx(stack_bb)][hand_idx]
+
+
+    def call_probability(self, stack_bb:float, hand_idx:int) -> float:
+        """
+        Method to get how often the big blind should call an all in
+
+        Args:
+            stack_bb (float): effective stack in big blinds
+            hand_idx (int): hand class, see hand_class()
+
+        Returns:
+            float: call probability
+        """
+        return self._call_rows[self._depth_idx(stack_bb)][hand_idx]
+
+
+    def save(self, path:str) -> None:
+        """
+        Method to save the table to a .npz file
+
+        Args:
+            path (str): file path
+        """
+        np.savez(path, depths=self.depths, push=self.push, call=self.call)
+
+
+    @classmethod
+    def load(cls, path:str) -> "PushFoldTable":
+        """
+        Method to load a table saved with save()
+
+        Args:
+            path (str): file path
+
+        Returns:
+            PushFoldTable: loaded table
+        """
+        with np.load(path) as data:
+            return cls(data['depths'], data['push'], data['call'])
+
+
+    def _depth_idx(self, stack_bb:float) -> int:
+        """
+        Helper method to get the row of the nearest solved depth
+        """
+        step = min(max(int(stack_bb + 0.5), 0), len(self._nearest) - 1)
+        return self._nearest[step]
+
+
+
+class PushFoldSolution(NamedTuple):
+    depth: float
+    push: np.ndarray
+    call: np.ndarray
+    iterations: int
+
+
+
+class PushFoldSolver:
+    def __init__(self, equities:np.ndarray = None, weights:np.ndarray = None, small_blind:float = 0.5):
+        """
+        This class solves heads-up push/fold with CFR+. Amounts are in big blinds
+        and the stack depth is each player's stack before posting the blinds.
+
+        Args:
+            equities (np.ndarray, optional): (169, 169) all in equities, see equity_matrix().
+                Defaults to None, estimated with the default samples.
+            weights (np.ndarray, optional): (169, 169) deal weights, see deal_weights().
+                Defaults to None, counted.
+            small_blind (float, optional): small blind in big blinds. Defaults to 0.5.
+        """
+        self.equities = equities if equities is not None else equity_matrix()
+        weights = weights if weights is not None else deal_weights()
+        self.joint = weights / weights.sum()
+        self.small_blind = small_blind
+
+
+    def payoffs(self, depth:float) -> tuple:
+        """
+        Method to get the small blind's payoff of each line against each class pair
+
+        Args:
+            depth (float): stack depth in big blinds
+
+        Returns:
+            tuple: (payoff when called (169, 169), payoff when the big blind folds,
+                payoff of folding)
+        """
+        return 2 * depth * self.equities - depth, 1.0, -self.small_blind
+
+
+    def solve(self, depth:float, iterations:int = 2000) -> PushFoldSolution:
+        """
+        Method to run CFR+ with alternating updates and linearly weighted averages
+        at one stack depth.
+
+        Args:
+            depth (float): stack depth in big blinds
+            iterations (int, optional): CFR iterations. Defaults to 2000.
+
+        Returns:
+            PushFoldSolution: average push and call probabilities of each class
+        """
+        called, stolen, folded = self.payoffs(depth)
+        joint_called = self.joint * called
+        # chance reach of each class, the counterfactual value of folding is fixed
+        reach_sb = self.joint.sum(axis=1)
+        reach_bb = self.joint
+
+        regrets_sb = np.zeros((N_CLASSES, 2))
+        regrets_bb = np.zeros((N_CLASSES, 2))
+        average_push = np.zeros(N_CLASSES)
+        average_call = np.zeros(N_CLASSES)
+        total_weight = 0.0
+        call = np.full(N_CLASSES, 0.5)
+
+        for iteration in range(1, iterations + 1):
+            # small blind: push or fold against the big blind's current calls
+            push = _regret_match(regrets_sb)
+            value_push = joint_called @ call + stolen * (reach_bb @ (1 - call))
+            value_fold = folded * reach_sb
+            value = push * value_push + (1 - push) * value_fold
+            regrets_sb[:, 0] = np.maximum(regrets_sb[:, 0] + value_push - value, 0)
+            regrets_sb[:, 1] = np.maximum(regrets_sb[:, 1] + value_fold - value, 0)
+            push = _regret_match(regrets_sb)
+
+            # big blind: call or fold against the updated pushes
+            call = _regret_match(regrets_bb)
+            value_call = -(push @ joint_called)
+            value_fold_bb = -stolen * (push @ reach_bb)
+            value = call * value_call + (1 - call) * value_fold_bb
+            regrets_bb[:, 0] = np.maximum(regrets_bb[:, 0] + value_call - value, 0)
+            regrets_bb[:, 1] = np.maximum(regrets_bb[:, 1] + value_fold_bb - value, 0)
+            call = _regret_match(regrets_bb)
+
+            average_push += iteration * push
+            average_call += iteration * call
+            total_weight += iteration
+
+        return PushFoldSolution(depth, average_push / total_weight, average_call / total_weight, iterations)
+
+
+    def solve_table(self, depths:list[float], iterations:int = 2000) -> PushFoldTable:
+        """
+        Method to solve a range of stack depths into a lookup table
+
+        Args:
+            depths (list[float]): stack depths in big blinds
+            iterations (int, optional): CFR iterations per depth. Defaults to 2000.
+
+        Returns:
+            PushFoldTable: strategies of every depth
+        """
+        depths = sorted(depths)
+        solutions = [self.solve(depth, iterations) for depth in depths]
+        return PushFoldTable(np.array(depths),
+                             np.stack([solution.push for solution in solutions]),
+                             np.stack([solution.call for solution in solutions]))
+
+
+
+def _regret_match(regrets:np.ndarray) -> np.ndarray:
+    """
+    Helper function to turn (classes, 2) positive regrets into the probability of
+    the first action, playing both evenly where no action has regret
+
+    Args:
+        regrets (np.ndarray): regrets of (first action, second action)
+
+    Returns:
+        np.ndarray: probability of the first action per class
+    """
+    total = regrets.sum(axis=1)
+    return np.divide(regrets[:, 0], total, out=np.full(len(regrets), 0.5), where=total > 0)
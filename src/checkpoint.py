@@ -0,0 +1,162 @@
+"""
+This file defines the Checkpointer, which periodically saves a Dealer's game state
+to a compact file so a long game can be resumed with Dealer.resume()
+"""
+
+import os
+import pickle
+import queue
+import threading
+import zlib
+
+CHECKPOINT_VERSION = 2
+
+
+class Checkpointer:
+    def __init__(self, path:str, every:int = 100, background:bool = True):
+        """
+        This class saves the Dealer state every few rounds. The state is pickled in
+        the game thread (a few players and the RNG state, so it is cheap), then
+        compressed and written by a background thread to a temporary file that
+        atomically replaces the checkpoint, so a crash never leaves a torn file.
+        If rounds finish faster than the disk, only the newest pending state is kept.
+
+        Args:
+            path (str): checkpoint file path
+            every (int, optional): rounds between checkpoints. Defaults to 100.
+            background (bool, optional): write from a background thread. Defaults to True.
+        """
+        self.path = str(path)
+        self.every = every
+        self.background = background
+        self.saved = 0
+        self._pending = queue.Queue(maxsize=1)
+        self._error = None
+        self._writer = None
+        if background is True:
+            self._writer = threading.Thread(target=self._write_loop, name='Checkpointer', daemon=True)
+            self._writer.start()
+
+
+    def maybe_save(self, dealer) -> None:
+        """
+        Method called by the Dealer between rounds, saves every `every` rounds.
+
+        Args:
+            dealer (Dealer): dealer to checkpoint
+        """
+        if dealer._round_idx % self.every == 0:
+            self.save(dealer)
+
+
+    def save(self, dealer) -> None:
+        """
+        Method to checkpoint a dealer now.
+
+        Args:
+            dealer (Dealer): dealer to checkpoint
+        """
+        self._raise_writer_error()
+        data = pickle.dumps(dealer.checkpoint_state(), protocol=pickle.HIGHEST_PROTOCOL)
+        if self.background is False:
+            self._write(data)
+            return
+
+        # newest state wins over one still waiting to be written
+        while True:
+            try:
+                self._pending.put_nowait(data)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                    self._pending.task_done()
+                except queue.Empty:
+                    pass
+
+
+    def _write(self, data:bytes) -> None:
+        """
+        Helper method to compress and atomically write a pickled state
+
+        Args:
+            data (bytes): pickled checkpoint state
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(zlib.compress(data))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self.saved += 1
+
+
+    def _write_loop(self) -> None:
+        """
+        Writer thread loop
+        """
+        while True:
+            data = self._pending.get()
+            try:
+                if data is None:
+                    return
+                self._write(data)
+            except Exception as error:
+                # any error is kept for the caller, the thread keeps draining the queue so flush() returns
+                self._error = error
+            finally:
+                self._pending.task_done()
+
+
+    def _raise_writer_error(self) -> None:
+        """
+        Helper method to surface an error raised in the writer thread
+
+        Raises:
+            RuntimeError: raised if a checkpoint failed to write
+        """
+        if self._error is not None:
+            raise RuntimeError(f'Writing checkpoint {self.path} failed') from self._error
+
+
+    def flush(self) -> None:
+        """
+        Method to wait until the newest checkpoint is on disk
+        """
+        if self._writer is not None:
+            self._pending.join()
+        self._raise_writer_error()
+
+
+    def close(self) -> None:
+        """
+        Method to write the pending checkpoint and stop the writer thread
+        """
+        self.flush()
+        if self._writer is not None:
+            self._pending.put(None)
+            self._writer.join()
+            self._writer = None
+
+
+
+def load_checkpoint(path:str) -> dict:
+    """
+    Function to read a checkpoint file.
+
+    Args:
+        path (str): checkpoint file path
+
+    Raises:
+        ValueError: raised if the checkpoint was written by another format version
+
+    Returns:
+        dict: checkpoint state, see Dealer.checkpoint_state()
+    """
+    with open(path, 'rb') as file:
+        state = pickle.loads(zlib.decompress(file.read()))
+
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError('Please pass a checkpoint written by this version of the game')
+
+    return state
@@ -0,0 +1,213 @@
+"""
+This file defines a table driven codec between card ids and card text, in the
+compact two character form ("Ah Kd", "Tc" for ten) and in the Unicode suit form
+printed by Card ("A♥ K♦", "10♣"), with a bulk path that parses text files of
+hands straight into card id arrays.
+"""
+
+import re
+
+import numpy as np
+
+from .card import Card, RANKS, SUITS, SUIT_SYMBOLS
+from .hand import Hand
+
+NO_CARD = 255
+
+RANK_CHARS = '23456789TJQKA'
+SUIT_CHARS = 'cdhs'
+
+# card id -> text, in both forms
+CARD_TEXT = tuple(rank + suit for rank in RANK_CHARS for suit in SUIT_CHARS)
+CARD_SYMBOLS = tuple(rank + SUIT_SYMBOLS[suit] for rank in RANKS for suit in SUITS)
+
+# text -> card id, every spelling of every card
+_CARD_IDS = {}
+for _card_id, (_rank_char, _suit_char) in enumerate(CARD_TEXT):
+    _rank_idx, _suit_idx = divmod(_card_id, 4)
+    for _rank in {_rank_char, _rank_char.lower(), RANKS[_rank_idx]}:
+        for _suit in {_suit_char, _suit_char.upper(), SUIT_SYMBOLS[SUITS[_suit_idx]]}:
+            _CARD_IDS[_rank + _suit] = _card_id
+
+_TOKEN_PATTERN = re.compile('(?:10|[2-9TJQKAtjqka])[cdhsCDHS♣♦♥♠]')
+
+# byte -> rank or suit index for the bulk path, unicode suits and '10' are rewritten to one byte first
+_RANK_BYTES = np.full(256, NO_CARD, dtype=np.uint8)
+_SUIT_BYTES = np.full(256, NO_CARD, dtype=np.uint8)
+for _idx, _char in enumerate(RANK_CHARS):
+    _RANK_BYTES[ord(_char)] = _RANK_BYTES[ord(_char.lower())] = _idx
+for _idx, _char in enumerate(SUIT_CHARS):
+    _SUIT_BYTES[ord(_char)] = _SUIT_BYTES[ord(_char.upper())] = _idx
+_BYTE_REWRITES = [('10'.encode(), b'T')] + [(SUIT_SYMBOLS[suit].encode(), char.encode())
+                                            for suit, char in zip(SUITS, SUIT_CHARS)]
+_SEPARATORS = b' \t\r,;[]\'"|'
+# byte -> True for separators and line ends, cards are the runs of other bytes
+_SEPARATOR_BYTES = np.zeros(256, dtype=bool)
+_SEPARATOR_BYTES[list(_SEPARATORS + b'\n')] = True
+
+
+def parse_card(text:str) -> int:
+    """
+    Function to get the id of a card written as text
+
+    Args:
+        text (str): card, e.g. 'Ah', 'th', '10h' or 'A♥'
+
+    Raises:
+        ValueError: raised if the text is not a card
+
+    Returns:
+        int: card id, see Card.card_id
+    """
+    card_id = _CARD_IDS.get(text)
+    if card_id is None:
+        raise ValueError(f'{text!r} is not a valid card')
+    return card_id
+
+
+def parse_cards(text:str) -> list[int]:
+    """
+    Function to get the ids of cards written with or without separators, e.g.
+    'Ah Kd', 'AhKd', "['A♥', '10♦']"
+
+    Args:
+        text (str): cards
+
+    Raises:
+        ValueError: raised if anything other than cards and separators is in the text
+
+    Returns:
+        list[int]: card ids in order
+    """
+    tokens = _TOKEN_PATTERN.findall(text)
+    if len(_TOKEN_PATTERN.sub('', text).strip(_SEPARATORS.decode() + '\n')) > 0:
+        raise ValueError(f'{text!r} is not a list of cards')
+    return [_CARD_IDS[token] for token in tokens]
+
+
+def format_card(card_id:int, symbols:bool = False) -> str:
+    """
+    Function to write a card id as text
+
+    Args:
+        card_id (int): card id
+        symbols (bool, optional): use the Unicode suit form Card prints. Defaults to False.
+
+    Returns:
+        str: card text
+    """
+    return CARD_SYMBOLS[card_id] if symbols else CARD_TEXT[card_id]
+
+
+def format_cards(card_ids, symbols:bool = False, sep:str = ' ') -> str:
+    """
+    Function to write card ids as text
+
+    Args:
+        card_ids (iterable[int]): card ids
+        symbols (bool, optional): use the Unicode suit form Card prints. Defaults to False.
+        sep (str, optional): separator. Defaults to ' '.
+
+    Returns:
+        str: cards text
+    """
+    table = CARD_SYMBOLS if symbols else CARD_TEXT
+    return sep.join([table[card_id] for card_id in card_ids])
+
+
+def parse_hand(text:str) -> Hand:
+    """
+    Function to make a Hand from cards written as text
+
+    Args:
+        text (str): cards, see parse_cards()
+
+    Returns:
+        Hand: hand of new Card objects
+    """
+    return Hand([Card.from_id(card_id) for card_id in parse_cards(text)])
+
+
+def parse_lines(data:bytes, first_line:int = 1) -> np.ndarray:
+    """
+    Function to parse text with one hand or board per line into card ids, without
+    making an object per card: the text is normalized to two bytes per card with
+    bytes.replace() and bytes.translate(), then mapped through byte tables. Cards
+    are read as parse_cards() reads them, a rank and its suit cannot be split.
+
+    Args:
+        data (bytes): UTF-8 text
+        first_line (int, optional): line number of the first line, for errors. Defaults to 1.
+
+    Raises:
+        ValueError: raised if a line holds anything other than cards and separators, with
+            its line number counted from first_line
+
+    Returns:
+        np.ndarray: (non-empty lines, most cards on a line) uint8 card ids, short
+            lines padded with NO_CARD
+    """
+    for old, new in _BYTE_REWRITES:
+        data = data.replace(old, new)
+    # a run of card bytes of odd length has a rank or suit split from its card, e.g. 'A h'
+    is_card = ~_SEPARATOR_BYTES[np.frombuffer(data, dtype=np.uint8)]
+    edges = np.flatnonzero(np.diff(is_card, prepend=False, append=False))
+    odd = np.flatnonzero((edges[1::2] - edges[0::2]) % 2)
+    if len(odd) > 0:
+        line = first_line + data.count(b'\n', 0, int(edges[2 * odd[0]]))
+        raise ValueError(f'Line {line} is not a list of cards')
+
+    all_lines = data.translate(None, _SEPARATORS).split(b'\n')
+    # line numbers of the input for the errors
+    numbers = [first_line + idx for idx, line in enumerate(all_lines) if line]
+    lines = [line for line in all_lines if line]
+    if len(lines) == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    lengths = np.fromiter((len(line) for line in lines), dtype=np.int64, count=len(lines))
+
+    width = int(lengths.max())
+    if (lengths == width).all():
+        chars = np.frombuffer(b''.join(lines), dtype=np.uint8).reshape(len(lines), width)
+    else:
+        chars = np.zeros((len(lines), width), dtype=np.uint8)
+        for idx, line in enumerate(lines):
+            chars[idx, 0:len(line)] = np.frombuffer(line, dtype=np.uint8)
+
+    ranks = _RANK_BYTES[chars[:, 0::2]]
+    suits = _SUIT_BYTES[chars[:, 1::2]]
+    padding = chars[:, 0::2] == 0
+    bad = ((ranks == NO_CARD) | (suits == NO_CARD)) & ~padding
+    if bad.any():
+        raise ValueError(f'Line {numbers[int(np.argmax(bad.any(axis=1)))]} is not a list of cards')
+    return np.where(padding, NO_CARD, ranks * 4 + suits).astype(np.uint8)
+
+
+def parse_file(path:str, chunk_size:int = 1 << 22):
+    """
+    Function to parse a text file of hands in chunks of whole lines, see parse_lines(),
+    so memory stays bounded whatever the file size
+
+    Args:
+        path (str): text file path
+        chunk_size (int, optional): bytes read at a time. Defaults to 4 MiB.
+
+    Yields:
+        np.ndarray: card ids of the lines of each chunk
+    """
+    with open(path, 'rb') as file:
+        rest = b''
+        # line number of the first line of the next chunk, so errors give the file's line
+        line = 1
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            end = chunk.rfind(b'\n') + 1
+            rest = chunk[end:]
+            if end > 0:
+                yield parse_lines(chunk[0:end], line)
+                line += chunk.count(b'\n', 0, end)
+        if rest:
+            yield parse_lines(rest, line)
@@ -8,6 +8,9 @@ from .player import Player
 from .round import GameRound
 from .hand import Hand
 from .gui import TexasHoldemDisplay
+from .checkpoint import load_checkpoint, CHECKPOINT_VERSION
+from .seats import MIN_SEATS, MAX_SEATS
+from .tournament import BlindSchedule, icm_equities
 
 
 
@@ -15,20 +18,115 @@ import random as rd
 
 
 class Dealer:
-    def __init__(self, players:list[Player]):
+    def __init__(self, 
+                 players:list[Player], 
+                 threaded_display:bool = False, 
+                 show_display:bool = True,
+                 recorders:list = None,
+                 verbose:bool = True,
+                 checkpointer = None,
+                 resume_state:dict = None,
+                 equity_runouts:bool = False,
+                 schedule:BlindSchedule = None):
         """
         This class  defines the dealer class that bridges the game logic in
         GameRound and visualization aspects in GUI.
 
         Args:
-            players (list[Player]): List of players
+            players (list[Player]): List of 2-10 players
+            threaded_display (bool, optional): render from a separate thread so the game
+                never waits on the window. Defaults to False.
+            show_display (bool, optional): open the pygame window, set False to run the 
+                game headless without importing pygame. Defaults to True.
+            recorders (list[HandRecorder], optional): recorders passed to every GameRound,
+                e.g. a HandHistoryWriter. Defaults to None.
+            verbose (bool, optional): print table talk to the terminal. Defaults to True.
+            checkpointer (Checkpointer, optional): saves the game state between rounds. Defaults to None.
+            resume_state (dict, optional): checkpoint state to continue from instead of seating
+                the players, see Dealer.resume(). Defaults to None.
+            equity_runouts (bool, optional): settle hands with no betting left by exact equity
+                instead of dealing the rest of the board, see GameRound. Defaults to False.
+            schedule (BlindSchedule, optional): blind levels and antes by hands or time played.
+                Defaults to None, blinds start at 2/4 and go up by 2 every hand.
         """
-        self.display = TexasHoldemDisplay()
+        if (len(players) < MIN_SEATS) or (len(players) > MAX_SEATS):
+            raise ValueError(f'Please pass between {MIN_SEATS} and {MAX_SEATS} players')
+        
+        self.display = None
+        if show_display is True:
+            self.display = TexasHoldemDisplay(threaded=threaded_display)
         self._players = players
+        self.recorders = recorders if recorders is not None else []
+        self.verbose = verbose
+        self.checkpointer = checkpointer
+        self.equity_runouts = equity_runouts
+        self.schedule = schedule
+        self.eliminated = []
         self.phase = 'not_started'
         self.game_state = None    
-        self._set_up_game()
-        self._run_game()
+        self._round = None
+        self._round_idx = 0
+        self._small_blind = 2
+        self._big_blind = 4
+        # blinds and ante players were checked against, the next hand is played at them
+        self._next_blinds = None
+        self._elapsed_offset = 0.0
+        self._clock_start = time.monotonic()
+        if resume_state is None:
+            self._set_up_game()
+        else:
+            self._restore_game(resume_state)
+        self._start_display()
+        try:
+            for recorder in self.recorders:
+                recorder.begin_game(self)
+            self._run_game()
+            for recorder in self.recorders:
+                recorder.end_game(self)
+        finally:
+            self._stop_display()
+            if self.checkpointer is not None:
+                self.checkpointer.flush()
+                
+                
+    @classmethod
+    def resume(cls, path:str, **kwargs) -> "Dealer":
+        """
+        Method to continue a game from a checkpoint file. The game continues exactly
+        as the checkpointed game would have from that round on.
+
+        Args:
+            path (str): checkpoint file written by a Checkpointer
+            **kwargs: other Dealer arguments (display, recorders, checkpointer, ...)
+
+        Returns:
+            Dealer: dealer that has played the rest of the game
+        """
+        state = load_checkpoint(path)
+        return cls(state['players'], resume_state=state, **kwargs)
+    
+    
+    def checkpoint_state(self) -> dict:
+        """
+        Method to get everything needed to continue the game from the next round:
+        seat order and players (banks, strategies), eliminated players, blind level,
+        round index, time played and the state of the random module, which drives
+        seating, decks and strategies.
+
+        Returns:
+            dict: checkpoint state
+        """
+        return {
+            'version': CHECKPOINT_VERSION,
+            'players': self._players,
+            'round_idx': self._round_idx,
+            'small_blind': self._small_blind,
+            'big_blind': self._big_blind,
+            'eliminated': self.eliminated,
+            'next_blinds': self._next_blinds,
+            'elapsed': self._elapsed(),
+            'rng_state': rd.getstate(),
+        }
         
         
     def _set_up_game(self) -> None:
@@ -40,25 +138,53 @@ class Dealer:
         self._make_players_active()
         
         
+    def _restore_game(self, state:dict) -> None:
+        """
+        Pipeline to set up a game from a checkpoint state instead of seating players
+
+        Args:
+            state (dict): checkpoint state from checkpoint_state()
+        """
+        self._round_idx = state['round_idx']
+        self._small_blind = state['small_blind']
+        self._big_blind = state['big_blind']
+        self.eliminated = state.get('eliminated', [])
+        self._next_blinds = state.get('next_blinds')
+        self._elapsed_offset = state.get('elapsed', 0.0)
+        rd.setstate(state['rng_state'])
+        self._make_player_hands()
+        self._make_players_active()
+        
+        
     def _run_game(self) -> None:
         """
         This method manages the between round logic and bridges the visualization and game progression
         """ 
-        idx = 0
         game_flag = True
-        small_blind = 2
-        big_blind = 4
         
         # setting game flag
         while game_flag:
             
             # if only one player, they are winner
             if len(self._players) == 1:
-                print(f"Player {self._players[0].id} wins the game!")
+                if self.verbose is True:
+                    print(f"Player {self._players[0].id} wins the game!")
                 break
             
+            # everyone left was eliminated on the same round
+            if len(self._players) == 0:
+                if self.verbose is True:
+                    print("No players left, the game is a draw.")
+                break
+            
+            # saving state between rounds
+            if self.checkpointer is not None:
+                self.checkpointer.maybe_save(self)
             
             # finding blind idx
+            idx = self._round_idx
+            # a time based level can go up after the eliminations, the hand keeps the level they used
+            small_blind, big_blind, ante = self._next_blinds if self._next_blinds is not None else self._blinds()
             small_blind_player = self._players[(idx % len(self._players))]
             big_blind_player = self._players[((idx+1) % len(self._players))]
  
@@ -67,16 +193,24 @@ class Dealer:
             self._assign_blinds(small_blind_player, big_blind_player)
             
             # running game round
-            round = GameRound(self._players, small_blind, big_blind)
+            # reusing one round object for the whole game
+            round = self._round
+            if round is None:
+                round = GameRound(self._players, small_blind, big_blind, self.recorders, self.verbose,
+                                  self.equity_runouts, ante)
+                self._round = round
+            else:
+                round.reset(self._players, small_blind, big_blind, ante)
             while self.phase != 'exit':
                 self._advance_phase(round)
-                if self.phase != 'round_start':
+                if (self.phase != 'round_start') and (self.display is not None):
                     self.display.run(self.game_state)
                 else: 
                     continue
                 
             # sleeping so user can see result
-            time.sleep(5)
+            if self.display is not None:
+                time.sleep(5)
                             
               
             # resetting blinds
@@ -84,14 +218,16 @@ class Dealer:
             small_blind_player.blind = None
             
             # incrementing for next iteration
-            small_blind = small_blind + 2
-            big_blind = big_blind + 2
-            idx = idx + 1
+            self._small_blind = small_blind + 2
+            self._big_blind = big_blind + 2
+            self._round_idx = idx + 1
             
-            # cleaning up round
+            # cleaning up round, players who cannot pay the next hand's big blind and ante are out
+            self._next_blinds = self._blinds()
+            _, next_big_blind, next_ante = self._next_blinds
             self._make_player_hands()
             self._reset_action_str()
-            self._elim_players(big_blind)
+            self._elim_players(next_big_blind + next_ante)
             self._reset_game_state()
             self._make_players_active()
             
@@ -146,9 +282,30 @@ class Dealer:
             
         elif self.phase == 'exit':
             return
+        
+        # after a betting round with nobody left to bet, the rest of the hand is run out at once
+        if (self.phase in ('flop', 'turn', 'river', 'round_finish')) and (round.betting_closed() is True):
+            self.game_state = round.run_out()
+            self.phase = 'exit'
             
      
         
+    def _start_display(self) -> None:
+        """
+        Helper method to start the display render thread if there is one
+        """
+        if self.display is not None:
+            self.display.start()
+            
+            
+    def _stop_display(self) -> None:
+        """
+        Helper method to stop the display render thread if there is one
+        """
+        if self.display is not None:
+            self.display.stop()
+            
+            
     def _seat_players(self) -> None:
         """
         Helper method to seat players randomly.
@@ -159,11 +316,14 @@ class Dealer:
     
     def _make_player_hands(self) -> None: 
         """
-        Helper method to make player hand instances
+        Helper method to make player hand instances, hands from the last round are emptied and reused
         """
         
         for player in self._players:
-            player.hand = Hand([])
+            if player.hand is None:
+                player.hand = Hand([])
+            else:
+                player.hand.clear()
             
     def _make_players_active(self) -> None: 
         """
@@ -188,7 +348,12 @@ class Dealer:
         Args:
             elim_blind (int): elimination threshold
         """
-        self._players = [player for player in self._players if player.bank > elim_blind]
+        # only making a new list when someone is out so the round keeps its seat map
+        if any(player.bank <= elim_blind for player in self._players):
+            # players out on the same hand are placed by their banks
+            out = [player for player in self._players if player.bank <= elim_blind]
+            self.eliminated.extend(sorted(out, key=lambda player: player.bank))
+            self._players = [player for player in self._players if player.bank > elim_blind]
             
         
     def _reset_action_str(self) -> None: 
@@ -199,6 +364,26 @@ class Dealer:
             player._clear_action()
             
             
+    def _blinds(self) -> tuple:
+        """
+        Helper method to get the blinds and ante of the next hand
+
+        Returns:
+            tuple: (small blind, big blind, ante)
+        """
+        if self.schedule is None:
+            return self._small_blind, self._big_blind, 0
+        level = self.schedule.level(self._round_idx, self._elapsed())
+        return level.small_blind, level.big_blind, level.ante
+    
+    
+    def _elapsed(self) -> float:
+        """
+        Helper method to get the seconds played, including before a resume
+        """
+        return self._elapsed_offset + time.monotonic() - self._clock_start
+            
+            
     @staticmethod
     def _assign_blinds(small_player:Player, large_player:Player) -> None:
         """
@@ -210,6 +395,35 @@ class Dealer:
             
 
     
+    @property
+    def standings(self) -> list[Player]:
+        """
+        Players best first: the players still seated by bank, then the eliminated
+        players from the last one out to the first
+        """
+        seated = sorted(self._players, key=lambda player: player.bank, reverse=True)
+        return seated + self.eliminated[::-1]
+    
+    
+    def prize_equities(self, payouts:list[float]) -> dict:
+        """
+        Method to get each player's expected prize: ICM equities for the players
+        still seated and the prize of their place for the eliminated players
+
+        Args:
+            payouts (list[float]): prize of each place, first place first
+
+        Returns:
+            dict: player id -> expected prize
+        """
+        n_seated = len(self._players)
+        equities = icm_equities([player.bank for player in self._players], payouts[0:n_seated])
+        prizes = {player.id: equity for player, equity in zip(self._players, equities)}
+        for place, player in enumerate(self.eliminated[::-1], start=n_seated):
+            prizes[player.id] = payouts[place] if place < len(payouts) else 0
+        return prizes
+    
+    
     @property
     def players(self):
         return self._players
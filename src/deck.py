@@ -6,11 +6,22 @@ import random as rd
 from .card import Card
 
 class Deck:
-    def __init__(self):
+    def __init__(self, rng:rd.Random = None, ranks:list[str] = None):
         """
         This class represent the deck of card that will be used
-        when playing the game.
+        when playing the game. The 52 cards are made once and reused
+        every time the deck is reset.
+
+        Args:
+            rng (random.Random, optional): random generator used to shuffle, seeding it
+                replays the same deals. Defaults to None, the random module.
+            ranks (list[str], optional): ranks in the deck, e.g. 6 to A for the 36 card
+                short deck. Defaults to None, every rank.
         """
+        self.rng = rng
+        self.ranks = ranks
+        self._all_cards = self._make_cards()
+        self.cards = []
         self.reset()
     
     def draw(self) -> tuple:
@@ -23,13 +34,14 @@ class Deck:
         """
         Randomizes deck
         """
-        rd.shuffle(self.cards)
+        rng = self.rng if self.rng is not None else rd
+        rng.shuffle(self.cards)
     
     def reset(self):
         """
-        Reset deck to un-shuffled start.
+        Reset deck to un-shuffled start, reusing the deck's cards.
         """
-        self.cards = self._make_cards()
+        self.cards[:] = self._all_cards
     
     def _make_cards(self):
         """
@@ -45,7 +57,8 @@ class Deck:
         # making cards
         for suit in ['diamond', 'spade', 'club', 'heart']:
             for rank in ranks:
-                deck_cards.append(Card(rank, suit))
+                if (self.ranks is None) or (rank in self.ranks):
+                    deck_cards.append(Card(rank, suit))
         
         return deck_cards
     
@@ -0,0 +1,131 @@
+"""
+This file defines pot splitting with side pots and exact runout equity, used to
+settle a hand once nobody is left who can bet.
+"""
+
+import random as rd
+
+from itertools import combinations
+from math import comb
+
+from .evaluator import evaluate, CATEGORY_SHIFT
+from .variants import Variant
+
+
+def split_pot(contributions:list[int], ranks:list, exact:bool = False) -> tuple:
+    """
+    Function to split a pot into a main pot and side pots. Each pot is the chips
+    every player put in up to a contribution level, and goes to the best ranked
+    players among those still in who put in at least that much.
+
+    Args:
+        contributions (list[int]): chips put in by each seat this hand
+        ranks (list): hand rank of each seat, None for seats that folded
+        exact (bool, optional): split pots into fractions instead of whole chips. Defaults to False.
+
+    Returns:
+        tuple: (payout of each seat, set of seats that won a pot)
+    """
+    payouts = [0] * len(contributions)
+    winners = set()
+    contenders = [seat for seat, rank in enumerate(ranks) if rank is not None]
+    levels = sorted({contributions[seat] for seat in contenders})
+
+    previous = 0
+    for level_idx, level in enumerate(levels):
+        # the last pot also takes what folded players put in above every level
+        if level_idx == len(levels) - 1:
+            pot = sum(max(amount - previous, 0) for amount in contributions)
+        else:
+            pot = sum(min(amount, level) - min(amount, previous) for amount in contributions)
+
+        eligible = [seat for seat in contenders if contributions[seat] >= level]
+        best = max(ranks[seat] for seat in eligible)
+        pot_winners = [seat for seat in eligible if ranks[seat] == best]
+        if exact is True:
+            for seat in pot_winners:
+                payouts[seat] += pot / len(pot_winners)
+        else:
+            # odd chips go to the first winners in seat order
+            share, odd = divmod(pot, len(pot_winners))
+            for idx, seat in enumerate(pot_winners):
+                payouts[seat] += share + (idx < odd)
+        winners.update(pot_winners)
+        previous = level
+
+    return payouts, winners
+
+
+def expected_payouts(holes:list, board:list[int], unseen:list[int], contributions:list[int],
+                     max_runouts:int = 20000, variant:Variant = None, rng:rd.Random = None) -> list[float]:
+    """
+    Function to get each seat's expected share of the pot over every way the board
+    can be completed. Boards are enumerated exactly when there are at most
+    max_runouts of them, otherwise max_runouts boards are sampled.
+
+    Hands are ranked by hand type only, the same way WinnerFinder settles a showdown.
+
+    Args:
+        holes (list): hole card ids of each seat, None for seats that folded
+        board (list[int]): card ids already on the board
+        unseen (list[int]): card ids the rest of the board can be dealt from
+        contributions (list[int]): chips put in by each seat this hand
+        max_runouts (int, optional): most boards to evaluate. Defaults to 20000.
+        variant (Variant, optional): variant the hands are ranked by. Defaults to None, Hold'em.
+        rng (random.Random, optional): random generator boards are sampled with, pass the
+            game's so settling does not draw from the random module. Defaults to None, the
+            random module.
+
+    Returns:
+        list[float]: expected payout of each seat, summing to the pot
+    """
+    n_cards = 5 - len(board)
+    n_runouts = comb(len(unseen), n_cards)
+    if n_runouts <= max_runouts:
+        runouts = combinations(unseen, n_cards)
+    else:
+        n_runouts = max_runouts
+        rng = rng if rng is not None else rd
+        runouts = (rng.sample(unseen, n_cards) for _ in range(max_runouts))
+
+    contenders = [(seat, list(hole) + list(board)) for seat, hole in enumerate(holes) if hole is not None]
+    ranks = [None] * len(holes)
+    totals = [0.0] * len(holes)
+    # the split only depends on the ranks, so it is worked out once per ranking
+    splits = {}
+    for runout in runouts:
+        if variant is None:
+            for seat, cards in contenders:
+                ranks[seat] = evaluate(cards + list(runout)) >> CATEGORY_SHIFT
+        else:
+            scorer = variant.scorer(list(board) + list(runout))
+            for seat, _ in contenders:
+                ranks[seat] = variant.category(scorer(holes[seat]))
+        key = tuple(ranks)
+        payouts = splits.get(key)
+        if payouts is None:
+            payouts = split_pot(contributions, ranks, exact=True)[0]
+            splits[key] = payouts
+        for seat, payout in enumerate(payouts):
+            totals[seat] += payout
+
+    return [total / n_runouts for total in totals]
+
+
+def round_payouts(expected:list[float]) -> list[int]:
+    """
+    Function to round expected payouts to whole chips without losing any, the
+    chips left after rounding down go to the largest remainders.
+
+    Args:
+        expected (list[float]): expected payout of each seat
+
+    Returns:
+        list[int]: payout of each seat
+    """
+    payouts = [int(value) for value in expected]
+    left = round(sum(expected)) - sum(payouts)
+    by_remainder = sorted(range(len(expected)), key=lambda seat: expected[seat] - payouts[seat], reverse=True)
+    for seat in by_remainder[0:left]:
+        payouts[seat] += 1
+    return payouts
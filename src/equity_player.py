@@ -0,0 +1,145 @@
+"""
+This file defines a sub-class to the player class that decides from its hand equity
+"""
+
+import random as rd
+import time
+
+from .evaluator import evaluate, CATEGORY_SHIFT
+from .player import Player
+
+class EquityPlayer(Player):
+    def __init__(self,
+                 starting_bank:int,
+                 id:int,
+                 time_budget:float = 0.005,
+                 max_samples:int = 1000,
+                 aggression:float = 1.5,
+                 name:str = 'equity'):
+        """
+        A subclass of player that estimates its share of the pot against the
+        opponents still in the hand before every decision, by dealing out random
+        opponent hands and boards until its time budget runs out (anytime Monte
+        Carlo), then folds, calls or raises based on the estimate and the pot odds.
+
+        Args:
+            starting_bank (int): starting bank amount
+            id (int): numeric ID
+            time_budget (float, optional): most seconds to spend on a decision, None to only
+                stop at max_samples, which makes decisions repeatable. Defaults to 0.005.
+            max_samples (int, optional): most deals to sample per decision. Defaults to 1000.
+            aggression (float, optional): raise when equity is this many times a fair share
+                of the pot. Defaults to 1.5.
+            name (str, optional): strategy name used in results. Defaults to 'equity'.
+        """
+        super().__init__(starting_bank, id, name)
+        self.time_budget = time_budget
+        self.max_samples = max_samples
+        self.aggression = aggression
+
+        # estimate and sample count of the last decision
+        self.equity = None
+        self.samples = 0
+
+        # what the player last saw at the table, see observe()
+        self._table = ([], 1, 0, 0)
+
+
+    def observe(self, community_cards:list, n_opponents:int, pot:int, call_amt:int) -> None:
+        """
+        Method to remember what the player can see before a decision
+
+        Args:
+            community_cards (list[Card]): cards on the board
+            n_opponents (int): opponents still in the hand
+            pot (int): chips in the pot
+            call_amt (int): chips needed to call
+        """
+        self._table = ([card.card_id for card in community_cards], n_opponents, pot, call_amt)
+
+
+    def get_action(self, min_bet:int) -> int:
+        """
+        This method sets the action from the hand's estimated equity: raise with
+        a large enough share of the pot, call when the equity beats the pot odds
+        and fold otherwise.
+
+        Args:
+            min_bet (int): smallest raise
+
+        Returns:
+            int: raise amount, sized by the equity edge over a fair share
+        """
+        board, n_opponents, pot, call_amt = self._table
+        n_opponents = max(n_opponents, 1)
+        self.equity = self.estimate_equity(board, n_opponents)
+
+        fair_share = 1 / (n_opponents + 1)
+        pot_odds = call_amt / (pot + call_amt) if call_amt > 0 else 0.0
+
+        if (self.equity >= min(0.9, fair_share * self.aggression)) and (self.equity > pot_odds):
+            self.action_str = 'bet'
+            edge = (self.equity - fair_share) / (1 - fair_share)
+            return max(min_bet, int(pot * edge))
+
+        if (call_amt == 0) or (self.equity >= pot_odds):
+            self.action_str = 'check'
+        else:
+            self.action_str = 'fold'
+        return min_bet
+
+
+    def estimate_equity(self, board:list[int], n_opponents:int) -> float:
+        """
+        Method to estimate the share of the pot the hand wins at showdown against
+        random hands, ranking hands by type like the showdown does and splitting ties.
+        Sampling stops at max_samples or when the time budget is used up, whichever
+        comes first.
+
+        Args:
+            board (list[int]): card ids on the board
+            n_opponents (int): opponents still in the hand
+
+        Returns:
+            float: estimated equity, a fair share if no deal could be sampled in time
+
+        Raises:
+            ValueError: raised if the hand does not hold two hole cards, equity is only
+                estimated for Hold'em
+        """
+        if len(self.hand.cards) != 2:
+            raise ValueError(f'EquityPlayer only estimates Hold\'em equity, its hand holds {len(self.hand.cards)} cards')
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        rng = self.rng if self.rng is not None else rd
+
+        hole = [card.card_id for card in self.hand.cards[0:2]]
+        seen = set(hole).union(board)
+        unseen = [card for card in range(52) if card not in seen]
+        n_board = 5 - len(board)
+        n_draw = n_board + 2 * n_opponents
+
+        total = 0.0
+        samples = 0
+        while samples < self.max_samples:
+            if (deadline is not None) and (time.perf_counter() >= deadline):
+                break
+
+            drawn = rng.sample(unseen, n_draw)
+            full_board = board + drawn[0:n_board]
+            mine = evaluate(hole + full_board) >> CATEGORY_SHIFT
+            ties = 1
+            for start in range(n_board, n_draw, 2):
+                theirs = evaluate(drawn[start:start + 2] + full_board) >> CATEGORY_SHIFT
+                if theirs > mine:
+                    ties = 0
+                    break
+                if theirs == mine:
+                    ties += 1
+            if ties > 0:
+                total += 1 / ties
+            samples += 1
+
+        self.samples = samples
+        if samples == 0:
+            return 1 / (n_opponents + 1)
+        return total / samples
@@ -0,0 +1,392 @@
+"""
+This file defines duplicate deal evaluation of computer strategies.
+
+Every deal is played once per seat rotation so each player gets every seat's cards,
+and the random decisions of a seat come from the same stream whoever sits there
+(common random numbers). Luck of the cards and of the draws then cancels out of
+the comparison instead of having to be averaged away over many more hands.
+"""
+
+import math
+import random as rd
+import statistics
+
+from itertools import combinations
+from statistics import NormalDist
+from typing import NamedTuple
+
+from .deck import Deck
+from .hand import Hand
+from .online_stats import RunningStats
+from .param_player import ParamPlayer
+from .player import Player, StrategyParams
+from .round import GameRound
+
+
+class StrategyResult(NamedTuple):
+    strategy: str
+    deals: int
+    mean: float
+    std_error: float
+
+
+class SequentialResult(NamedTuple):
+    comparison: "StrategyComparison"
+    leader: str
+    reason: str
+    deals: int
+    hands: int
+    hands_saved: int
+
+
+class StrategyComparison:
+    def __init__(self, strategies:list[str], scores:list[list[float]]):
+        """
+        This class holds the chips won per deal by each player of an evaluation
+        and summarizes them by strategy.
+
+        Args:
+            strategies (list[str]): strategy of each player
+            scores (list[list[float]]): chips won by each player, one list per deal
+        """
+        self.strategies = strategies
+        self.scores = scores
+
+
+    def strategy_scores(self, strategy:str) -> list[float]:
+        """
+        Method to get a strategy's chips won per deal, averaged over the players using it
+
+        Args:
+            strategy (str): strategy name
+
+        Returns:
+            list[float]: chips won per deal
+        """
+        if strategy not in self.strategies:
+            raise ValueError(f'No player used the {strategy} strategy')
+
+        return [_strategy_means(self.strategies, deal)[strategy] for deal in self.scores]
+
+
+    def result(self, strategy:str) -> StrategyResult:
+        """
+        Method to summarize a strategy
+
+        Args:
+            strategy (str): strategy name
+
+        Returns:
+            StrategyResult: mean chips won per deal and its standard error
+        """
+        return StrategyResult(strategy, len(self.scores), *_mean_std_error(self.strategy_scores(strategy)))
+
+
+    def difference(self, strategy_a:str, strategy_b:str) -> tuple:
+        """
+        Method to compare two strategies deal by deal, pairing them on the same deals
+
+        Args:
+            strategy_a (str): first strategy name
+            strategy_b (str): second strategy name
+
+        Returns:
+            tuple: (mean of a - b chips won per deal, standard error)
+        """
+        diffs = [a - b for a, b in zip(self.strategy_scores(strategy_a), self.strategy_scores(strategy_b))]
+        return _mean_std_error(diffs)
+
+
+    def summary(self) -> list[StrategyResult]:
+        """
+        Method to summarize every strategy, best first
+
+        Returns:
+            list[StrategyResult]: one result per strategy
+        """
+        results = [self.result(strategy) for strategy in dict.fromkeys(self.strategies)]
+        return sorted(results, key=lambda result: result.mean, reverse=True)
+
+
+
+class DuplicateEvaluator:
+    def __init__(self,
+                 strategies:list[str],
+                 bank:int = 200,
+                 small_blind:int = 2,
+                 large_blind:int = 4,
+                 seed:int = 0,
+                 duplicate:bool = True,
+                 equity_runouts:bool = False,
+                 params:dict = None):
+        """
+        This class plays seeded single hands between computer players. Each deal is
+        played once per seat rotation with every player starting from the same bank.
+
+        Args:
+            strategies (list[str]): strategy of each player, 2-10 players
+            bank (int, optional): bank every player starts each hand with. Defaults to 200.
+            small_blind (int, optional): small blind, posted by seat 0. Defaults to 2.
+            large_blind (int, optional): large blind, posted by seat 1. Defaults to 4.
+            seed (int, optional): seed of the deals and decisions. Defaults to 0.
+            duplicate (bool, optional): replay the same deal and seat decision streams for
+                every rotation, False deals every hand independently to compare against.
+                Defaults to True.
+            equity_runouts (bool, optional): settle all in hands by equity, see GameRound.
+                Defaults to False.
+            params (dict, optional): strategy names that are not built in, mapped to either
+                StrategyParams, played by a ParamPlayer, or a function of (bank, id) that makes
+                the player, e.g. an EquityPlayer. Defaults to None.
+        """
+        self.strategies = strategies
+        self.bank = bank
+        self.small_blind = small_blind
+        self.large_blind = large_blind
+        self.seed = seed
+        self.duplicate = duplicate
+        self.equity_runouts = equity_runouts
+
+        params = params if params is not None else {}
+        self.players = []
+        for idx, strategy in enumerate(strategies):
+            if isinstance(params.get(strategy), StrategyParams):
+                self.players.append(ParamPlayer(bank, idx + 1, params[strategy], strategy))
+            elif strategy in params:
+                self.players.append(params[strategy](bank, idx + 1))
+            else:
+                self.players.append(Player(bank, idx + 1, strategy))
+        for player in self.players:
+            player.hand = Hand([])
+            player.rng = rd.Random()
+        self._deck = Deck(rd.Random())
+        self._round = None
+
+
+    def deal_scores(self, deal:int) -> list[float]:
+        """
+        Method to play one deal in every seat rotation
+
+        Args:
+            deal (int): deal number, the same number always gives the same hands
+
+        Returns:
+            list[float]: chips won by each player, averaged over the rotations
+        """
+        n_players = len(self.players)
+        totals = [0] * n_players
+        for rotation in range(n_players):
+            seated = [self.players[(seat - rotation) % n_players] for seat in range(n_players)]
+            GameRound.seat_players(seated)
+            for seat, player in enumerate(seated):
+                player.bank = self.bank
+                player.rng.seed(self._decision_seed(deal, rotation, seat))
+            self._deck.rng.seed(self._deal_seed(deal, rotation))
+            self._play(seated)
+
+            for idx, player in enumerate(self.players):
+                totals[idx] += player.bank - self.bank
+
+        return [total / n_players for total in totals]
+
+
+    def deal_stats(self, start:int, stop:int) -> dict:
+        """
+        Method to play a range of deals keeping only running statistics per strategy
+
+        Args:
+            start (int): first deal number
+            stop (int): deal number to stop before
+
+        Returns:
+            dict: strategy name -> RunningStats of its chips won per deal
+        """
+        stats = {name: RunningStats() for name in dict.fromkeys(self.strategies)}
+        for deal in range(start, stop):
+            for name, mean in _strategy_means(self.strategies, self.deal_scores(deal)).items():
+                stats[name].add(mean)
+        return stats
+
+
+    def iter_deals(self, start:int = 0):
+        """
+        Generator over the scores of consecutive deals
+
+        Args:
+            start (int, optional): first deal number. Defaults to 0.
+
+        Yields:
+            list[float]: chips won by each player on the next deal
+        """
+        deal = start
+        while True:
+            yield self.deal_scores(deal)
+            deal += 1
+
+
+    def run(self, n_deals:int) -> StrategyComparison:
+        """
+        Method to play a number of deals
+
+        Args:
+            n_deals (int): deals to play, each played once per player
+
+        Returns:
+            StrategyComparison: scores of every deal
+        """
+        return StrategyComparison(self.strategies, [self.deal_scores(deal) for deal in range(n_deals)])
+
+
+    def run_sequential(self,
+                       max_deals:int,
+                       alpha:float = 0.05,
+                       precision:float = None,
+                       check_every:int = 50) -> SequentialResult:
+        """
+        Method to play deals until the result is clear instead of a fixed number.
+        Means and paired differences are updated online and checked every 
+        check_every deals. The run stops at the first check where the leading
+        strategy beats every other one at level alpha, or where every strategy's
+        mean is known to within precision chips, or after max_deals deals.
+        
+        The checks share alpha (Bonferroni over the planned checks), so looking
+        repeatedly does not make a false winner more likely than alpha.
+
+        Args:
+            max_deals (int): most deals to play
+            alpha (float, optional): significance level, None to only stop on precision. Defaults to 0.05.
+            precision (float, optional): confidence interval half width in chips per deal to 
+                stop at, None to only stop on significance. Defaults to None.
+            check_every (int, optional): deals between checks. Defaults to 50.
+
+        Returns:
+            SequentialResult: scores played, the leading strategy, why the run stopped
+                ('significance', 'precision' or 'max_deals') and the hands saved
+        """
+        if (alpha is None) and (precision is None):
+            raise ValueError('Please pass an alpha, a precision or both')
+        
+        n_checks = math.ceil(max_deals / check_every)
+        z = NormalDist().inv_cdf(1 - (alpha if alpha is not None else 0.05) / (2 * n_checks))
+
+        names = list(dict.fromkeys(self.strategies))
+        means = {name: RunningStats() for name in names}
+        diffs = {pair: RunningStats() for pair in combinations(names, 2)}
+        
+        scores = []
+        reason = 'max_deals'
+        for deal in range(max_deals):
+            scores.append(self.deal_scores(deal))
+            deal_means = _strategy_means(self.strategies, scores[-1])
+            for name in names:
+                means[name].add(deal_means[name])
+            for (name_a, name_b), stats in diffs.items():
+                stats.add(deal_means[name_a] - deal_means[name_b])
+                
+            if (deal + 1) % check_every != 0:
+                continue
+            
+            leader = max(names, key=lambda name: means[name].mean)
+            others = [name for name in names if name != leader]
+            if (alpha is not None) and others and all(self._beats(diffs, leader, name, z) for name in others):
+                reason = 'significance'
+                break
+            if (precision is not None) and all(z * stats.std_error <= precision for stats in means.values()):
+                reason = 'precision'
+                break
+                
+        n_players = len(self.players)
+        return SequentialResult(StrategyComparison(self.strategies, scores),
+                                max(names, key=lambda name: means[name].mean),
+                                reason,
+                                len(scores),
+                                len(scores) * n_players,
+                                (max_deals - len(scores)) * n_players)
+
+
+    @staticmethod
+    def _beats(diffs:dict, name_a:str, name_b:str, z:float) -> bool:
+        """
+        Helper method to check if a strategy's paired difference to another one is above zero
+
+        Args:
+            diffs (dict): difference statistics keyed by strategy pairs
+            name_a (str): strategy expected to be better
+            name_b (str): other strategy
+            z (float): critical value
+
+        Returns:
+            bool: True if the whole confidence interval of a - b is above zero
+        """
+        if (name_a, name_b) in diffs:
+            return diffs[(name_a, name_b)].interval(z)[0] > 0
+        return diffs[(name_b, name_a)].interval(z)[1] < 0
+
+
+    def _play(self, seated:list[Player]) -> None:
+        """
+        Helper method to play one hand, reusing the round and deck
+
+        Args:
+            seated (list[Player]): players in seat order
+        """
+        if self._round is None:
+            self._round = GameRound(seated, self.small_blind, self.large_blind, verbose=False,
+                                    equity_runouts=self.equity_runouts)
+            self._round.deck = self._deck
+        else:
+            self._round.reset(seated, self.small_blind, self.large_blind)
+        self._round.play()
+
+
+    def _deal_seed(self, deal:int, rotation:int) -> str:
+        """
+        Helper method to get the deck seed of a hand, shared by all rotations in duplicate mode
+        """
+        if self.duplicate is True:
+            return f'{self.seed}:deal:{deal}'
+        return f'{self.seed}:deal:{deal}:{rotation}'
+
+
+    def _decision_seed(self, deal:int, rotation:int, seat:int) -> str:
+        """
+        Helper method to get the decision seed of a seat, shared by all rotations in duplicate mode
+        """
+        if self.duplicate is True:
+            return f'{self.seed}:seat:{deal}:{seat}'
+        return f'{self.seed}:seat:{deal}:{rotation}:{seat}'
+
+
+
+def _strategy_means(strategies:list[str], deal:list[float]) -> dict:
+    """
+    Helper function to average one deal's scores over the players of each strategy
+
+    Args:
+        strategies (list[str]): strategy of each player
+        deal (list[float]): chips won by each player
+
+    Returns:
+        dict: strategy name -> mean chips won
+    """
+    totals = {}
+    counts = {}
+    for strategy, score in zip(strategies, deal):
+        totals[strategy] = totals.get(strategy, 0) + score
+        counts[strategy] = counts.get(strategy, 0) + 1
+    return {strategy: totals[strategy] / counts[strategy] for strategy in totals}
+
+
+def _mean_std_error(values:list[float]) -> tuple:
+    """
+    Helper function to get the mean and standard error of the mean
+
+    Args:
+        values (list[float]): sample
+
+    Returns:
+        tuple: (mean, standard error), the error is inf for fewer than two values
+    """
+    mean = statistics.fmean(values) if values else 0.0
+    if len(values) < 2:
+        return mean, float('inf')
+    return mean, statistics.stdev(values) / len(values) ** 0.5
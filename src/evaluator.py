@@ -0,0 +1,389 @@
+"""
+This file defines a fast hand evaluator that works on integer card ids (see Card.card_id).
+
+evaluate() scores the best five card hand of any 1-7 cards as a single int: the
+hand type (numbered as in HandClassifier) in the high bits and the ranks that
+break ties below it, so better hands always have larger scores.
+
+evaluate_short_deck() does the same for the 36 card short deck, and BoardEvaluator
+scores hands that must use an exact number of hole cards (Omaha) from five card
+lookup tables, with the work on the board done once for every player.
+"""
+
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+
+CATEGORY_SHIFT = 20
+
+HAND_TYPES = ('high', 'pair', 'two_pair', 'three_kind', 'straight', 'flush',
+              'full_house', 'four_kind', 'straight_flush', 'royal_flush')
+(HIGH, PAIR, TWO_PAIR, THREE_KIND, STRAIGHT, FLUSH,
+ FULL_HOUSE, FOUR_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH) = range(10)
+
+# short deck ranking: a flush beats a full house
+SHORT_DECK_TYPES = ('high', 'pair', 'two_pair', 'three_kind', 'straight', 'full_house',
+                    'flush', 'four_kind', 'straight_flush', 'royal_flush')
+_SHORT_FULL_HOUSE = SHORT_DECK_TYPES.index('full_house')
+_SHORT_FLUSH = SHORT_DECK_TYPES.index('flush')
+
+_ACE = 12
+_WHEEL = (1 << _ACE) | 0b1111
+# the short deck starts at six, so its wheel is A-6-7-8-9
+_SHORT_LOW = 4
+_SHORT_WHEEL = (1 << _ACE) | (0b1111 << _SHORT_LOW)
+
+
+def _straight_high(mask:int) -> int:
+    """
+    Helper function to find the top rank of the best straight in a rank bit mask
+
+    Args:
+        mask (int): 13 bit mask of ranks present
+
+    Returns:
+        int: top rank index of the straight, 3 for the wheel (A-5), -1 if none
+    """
+    for high in range(_ACE, 3, -1):
+        run = 0b11111 << (high - 4)
+        if mask & run == run:
+            return high
+    if mask & _WHEEL == _WHEEL:
+        return 3
+    return -1
+
+
+# lookup tables over all 13 bit rank masks, built on first use so importing stays cheap
+_STRAIGHT_HIGH = _SHORT_STRAIGHT_HIGH = _POPCOUNT = _RANKS_DESC = None
+
+
+def _build_mask_tables() -> None:
+    """
+    Helper function to build the lookup tables over all 13 bit rank masks
+    """
+    global _STRAIGHT_HIGH, _SHORT_STRAIGHT_HIGH, _POPCOUNT, _RANKS_DESC
+    straight_high = [_straight_high(mask) for mask in range(1 << 13)]
+    _SHORT_STRAIGHT_HIGH = [high if (high >= 0) or (mask & _SHORT_WHEEL != _SHORT_WHEEL) else _SHORT_LOW + 3
+                            for mask, high in enumerate(straight_high)]
+    _POPCOUNT = [bin(mask).count('1') for mask in range(1 << 13)]
+    _STRAIGHT_HIGH = straight_high
+    # built last, the evaluators check it to know the tables are ready
+    _RANKS_DESC = [tuple(rank for rank in range(_ACE, -1, -1) if mask >> rank & 1) for mask in range(1 << 13)]
+
+
+def mask_tables() -> tuple:
+    """
+    Function to get the lookup tables over all 13 bit rank masks, building them if needed
+
+    Returns:
+        tuple: (top rank of the best straight or -1, number of ranks) of each mask
+    """
+    if _RANKS_DESC is None:
+        _build_mask_tables()
+    return _STRAIGHT_HIGH, _POPCOUNT
+
+
+def _pack(category:int, ranks) -> int:
+    """
+    Helper function to pack a hand type and up to five tie break ranks into a score
+
+    Args:
+        category (int): hand type index
+        ranks (iterable): tie break rank indexes, most important first
+
+    Returns:
+        int: score
+    """
+    score = category
+    count = 0
+    for rank in ranks:
+        score = (score << 4) | rank
+        count += 1
+    return score << (4 * (5 - count))
+
+
+def evaluate(cards) -> int:
+    """
+    Function to score the best five card hand out of 1-7 card ids.
+
+    Args:
+        cards (iterable[int]): card ids
+
+    Returns:
+        int: hand score, compare scores to compare hands
+    """
+    if _RANKS_DESC is None:
+        _build_mask_tables()
+    counts = [0] * 13
+    suits = [0, 0, 0, 0]
+    for card in cards:
+        rank = card >> 2
+        counts[rank] += 1
+        suits[card & 3] |= 1 << rank
+
+    # flushes and straight flushes
+    flush_mask = 0
+    for mask in suits:
+        if _POPCOUNT[mask] >= 5:
+            high = _STRAIGHT_HIGH[mask]
+            if high == _ACE:
+                return _pack(ROYAL_FLUSH, (high,))
+            if high >= 0:
+                return _pack(STRAIGHT_FLUSH, (high,))
+            flush_mask = mask
+
+    # grouping ranks by count, highest ranks first
+    quads = []
+    trips = []
+    pairs = []
+    for rank in range(_ACE, -1, -1):
+        count = counts[rank]
+        if count == 4:
+            quads.append(rank)
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
+
+    rank_mask = suits[0] | suits[1] | suits[2] | suits[3]
+
+    if quads:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << quads[0])][0:1]
+        return _pack(FOUR_KIND, (quads[0],) + kickers)
+
+    if trips and ((len(trips) > 1) or pairs):
+        pair = max(trips[1] if len(trips) > 1 else -1, pairs[0] if pairs else -1)
+        return _pack(FULL_HOUSE, (trips[0], pair))
+
+    if flush_mask:
+        return _pack(FLUSH, _RANKS_DESC[flush_mask][0:5])
+
+    high = _STRAIGHT_HIGH[rank_mask]
+    if high >= 0:
+        return _pack(STRAIGHT, (high,))
+
+    if trips:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << trips[0])][0:2]
+        return _pack(THREE_KIND, (trips[0],) + kickers)
+
+    if len(pairs) > 1:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << pairs[0]) & ~(1 << pairs[1])][0:1]
+        return _pack(TWO_PAIR, (pairs[0], pairs[1]) + kickers)
+
+    if pairs:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << pairs[0])][0:3]
+        return _pack(PAIR, (pairs[0],) + kickers)
+
+    return _pack(HIGH, _RANKS_DESC[rank_mask][0:5])
+
+
+def evaluate_short_deck(cards) -> int:
+    """
+    Function to score the best five card hand out of 1-7 short deck card ids (six
+    to ace). A flush beats a full house and A-6-7-8-9 is the lowest straight, the
+    hand type of the score is numbered as in SHORT_DECK_TYPES.
+
+    Args:
+        cards (iterable[int]): card ids
+
+    Returns:
+        int: hand score, compare scores to compare short deck hands
+    """
+    if _RANKS_DESC is None:
+        _build_mask_tables()
+    counts = [0] * 13
+    suits = [0, 0, 0, 0]
+    for card in cards:
+        rank = card >> 2
+        counts[rank] += 1
+        suits[card & 3] |= 1 << rank
+
+    flush_mask = 0
+    for mask in suits:
+        if _POPCOUNT[mask] >= 5:
+            high = _SHORT_STRAIGHT_HIGH[mask]
+            if high == _ACE:
+                return _pack(ROYAL_FLUSH, (high,))
+            if high >= 0:
+                return _pack(STRAIGHT_FLUSH, (high,))
+            flush_mask = mask
+
+    quads = []
+    trips = []
+    pairs = []
+    for rank in range(_ACE, _SHORT_LOW - 1, -1):
+        count = counts[rank]
+        if count == 4:
+            quads.append(rank)
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
+
+    rank_mask = suits[0] | suits[1] | suits[2] | suits[3]
+
+    if quads:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << quads[0])][0:1]
+        return _pack(FOUR_KIND, (quads[0],) + kickers)
+
+    if flush_mask:
+        return _pack(_SHORT_FLUSH, _RANKS_DESC[flush_mask][0:5])
+
+    if trips and ((len(trips) > 1) or pairs):
+        pair = max(trips[1] if len(trips) > 1 else -1, pairs[0] if pairs else -1)
+        return _pack(_SHORT_FULL_HOUSE, (trips[0], pair))
+
+    high = _SHORT_STRAIGHT_HIGH[rank_mask]
+    if high >= 0:
+        return _pack(STRAIGHT, (high,))
+
+    if trips:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << trips[0])][0:2]
+        return _pack(THREE_KIND, (trips[0],) + kickers)
+
+    if len(pairs) > 1:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << pairs[0]) & ~(1 << pairs[1])][0:1]
+        return _pack(TWO_PAIR, (pairs[0], pairs[1]) + kickers)
+
+    if pairs:
+        kickers = _RANKS_DESC[rank_mask & ~(1 << pairs[0])][0:3]
+        return _pack(PAIR, (pairs[0],) + kickers)
+
+    return _pack(HIGH, _RANKS_DESC[rank_mask][0:5])
+
+
+# a prime per rank, the product of a hand's primes is a key for its ranks
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+@lru_cache(maxsize=None)
+def _five_card_tables(short_deck:bool) -> tuple:
+    """
+    Helper function to build the five card lookup tables once, on first use: the
+    score of every set of five ranks without a flush, keyed by the product of their
+    primes, and the score of every flush, keyed by its rank mask
+
+    Args:
+        short_deck (bool): score with evaluate_short_deck() over six to ace
+
+    Returns:
+        tuple: (rank product -> score, flush rank mask -> score)
+    """
+    score = evaluate_short_deck if short_deck else evaluate
+    ranks = range(_SHORT_LOW if short_deck else 0, _ACE + 1)
+
+    rank_scores = {}
+    for hand in combinations_with_replacement(ranks, 5):
+        if hand[0] == hand[4]:
+            continue
+        # suits by position never make a flush, and repeated ranks get different suits
+        product = 1
+        for rank in hand:
+            product *= _PRIMES[rank]
+        rank_scores[product] = score([rank * 4 + position % 4 for position, rank in enumerate(hand)])
+
+    flush_scores = {}
+    for hand in combinations(ranks, 5):
+        mask = 0
+        for rank in hand:
+            mask |= 1 << rank
+        flush_scores[mask] = score([rank * 4 for rank in hand])
+    return rank_scores, flush_scores
+
+
+def _subset_keys(cards:list[int], size:int) -> tuple:
+    """
+    Helper function to get the (rank product, suit or -1 if mixed, rank mask) of
+    every subset of cards of the argued size
+    """
+    keys = []
+    for subset in combinations(cards, size):
+        product = 1
+        mask = 0
+        suit = subset[0] & 3
+        for card in subset:
+            product *= _PRIMES[card >> 2]
+            mask |= 1 << (card >> 2)
+            if card & 3 != suit:
+                suit = -1
+        keys.append((product, suit, mask))
+    return tuple(keys)
+
+
+class BoardEvaluator:
+    def __init__(self, board:list[int], hole_used:int = 2, short_deck:bool = False):
+        """
+        This class scores hands that are made of exactly hole_used hole cards and
+        the rest from the board, as in Omaha. The board's subsets are worked out
+        once, each hand is then one lookup per pair of hole and board subsets: by
+        the product of its rank primes, or by its rank mask when both subsets are
+        of the same suit. Scores are the same as evaluate() or evaluate_short_deck()
+        of the best five cards.
+
+        Args:
+            board (list[int]): board card ids, at least 5 - hole_used of them
+            hole_used (int, optional): hole cards every hand must use. Defaults to 2.
+            short_deck (bool, optional): score with the short deck ranking. Defaults to False.
+
+        Raises:
+            ValueError: raised if the board is too small for a five card hand
+        """
+        board = list(board)
+        if not (1 <= hole_used <= 4) or (len(board) < 5 - hole_used):
+            raise ValueError(f'A board of {len(board)} cards cannot make a hand with {hole_used} hole cards')
+
+        self.board = board
+        self.hole_used = hole_used
+        self._rank_scores, self._flush_scores = _five_card_tables(short_deck)
+        board_keys = _subset_keys(board, 5 - hole_used)
+        self._board_products = [product for product, _, _ in board_keys]
+        # only same suit board subsets can make a flush
+        self._board_flushes = [(suit, mask) for _, suit, mask in board_keys if suit >= 0]
+
+
+    def evaluate(self, hole:list[int]) -> int:
+        """
+        Method to score the best hand of the argued hole cards on the board
+
+        Args:
+            hole (list[int]): hole card ids, at least hole_used of them
+
+        Returns:
+            int: hand score
+        """
+        hole_keys = _subset_keys(list(hole), self.hole_used)
+        rank_scores = self._rank_scores
+        best = max([rank_scores[hole_product * board_product]
+                    for hole_product, _, _ in hole_keys for board_product in self._board_products])
+
+        for board_suit, board_mask in self._board_flushes:
+            for _, suit, mask in hole_keys:
+                if suit == board_suit:
+                    best = max(best, self._flush_scores[board_mask | mask])
+        return best
+
+
+
+def hand_category(score:int) -> int:
+    """
+    Function to get the hand type index of a score
+
+    Args:
+        score (int): score from evaluate()
+
+    Returns:
+        int: hand type index, see HAND_TYPES
+    """
+    return score >> CATEGORY_SHIFT
+
+
+def hand_type(score:int) -> str:
+    """
+    Function to get the hand type name of a score
+
+    Args:
+        score (int): score from evaluate()
+
+    Returns:
+        str: hand type name, see HAND_TYPES
+    """
+    return HAND_TYPES[score >> CATEGORY_SHIFT]
@@ -0,0 +1,124 @@
+"""
+This file defines the GameState, a versioned view of a round that GameRound updates
+in place and that consumers (the display, network clients) can read or diff
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+class GameState(Mapping):
+    # fields and their values before anything happens in a round
+    DEFAULTS = {
+        'player_cards': (),
+        'player_bank': 0,
+        'community_cards': (),
+        'pot': 0,
+        # (player id, cards) per opponent in seat order after the player,
+        # cards are face down placeholders until the showdown
+        'opponents': (),
+        'winner_str': None,
+    }
+
+    def __init__(self):
+        """
+        This class holds the game state shown to the player. Every change bumps
+        a version number and remembers the version at which each field last
+        changed, so a consumer that saw version v can ask for only the fields
+        changed since then with delta(v). Values are stored as tuples so the
+        state can be shared without copying.
+
+        It behaves as a read only mapping of the fields that are set (a field set
+        to None, like winner_str before the showdown, is left out).
+        """
+        self.reset()
+
+
+    def reset(self) -> None:
+        """
+        Method to put every field back to its default for a new round. The version
+        keeps counting so deltas stay valid across rounds.
+        """
+        if hasattr(self, 'version') is False:
+            self.version = 0
+            self._values = dict(self.DEFAULTS)
+            self._changed_at = {field: 0 for field in self.DEFAULTS}
+            return
+
+        for field, value in self.DEFAULTS.items():
+            self.set(field, value)
+
+
+    def set(self, field:str, value) -> None:
+        """
+        Method to change a field, lists are stored as tuples. Setting a field
+        to its current value is not a change.
+
+        Args:
+            field (str): field name, one of GameState.DEFAULTS
+            value (any): new value
+
+        Raises:
+            KeyError: raised for an unknown field
+        """
+        if field not in self._values:
+            raise KeyError(f'{field} is not a game state field')
+
+        if isinstance(value, list):
+            value = tuple(value)
+
+        if (value is self._values[field]) or (value == self._values[field]):
+            return
+
+        self.version += 1
+        self._values[field] = value
+        self._changed_at[field] = self.version
+
+
+    def update(self, **fields) -> None:
+        """
+        Method to change several fields at once
+
+        Args:
+            **fields: field name -> new value
+        """
+        for field, value in fields.items():
+            self.set(field, value)
+
+
+    def delta(self, since:int) -> dict:
+        """
+        Method to get the fields that changed after a version.
+
+        Args:
+            since (int): last version the consumer has seen
+
+        Returns:
+            dict: changed field -> current value
+        """
+        return {field: self._values[field] for field, version in self._changed_at.items() if version > since}
+
+
+    def snapshot(self) -> MappingProxyType:
+        """
+        Method to get an immutable copy of the set fields
+
+        Returns:
+            MappingProxyType: read only copy of the state
+        """
+        return MappingProxyType(dict(self))
+
+
+    def __getitem__(self, field:str):
+        value = self._values[field]
+        if value is None:
+            raise KeyError(field)
+        return value
+
+
+    def __iter__(self):
+        return (field for field, value in self._values.items() if value is not None)
+
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values.values() if value is not None)
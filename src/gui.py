@@ -1,28 +1,77 @@
-import pygame
+import math
+import queue
 import sys
+import threading
+
+from types import MappingProxyType
 
 from .card import Card
 
+# pygame is only imported once a display is constructed, see _import_pygame()
+pygame = None
+
+
+def _import_pygame():
+    """
+    Helper function to import pygame on first use so the game engine can
+    be imported and run without paying for (or having) pygame.
+
+    Returns:
+        module: the pygame module
+    """
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
+        
+    return pygame
+
 
 class TexasHoldemDisplay:
-    def __init__(self, width=800, height=600):
+    def __init__(self, width=800, height=600, threaded=False, fps=30, queue_size=2):
         """
-        This class creates the display to inform the player of game information
+        This class creates the display to inform the player of game information.
+        
+        In threaded mode the display owns a render thread with a frame capped loop
+        that consumes immutable game state snapshots from a bounded queue, so the
+        game logic never waits on the window. Stale snapshots are dropped when the
+        queue is full.
 
         Args:
             width (int, optional): width of display window in pixels. Defaults to 800.
             height (int, optional): height of display window in pixels. Defaults to 600.
+            threaded (bool, optional): render from a separate thread. Defaults to False.
+            fps (int, optional): frame cap of the render loop in threaded mode. Defaults to 30.
+            queue_size (int, optional): max snapshots waiting to be drawn. Defaults to 2.
         """
-        
-        pygame.init()
+        _import_pygame()
         self.WIDTH, self.HEIGHT = width, height
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         self.GREEN = (0, 128, 0)
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
         self.RED = (255, 0, 0)
         self.CARD_WIDTH = 60 
         self.CARD_HEIGHT = 90
+        self.threaded = threaded
+        self.fps = fps
+        self._layouts = {}
+        
+        # snapshot queue and thread handles for threaded mode
+        self._snapshots = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._render_thread = None
+        
+        # in threaded mode pygame is set up by the render thread itself
+        if threaded is False:
+            self._init_pygame()
+            
+            
+    def _init_pygame(self) -> None:
+        """
+        Helper method to initialize pygame, the window and fonts
+        """
+        pygame.init()
+        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         self.clock = pygame.time.Clock()
         pygame.display.set_caption("Texas Hold'em")
         # font that supports card suites
@@ -36,15 +85,18 @@ class TexasHoldemDisplay:
         """
         self.screen.fill(self.GREEN)
 
-    def draw_card(self, card_text:str, pos:float) -> None:
+    def draw_card(self, card_text:str, pos:float, size:tuple = None) -> None:
         """
         Method to draw cards given with card_text at position pos.
 
         Args:
             card_text (str): text to put on card
             pos (float): position to draw card
+            size (tuple, optional): (width, height) of card. Defaults to CARD_WIDTH x CARD_HEIGHT.
         """
-        card_rect = pygame.Rect(pos[0], pos[1], self.CARD_WIDTH, self.CARD_HEIGHT)
+        if size is None:
+            size = (self.CARD_WIDTH, self.CARD_HEIGHT)
+        card_rect = pygame.Rect(pos[0], pos[1], size[0], size[1])
         pygame.draw.rect(self.screen, self.WHITE, card_rect)
         pygame.draw.rect(self.screen, self.BLACK, card_rect, 2)
         
@@ -57,14 +109,55 @@ class TexasHoldemDisplay:
         self.screen.blit(text_surface, text_rect)
         
 
+    def _opponent_layout(self, n_opponents:int) -> tuple:
+        """
+        Helper method to place opponents on an arc from the left of the table, over
+        the top, to the right. Layouts are computed once per opponent count and cached.
+
+        Args:
+            n_opponents (int): number of opponents
+
+        Returns:
+            tuple: (list of (x, y) of each opponent's first card, (card width, card height))
+        """
+        layout = self._layouts.get(n_opponents)
+        if layout is not None:
+            return layout
+
+        # arc around the community cards
+        center_x, center_y = self.WIDTH / 2, self.HEIGHT / 2
+        radius_x, radius_y = self.WIDTH / 2 - 110, self.HEIGHT / 2 - 95
+        if n_opponents == 1:
+            angles = [math.pi / 2]
+        else:
+            angles = [math.pi - math.pi * i / (n_opponents - 1) for i in range(n_opponents)]
+        
+        # shrinking cards so neighbouring pairs do not overlap
+        pair_width = 2 * self.CARD_WIDTH + 5
+        scale = 1.0
+        if n_opponents > 1:
+            gap_x = radius_x * abs(math.cos(angles[0]) - math.cos(angles[1]))
+            gap_y = radius_y * abs(math.sin(angles[0]) - math.sin(angles[1]))
+            scale = min(1.0, math.hypot(gap_x, gap_y) / (pair_width + 10))
+        card_size = (int(self.CARD_WIDTH * scale), int(self.CARD_HEIGHT * scale))
+        
+        positions = []
+        for angle in angles:
+            x = center_x + radius_x * math.cos(angle) - (2 * card_size[0] + 5) / 2
+            y = center_y - radius_y * math.sin(angle) - card_size[1] / 2
+            positions.append((int(x), int(y)))
+            
+        layout = (positions, card_size)
+        self._layouts[n_opponents] = layout
+        return layout
+        
+
     def render_game_state(self, game_state:dict) -> None:
         """
         Renders current game state using game state dict, updates the following: 
         * community cards
         * player cards
-        * left player cards
-        * right player cards
-        * top player cards
+        * opponent cards (1-9 opponents)
         * pot
         * player bank
         * game winner string
@@ -95,53 +188,16 @@ class TexasHoldemDisplay:
             pos = (start_x + i * (self.CARD_WIDTH + 20), y)
             self.draw_card(str(card), pos)
                 
-        # drawing left opponent cards
-        left_cards = game_state['left_opp_cards']
-        if isinstance(left_cards, list) is False:
-            left_cards = left_cards[0]
-        n_left = len(left_cards)
-        total_height = self.CARD_HEIGHT * n_left + 20 * (n_left - 1)
-        x = 50  # Left margin
-        start_y = (self.HEIGHT - total_height) // 2
-        for i, card in enumerate(left_cards):
-            pos = (x, start_y + i * (self.CARD_HEIGHT + 20))
-            if isinstance(card, Card):
-                self.draw_card(str(card), pos)
-                
-            else:
-                self.draw_card("XX", pos)
-            
-            
-        # drawing top opponent cards
-        top_cards = game_state['top_opp_cards']
-        if isinstance(top_cards, list) is False:
-            top_cards = top_cards[0]
-        n_top = len(top_cards)
-        total_width = self.CARD_WIDTH * n_top + 20 * (n_top - 1)
-        start_x = (self.WIDTH - total_width) // 2
-        y = 50 
-        for i, card in enumerate(top_cards):
-            pos = (start_x + i * (self.CARD_HEIGHT + 20), y)
-            if isinstance(card, Card):
-                self.draw_card(str(card), pos)
-            else:
-                self.draw_card("XX", pos)
-        
-            
-        # drawing right opponent cards
-        right_cards = game_state['right_opp_cards']
-        if isinstance(right_cards, list) is False:
-            left_cards = left_cards[0]
-        n_right = len(right_cards)
-        total_height = self.CARD_HEIGHT * n_right + 20 * (n_right - 1)
-        x = self.WIDTH - self.CARD_WIDTH - 50  # Right margin
-        start_y = (self.HEIGHT - total_height) // 2
-        for i, card in enumerate(right_cards):
-            pos = (x, start_y + i * (self.CARD_HEIGHT + 20))
-            if isinstance(card, Card):
-                self.draw_card(str(card), pos)
-            else:
-                self.draw_card("XX", pos)
+        # drawing opponent cards around the table
+        opponents = game_state['opponents']
+        positions, card_size = self._opponent_layout(len(opponents))
+        for (player_id, cards), (x, y) in zip(opponents, positions):
+            for i, card in enumerate(cards):
+                pos = (x + i * (card_size[0] + 5), y)
+                if isinstance(card, Card):
+                    self.draw_card(str(card), pos, card_size)
+                else:
+                    self.draw_card("XX", pos, card_size)
         
     
         # Giving pot amount
@@ -168,18 +224,137 @@ class TexasHoldemDisplay:
 
     def run(self, game_state:dict):
         """
-        Method to populate the display and update when called
+        Method to populate the display and update when called. In threaded
+        mode the game state is handed to the render thread instead.
 
         Args:
             game_state (dict): game state dict to populate
         """
+        if self.threaded is True:
+            self.submit(game_state)
+            return
 
         # Retrieve the current game state from your backend
         self.render_game_state(game_state)
         pygame.display.flip()
         
+        
+    def start(self) -> None:
+        """
+        Method to start the render thread in threaded mode
+        """
+        if (self.threaded is False) or (self._render_thread is not None):
+            return
+        
+        self._stop_event.clear()
+        self._render_thread = threading.Thread(target=self._render_loop, 
+                                               name="TexasHoldemDisplay",
+                                               daemon=True)
+        self._render_thread.start()
+        
+        
+    def stop(self, timeout:float = 2.0) -> None:
+        """
+        Method to stop the render thread, the last submitted frame is drawn first.
 
+        Args:
+            timeout (float, optional): seconds to wait for the thread. Defaults to 2.0.
+        """
+        if self._render_thread is None:
+            return
         
+        self._stop_event.set()
+        self._render_thread.join(timeout)
+        self._render_thread = None
+        
+        
+    def submit(self, game_state:dict) -> None:
+        """
+        Method to hand a game state to the render thread without blocking.
+        If the queue is full the oldest waiting snapshot is dropped.
+
+        Args:
+            game_state (dict): game state dict to populate
+        """
+        snapshot = self.make_snapshot(game_state)
+        while True:
+            try:
+                self._snapshots.put_nowait(snapshot)
+                return
+            except queue.Full:
+                # dropping stale frame to make room
+                try:
+                    self._snapshots.get_nowait()
+                except queue.Empty:
+                    pass
+                
+                
+    @staticmethod
+    def make_snapshot(game_state:dict) -> MappingProxyType:
+        """
+        Helper method to make an immutable copy of a game state dict. Lists are
+        copied into tuples so later changes by the round do not leak into a frame.
+
+        Args:
+            game_state (dict): game state dict to copy
+
+        Returns:
+            MappingProxyType: read only game state
+        """
+        snapshot = {}
+        for key, value in game_state.items():
+            if isinstance(value, list):
+                value = tuple(value)
+            snapshot[key] = value
+            
+        return MappingProxyType(snapshot)
     
     
+    def _next_snapshot(self, wait:float):
+        """
+        Helper method to get the newest waiting snapshot, skipping older ones.
+
+        Args:
+            wait (float): seconds to wait for a first snapshot
 
+        Returns:
+            MappingProxyType: newest snapshot or None if nothing arrived
+        """
+        try:
+            snapshot = self._snapshots.get(timeout=wait)
+        except queue.Empty:
+            return None
+        
+        # draining anything newer
+        while True:
+            try:
+                snapshot = self._snapshots.get_nowait()
+            except queue.Empty:
+                return snapshot
+            
+            
+    def _render_loop(self) -> None:
+        """
+        Frame capped render loop run by the render thread
+        """
+        self._init_pygame()
+        frame_time = 1 / self.fps
+        
+        while self._stop_event.is_set() is False:
+            snapshot = self._next_snapshot(frame_time)
+            if snapshot is not None:
+                self.render_game_state(snapshot)
+                pygame.display.flip()
+                
+            # keeping window responsive
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._stop_event.set()
+                    
+            self.clock.tick(self.fps)
+            
+        # drawing last frame before exit
+        snapshot = self._next_snapshot(0)
+        if snapshot is not None:
+            self.render_game_state(snapshot)
+            pygame.display.flip()
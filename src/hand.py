@@ -28,6 +28,15 @@ class Hand:
         self.cards.append(card)
         
         
+    def clear(self) -> None:
+        """
+        This method empties the hand so it can be reused for a new round
+        """
+        self._cards.clear()
+        self._type_int = None
+        self._type_str = None
+        
+        
     def print_hand(self) -> None: 
         """
         Helper method to print cards in hand
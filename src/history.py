@@ -0,0 +1,341 @@
+"""
+This file defines a compact binary hand history format, a buffered streaming writer
+that records hands from GameRound, and a generator based reader.
+
+File layout (little endian):
+    header: magic b'TCEH', version (uint8)
+    hands:  record length (uint32) followed by the record
+
+Record layout:
+    hand no (uint32), small blind (uint32), large blind (uint32), pot (uint32),
+    seat count (uint8), board count (uint8), action count (uint16), winner count (uint8)
+    seats:   player id (uint16), starting bank (uint32), hole card ids (2 x uint8)
+    board:   card ids (uint8 each)
+    actions: seat (uint8), action code (uint8), amount (uint32)
+    winners: seat index (uint8), chips won (uint32)
+"""
+
+import os
+import struct
+
+from typing import NamedTuple
+
+from .recorder import HandRecorder
+from .variants import HOLDEM
+
+MAGIC = b'TCEH'
+VERSION = 2
+
+# action names in code order, deals use the DEAL_SEAT seat and the card count as amount
+ACTIONS = ('small_blind', 'large_blind', 'fold', 'check', 'call', 'raise', 'deal', 'ante')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+DEAL_SEAT = 255
+NO_CARD = 255
+
+_FILE_HEADER = struct.Struct('<4sB')
+_LENGTH = struct.Struct('<I')
+_HAND_HEADER = struct.Struct('<IIIIBBHB')
+_SEAT = struct.Struct('<HIBB')
+_ACTION = struct.Struct('<BBI')
+_WINNER = struct.Struct('<BI')
+
+
+class SeatRecord(NamedTuple):
+    player_id: int
+    bank: int
+    hole: tuple
+
+
+class ActionRecord(NamedTuple):
+    seat: int
+    action: str
+    amount: int
+
+
+class HandRecord(NamedTuple):
+    hand_no: int
+    small_blind: int
+    large_blind: int
+    pot: int
+    seats: tuple
+    board: tuple
+    actions: tuple
+    winners: tuple
+    payouts: tuple
+
+
+class HandHistoryWriter(HandRecorder):
+    def __init__(self, path:str, buffer_size:int = 1 << 16):
+        """
+        This class records every hand played by the GameRounds it is passed to
+        and appends it to a binary hand history file. Events are kept in memory
+        for the current hand only and written through a large buffer once the
+        hand is finished.
+
+        Args:
+            path (str): history file path, appended to if it already exists
+            buffer_size (int, optional): write buffer size in bytes. Defaults to 64 KiB.
+        """
+        self.path = path
+        self.hands_written = 0
+        if os.path.exists(path):
+            self.hands_written, end = _complete_records(path)
+            # a record cut short by a crash is dropped, hands appended after it would be read as part of it
+            if end < os.path.getsize(path):
+                with open(path, 'r+b') as file:
+                    file.truncate(end)
+        self._file = open(path, 'ab', buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(_FILE_HEADER.pack(MAGIC, VERSION))
+
+        # state of the hand being recorded
+        self._seats = None
+        self._banks = None
+        self._actions = []
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Method to start recording a hand, saves seat order and starting banks.
+
+        Args:
+            round (GameRound): round being played
+
+        Raises:
+            ValueError: raised for variants other than Hold'em, the format keeps two
+                hole cards per seat and replays hands by Hold'em rules
+        """
+        if round.variant is not HOLDEM:
+            raise ValueError(f'Hand histories can only record Hold\'em, not {round.variant.name}')
+        self._seats = {id(player): seat for seat, player in enumerate(round.players)}
+        self._banks = [player.bank for player in round.players]
+        self._actions = []
+
+
+    def log_action(self, round, player, action:str, amount:int) -> None:
+        """
+        Method to record a blind or betting action.
+
+        Args:
+            round (GameRound): round being played
+            player (Player): acting player
+            action (str): action name
+            amount (int): chips put in the pot by this action
+        """
+        self._actions.append((self._seats[id(player)], ACTION_CODES[action], amount))
+
+
+    def log_deal(self, round, cards:list) -> None:
+        """
+        Method to record community cards being dealt.
+
+        Args:
+            round (GameRound): round being played
+            cards (list[Card]): cards added to the board
+        """
+        self._actions.append((DEAL_SEAT, ACTION_CODES['deal'], len(cards)))
+
+
+    def end_hand(self, round) -> None:
+        """
+        Method to serialize the finished hand and write it to the file.
+
+        Args:
+            round (GameRound): round being played
+        """
+        players = round.players
+        board = round.community_cards
+        winners = [self._seats[id(winner)] for winner in round.winners]
+        payouts = [round.payouts[seat] for seat in winners]
+
+        record = bytearray(_HAND_HEADER.pack(self.hands_written,
+                                             round.small_blind_amt,
+                                             round.large_blind_amt,
+                                             round.pot,
+                                             len(players),
+                                             len(board),
+                                             len(self._actions),
+                                             len(winners)))
+
+        for player, bank in zip(players, self._banks):
+            hole = [card.card_id for card in player.hand.cards[0:2]]
+            hole.extend([NO_CARD] * (2 - len(hole)))
+            record += _SEAT.pack(player.id, bank, hole[0], hole[1])
+
+        record += bytes(card.card_id for card in board)
+        for action in self._actions:
+            record += _ACTION.pack(*action)
+        for seat, payout in zip(winners, payouts):
+            record += _WINNER.pack(seat, payout)
+
+        self._file.write(_LENGTH.pack(len(record)))
+        self._file.write(record)
+        self.hands_written += 1
+
+
+    def flush(self) -> None:
+        """
+        Method to flush buffered hands to disk
+        """
+        self._file.flush()
+
+
+    def close(self) -> None:
+        """
+        Method to flush and close the file
+        """
+        if self._file.closed is False:
+            self._file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+
+def parse_hand(data:bytes) -> HandRecord:
+    """
+    Function to decode a single hand record (without its length prefix).
+
+    Args:
+        data (bytes): record bytes
+
+    Returns:
+        HandRecord: decoded hand
+    """
+    (hand_no, small_blind, large_blind, pot,
+     n_seats, n_board, n_actions, n_winners) = _HAND_HEADER.unpack_from(data, 0)
+    offset = _HAND_HEADER.size
+
+    seats = []
+    for _ in range(n_seats):
+        player_id, bank, hole_1, hole_2 = _SEAT.unpack_from(data, offset)
+        hole = tuple(card for card in (hole_1, hole_2) if card != NO_CARD)
+        seats.append(SeatRecord(player_id, bank, hole))
+        offset += _SEAT.size
+
+    board = tuple(data[offset:offset + n_board])
+    offset += n_board
+
+    actions = []
+    for seat, code, amount in _ACTION.iter_unpack(data[offset:offset + n_actions * _ACTION.size]):
+        actions.append(ActionRecord(seat, ACTIONS[code], amount))
+    offset += n_actions * _ACTION.size
+
+    won = list(_WINNER.iter_unpack(data[offset:offset + n_winners * _WINNER.size]))
+    winners = tuple(seat for seat, _ in won)
+    payouts = tuple(payout for _, payout in won)
+
+    return HandRecord(hand_no, small_blind, large_blind, pot,
+                      tuple(seats), board, tuple(actions), winners, payouts)
+
+
+def _check_header(file) -> None:
+    """
+    Helper function to validate the file header
+
+    Args:
+        file (BinaryIO): open history file positioned at the start
+
+    Raises:
+        ValueError: raised if the file is not a hand history file
+    """
+    header = file.read(_FILE_HEADER.size)
+    if len(header) < _FILE_HEADER.size:
+        raise ValueError('File is too short to be a hand history file')
+
+    magic, version = _FILE_HEADER.unpack(header)
+    if (magic != MAGIC) or (version != VERSION):
+        raise ValueError('Please pass a valid hand history file')
+
+
+def iter_records(path:str, buffer_size:int = 1 << 16):
+    """
+    Generator over the raw records of a history file.
+
+    Args:
+        path (str): history file path
+        buffer_size (int, optional): read buffer size in bytes. Defaults to 64 KiB.
+
+    Yields:
+        tuple: (offset of the record's length prefix, record bytes)
+    """
+    with open(path, 'rb', buffering=buffer_size) as file:
+        _check_header(file)
+        offset = _FILE_HEADER.size
+        while True:
+            prefix = file.read(_LENGTH.size)
+            if len(prefix) < _LENGTH.size:
+                return
+
+            (length,) = _LENGTH.unpack(prefix)
+            data = file.read(length)
+            if len(data) < length:
+                raise ValueError(f'Truncated hand record at byte {offset}')
+
+            yield offset, data
+            offset += _LENGTH.size + length
+
+
+def read_hands(path:str, buffer_size:int = 1 << 16):
+    """
+    Generator that lazily decodes the hands of a history file one at a time.
+
+    Args:
+        path (str): history file path
+        buffer_size (int, optional): read buffer size in bytes. Defaults to 64 KiB.
+
+    Yields:
+        HandRecord: next hand in the file
+    """
+    for _, data in iter_records(path, buffer_size):
+        yield parse_hand(data)
+
+
+def count_hands(path:str) -> int:
+    """
+    Function to count hands in a history file by skipping from record to record.
+    A record cut short at the end of the file is not counted.
+
+    Args:
+        path (str): history file path
+
+    Returns:
+        int: number of hands in the file
+    """
+    return _complete_records(path)[0]
+
+
+def _complete_records(path:str) -> tuple:
+    """
+    Helper function to skip through the complete records of a history file
+
+    Args:
+        path (str): history file path
+
+    Returns:
+        tuple: (number of complete records, byte offset just after the last one)
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, 0
+
+    count = 0
+    end = _FILE_HEADER.size
+    with open(path, 'rb') as file:
+        _check_header(file)
+        while True:
+            prefix = file.read(_LENGTH.size)
+            if len(prefix) < _LENGTH.size:
+                return count, end
+
+            (length,) = _LENGTH.unpack(prefix)
+            if end + _LENGTH.size + length > size:
+                return count, end
+            file.seek(length, os.SEEK_CUR)
+            end += _LENGTH.size + length
+            count += 1
@@ -0,0 +1,265 @@
+"""
+This file defines a sidecar index for binary hand history files and a reader
+that uses it to seek straight to a hand, a player's hands or hands of a type.
+
+Index layout (little endian):
+    header:   magic b'TCEI', version (uint8), hand count (uint64), history size (uint64)
+    offsets:  one uint64 per hand, byte offset of the hand's length prefix
+    players:  key count (uint32), then per player id (uint32), count (uint32), hand positions (uint32 each)
+    types:    key count (uint32), then per name length (uint8), name, count (uint32), hand positions (uint32 each)
+"""
+
+import os
+import struct
+
+from array import array
+
+from .card import Card
+from .hand import Hand
+from .history import iter_records, parse_hand, HandRecord, _LENGTH
+from .winner import HandClassifier
+
+INDEX_MAGIC = b'TCEI'
+INDEX_VERSION = 1
+NO_SHOWDOWN = 'no_showdown'
+
+_INDEX_HEADER = struct.Struct('<4sBQQ')
+_COUNT = struct.Struct('<I')
+_KEY = struct.Struct('<II')
+
+
+def hand_type(hand:HandRecord) -> str:
+    """
+    Function to get the winning hand type of a recorded hand, using HandClassifier.
+
+    Args:
+        hand (HandRecord): recorded hand
+
+    Returns:
+        str: hand type of the best winning hand, 'no_showdown' if everyone else folded
+    """
+    folded = {action.seat for action in hand.actions if action.action == 'fold'}
+    if len(hand.seats) - len(folded) < 2:
+        return NO_SHOWDOWN
+
+    best = None
+    for seat in hand.winners:
+        cards = [Card.from_id(card) for card in hand.seats[seat].hole + hand.board]
+        ranked = HandClassifier(Hand(cards)).calc_hand_rank()
+        if (best is None) or (ranked[0] > best[0]):
+            best = ranked
+
+    return best[1]
+
+
+class HandHistoryIndex:
+    def __init__(self, offsets:array, players:dict, types:dict, history_size:int):
+        """
+        This class holds the offsets of every hand in a history file plus
+        posting lists of hand positions per player id and per winning hand type.
+        Use HandHistoryIndex.build() to make one and save()/load() for the sidecar file.
+
+        Args:
+            offsets (array): uint64 byte offset per hand
+            players (dict): player id -> array of hand positions
+            types (dict): hand type -> array of hand positions
+            history_size (int): size of the indexed history file in bytes
+        """
+        self.offsets = offsets
+        self.players = players
+        self.types = types
+        self.history_size = history_size
+
+
+    @classmethod
+    def build(cls, history_path:str) -> "HandHistoryIndex":
+        """
+        Method to build an index with a single pass over a history file.
+
+        Args:
+            history_path (str): history file path
+
+        Returns:
+            HandHistoryIndex: index of the file
+        """
+        offsets = array('Q')
+        players = {}
+        types = {}
+        for position, (offset, data) in enumerate(iter_records(history_path)):
+            offsets.append(offset)
+            hand = parse_hand(data)
+            for seat in hand.seats:
+                players.setdefault(seat.player_id, array('I')).append(position)
+            types.setdefault(hand_type(hand), array('I')).append(position)
+
+        return cls(offsets, players, types, os.path.getsize(history_path))
+
+
+    def save(self, path:str) -> None:
+        """
+        Method to write the index to a sidecar file.
+
+        Args:
+            path (str): index file path
+        """
+        with open(path, 'wb') as file:
+            file.write(_INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(self.offsets), self.history_size))
+            self.offsets.tofile(file)
+
+            file.write(_COUNT.pack(len(self.players)))
+            for player_id, postings in sorted(self.players.items()):
+                file.write(_KEY.pack(player_id, len(postings)))
+                postings.tofile(file)
+
+            file.write(_COUNT.pack(len(self.types)))
+            for name, postings in sorted(self.types.items()):
+                encoded = name.encode()
+                file.write(bytes([len(encoded)]) + encoded)
+                file.write(_COUNT.pack(len(postings)))
+                postings.tofile(file)
+
+
+    @classmethod
+    def load(cls, path:str) -> "HandHistoryIndex":
+        """
+        Method to read an index from its sidecar file.
+
+        Args:
+            path (str): index file path
+
+        Raises:
+            ValueError: raised if the file is not an index file
+
+        Returns:
+            HandHistoryIndex: loaded index
+        """
+        with open(path, 'rb') as file:
+            magic, version, n_hands, history_size = _INDEX_HEADER.unpack(file.read(_INDEX_HEADER.size))
+            if (magic != INDEX_MAGIC) or (version != INDEX_VERSION):
+                raise ValueError('Please pass a valid hand history index file')
+
+            offsets = array('Q')
+            offsets.fromfile(file, n_hands)
+
+            players = {}
+            (n_players,) = _COUNT.unpack(file.read(_COUNT.size))
+            for _ in range(n_players):
+                player_id, count = _KEY.unpack(file.read(_KEY.size))
+                players[player_id] = array('I')
+                players[player_id].fromfile(file, count)
+
+            types = {}
+            (n_types,) = _COUNT.unpack(file.read(_COUNT.size))
+            for _ in range(n_types):
+                name = file.read(file.read(1)[0]).decode()
+                (count,) = _COUNT.unpack(file.read(_COUNT.size))
+                types[name] = array('I')
+                types[name].fromfile(file, count)
+
+        return cls(offsets, players, types, history_size)
+
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
+
+class IndexedHandHistory:
+    def __init__(self, history_path:str, index_path:str = None):
+        """
+        This class gives random access to the hands of a history file. The sidecar
+        index (history_path + '.idx' by default) is loaded, or built and saved if it
+        is missing or was made for a different version of the file.
+
+        Args:
+            history_path (str): history file path
+            index_path (str, optional): sidecar index path. Defaults to None.
+        """
+        self.history_path = str(history_path)
+        self.index_path = index_path if index_path is not None else self.history_path + '.idx'
+        self.index = self._load_or_build_index()
+        self._file = open(self.history_path, 'rb')
+
+
+    def _load_or_build_index(self) -> HandHistoryIndex:
+        """
+        Helper method to load the sidecar index, rebuilding it when stale
+
+        Returns:
+            HandHistoryIndex: index matching the history file
+        """
+        size = os.path.getsize(self.history_path)
+        if os.path.exists(self.index_path):
+            index = HandHistoryIndex.load(self.index_path)
+            if index.history_size == size:
+                return index
+
+        index = HandHistoryIndex.build(self.history_path)
+        index.save(self.index_path)
+        return index
+
+
+    def hand(self, position:int) -> HandRecord:
+        """
+        Method to read hand at a position with a single seek.
+
+        Args:
+            position (int): hand position in the file (0 is the first hand)
+
+        Returns:
+            HandRecord: decoded hand
+        """
+        self._file.seek(self.index.offsets[position])
+        (length,) = _LENGTH.unpack(self._file.read(_LENGTH.size))
+        return parse_hand(self._file.read(length))
+
+
+    def hands_for_player(self, player_id:int):
+        """
+        Generator over every hand a player was seated in.
+
+        Args:
+            player_id (int): player id
+
+        Yields:
+            HandRecord: next hand of the player
+        """
+        for position in self.index.players.get(player_id, ()):
+            yield self.hand(position)
+
+
+    def hands_of_type(self, type_str:str):
+        """
+        Generator over every hand won with a hand type.
+
+        Args:
+            type_str (str): hand type string from HandClassifier or 'no_showdown'
+
+        Yields:
+            HandRecord: next hand of the type
+        """
+        for position in self.index.types.get(type_str, ()):
+            yield self.hand(position)
+
+
+    def close(self) -> None:
+        """
+        Method to close the history file
+        """
+        self._file.close()
+
+
+    def __getitem__(self, position:int) -> HandRecord:
+        return self.hand(position)
+
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
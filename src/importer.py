@@ -0,0 +1,349 @@
+"""
+This file defines a streaming importer for text hand histories in the format most
+online rooms and converters write (PokerStars style: a 'Hand #' header line, seat
+lines, '*** FLOP ***' street markers, 'name: raises 4 to 8' actions and a summary).
+
+Hands are parsed one at a time from a generator, so memory does not grow with the
+file, into compact records that use the card ids and action names of the binary
+hand history (see history.ACTIONS). Files can be split into byte ranges and parsed
+across worker processes.
+"""
+
+import os
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import NamedTuple
+
+from .codec import parse_cards
+from .history import ActionRecord, DEAL_SEAT
+
+
+class ImportedSeat(NamedTuple):
+    name: str
+    bank: int
+    hole: tuple
+
+
+class ImportedHand(NamedTuple):
+    hand_id: int
+    small_blind: int
+    big_blind: int
+    button: int
+    seats: tuple
+    board: tuple
+    actions: tuple
+    pot: int
+    rake: int
+    payouts: tuple
+
+
+_HEADER = re.compile(r"^\S.*?(?:Hand|Game) #(\d+)")
+_BLINDS = re.compile(r"\(([$€£]?[\d.,]+)/([$€£]?[\d.,]+)(?: [A-Z]{3})?\)")
+_BUTTON = re.compile(r"Seat #(\d+) is the button")
+_SEAT = re.compile(r"^Seat (\d+): (.+?) \(([$€£]?[\d.,]+) in chips")
+_STREET = re.compile(r"^\*\*\* (FLOP|TURN|RIVER) \*\*\*.*\[([^\]]+)\]\s*$")
+_CARDS = re.compile(r"\[([^\]]+)\]")
+_AMOUNT = re.compile(r"[$€£]?([\d.,]+)")
+_UNCALLED = re.compile(r"^Uncalled bet \(([$€£]?[\d.,]+)\) returned to (.+)$")
+_COLLECTED = re.compile(r"^(.+?) collected ([$€£]?[\d.,]+) from")
+_TOTAL = re.compile(r"^Total pot ([$€£]?[\d.,]+)(?:.*Rake ([$€£]?[\d.,]+))?")
+
+# action verbs -> action names, the longest verbs first
+_VERBS = (
+    ('posts small & big blinds', 'large_blind'),
+    ('posts small blind', 'small_blind'),
+    ('posts big blind', 'large_blind'),
+    ('posts the ante', 'ante'),
+    ('folds', 'fold'),
+    ('checks', 'check'),
+    ('calls', 'call'),
+    ('bets', 'raise'),
+    ('raises', 'raise'),
+)
+
+
+def read_text_hands(path:str, strict:bool = True):
+    """
+    Function to stream the hands of a text hand history file
+
+    Args:
+        path (str): text hand history path
+        strict (bool, optional): raise on a hand that cannot be parsed, False skips it.
+            Defaults to True.
+
+    Yields:
+        ImportedHand: next hand in the file
+    """
+    yield from _read_range(path, 0, None, strict)
+
+
+def import_files(paths:list[str], workers:int = None, chunk_size:int = 1 << 24, strict:bool = True):
+    """
+    Function to parse text hand history files across worker processes. Files are
+    split into byte ranges of about chunk_size, each range is parsed by a worker
+    from its first hand header, and hands are yielded in file order with only a
+    few ranges in flight, so memory stays bounded.
+
+    Args:
+        paths (list[str]): text hand history paths
+        workers (int, optional): worker processes, 1 parses in this process. Defaults to None,
+            one per CPU.
+        chunk_size (int, optional): bytes per range. Defaults to 16 MiB.
+        strict (bool, optional): raise on a hand that cannot be parsed, False skips it.
+            Defaults to True.
+
+    Yields:
+        ImportedHand: hands of each file in order
+    """
+    jobs = [(str(path), start, min(start + chunk_size, os.path.getsize(path)), strict)
+            for path in paths for start in range(0, max(os.path.getsize(path), 1), chunk_size)]
+    if workers == 1:
+        for path, start, end, job_strict in jobs:
+            yield from _read_range(path, start, end, job_strict)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        in_flight = []
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+        for job in jobs:
+            in_flight.append(pool.submit(_parse_range, job))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.pop(0).result()
+        for future in in_flight:
+            yield from future.result()
+
+
+def _parse_range(job:tuple) -> list[ImportedHand]:
+    """
+    Helper function for worker processes that parses the hands starting in a byte range
+
+    Args:
+        job (tuple): (path, start, end, strict)
+
+    Returns:
+        list[ImportedHand]: hands whose header line starts in the range
+    """
+    path, start, end, strict = job
+    return list(_read_range(path, start, end, strict))
+
+
+def _read_range(path:str, start:int, end:int, strict:bool):
+    """
+    Helper generator over the hands whose header line starts in [start, end), the
+    last one is read to its end even past the range
+
+    Yields:
+        ImportedHand: parsed hands
+    """
+    with open(path, 'rb') as file:
+        position = start
+        if start > 0:
+            # skip to the first line starting at or after start
+            file.seek(start - 1)
+            position = start - 1 + len(file.readline())
+
+        lines = []
+        for raw in file:
+            line = raw.decode('utf-8', errors='replace').strip().lstrip('\ufeff')
+            is_header = ('Hand #' in line or 'Game #' in line) and (_HEADER.match(line) is not None)
+            if is_header:
+                if lines:
+                    hand = _parse_or_skip(lines, strict)
+                    if hand is not None:
+                        yield hand
+                lines = []
+                if (end is not None) and (position >= end):
+                    return
+            position += len(raw)
+            if line and (lines or is_header):
+                lines.append(line)
+
+        if lines:
+            hand = _parse_or_skip(lines, strict)
+            if hand is not None:
+                yield hand
+
+
+def _parse_or_skip(lines:list[str], strict:bool) -> ImportedHand:
+    """
+    Helper function to parse a hand, returning None for a bad hand when not strict
+    """
+    try:
+        return parse_text_hand(lines)
+    except (ValueError, KeyError, IndexError):
+        if strict:
+            raise
+        return None
+
+
+def parse_text_hand(lines:list[str]) -> ImportedHand:
+    """
+    Function to parse the lines of one hand. Amounts are kept in the smallest unit:
+    cents when the stakes have a currency sign, chips otherwise. Bets and raises are
+    recorded as the chips they put in, uncalled bets are taken back off the bet.
+
+    Args:
+        lines (list[str]): lines of the hand, header first
+
+    Raises:
+        ValueError: raised if the hand cannot be parsed
+
+    Returns:
+        ImportedHand: parsed hand
+    """
+    header = _HEADER.match(lines[0])
+    if header is None:
+        raise ValueError(f'{lines[0]!r} is not a hand header')
+    blinds = _BLINDS.findall(lines[0])
+    if len(blinds) == 0:
+        raise ValueError(f'Hand #{header.group(1)} has no stakes in its header')
+    small_text, big_text = blinds[-1]
+    scale = 100 if small_text[0] in '$€£' else 1
+
+    names = []
+    banks = []
+    holes = {}
+    button_seat = None
+    button = -1
+    board = []
+    actions = []
+    committed = {}
+    payouts = {}
+    pot = rake = None
+
+    # lines are told apart by their start first, so most lines take a single regex or none
+    for line in lines[1:]:
+        if line.startswith('Seat '):
+            match = _SEAT.match(line)
+            if match and (not actions) and (match.group(2) not in names):
+                if match.group(1) == button_seat:
+                    button = len(names)
+                names.append(match.group(2))
+                banks.append(_amount(match.group(3), scale))
+            elif ' showed [' in line:
+                name = line[line.index(': ') + 2:line.index(' showed [')].split(' (')[0]
+                if name in names:
+                    holes[name] = tuple(parse_cards(_CARDS.findall(line)[0]))
+            continue
+
+        if line.startswith('*** '):
+            match = _STREET.match(line)
+            if match:
+                cards = parse_cards(match.group(2))
+                board.extend(cards)
+                actions.append(ActionRecord(DEAL_SEAT, 'deal', len(cards)))
+                committed = {}
+            continue
+
+        if line.startswith('Dealt to '):
+            name = line[len('Dealt to '):line.rfind(' [')]
+            if name in names:
+                holes[name] = tuple(parse_cards(_CARDS.findall(line)[-1]))
+            continue
+
+        if line.startswith('Uncalled bet'):
+            match = _UNCALLED.match(line)
+            if match and (match.group(2) in names):
+                _take_back(actions, names.index(match.group(2)), _amount(match.group(1), scale))
+            continue
+
+        if line.startswith('Total pot'):
+            match = _TOTAL.match(line)
+            pot = _amount(match.group(1), scale)
+            rake = _amount(match.group(2), scale) if match.group(2) else 0
+            continue
+
+        if (button_seat is None) and ('is the button' in line):
+            match = _BUTTON.search(line)
+            if match:
+                button_seat = match.group(1)
+            continue
+
+        if ': shows [' in line:
+            name = line[0:line.index(': shows [')]
+            if name in names:
+                holes[name] = tuple(parse_cards(_CARDS.findall(line)[0]))
+            continue
+
+        action = _parse_action(line, names, committed, scale)
+        if action is not None:
+            actions.append(action)
+        elif ' collected ' in line:
+            match = _COLLECTED.match(line)
+            if match and (match.group(1) in names):
+                name = match.group(1)
+                payouts[name] = payouts.get(name, 0) + _amount(match.group(2), scale)
+
+    if len(names) < 2:
+        raise ValueError(f'Hand #{header.group(1)} has fewer than two seats')
+
+    if pot is None:
+        pot = sum(action.amount for action in actions if action.seat != DEAL_SEAT)
+    seats = tuple(ImportedSeat(name, bank, holes.get(name, ())) for name, bank in zip(names, banks))
+    return ImportedHand(int(header.group(1)), _amount(small_text, scale), _amount(big_text, scale), button,
+                        seats, tuple(board), tuple(actions), pot, rake if rake is not None else 0,
+                        tuple(payouts.get(name, 0) for name in names))
+
+
+def _parse_action(line:str, names:list[str], committed:dict, scale:int):
+    """
+    Helper function to parse a 'name: verb amount' line
+
+    Args:
+        line (str): hand line
+        names (list[str]): seated player names
+        committed (dict): seat -> chips put in on this street, updated
+        scale (int): amount scale
+
+    Returns:
+        ActionRecord: the action, None for other lines
+    """
+    split = line.find(': ')
+    while split != -1:
+        name = line[0:split]
+        if name in names:
+            break
+        split = line.find(': ', split + 1)
+    else:
+        return None
+
+    seat = names.index(name)
+    rest = line[split + 2:]
+
+    for verb, action in _VERBS:
+        if not rest.startswith(verb):
+            continue
+        amounts = [_amount(text, scale) for text in _AMOUNT.findall(rest[len(verb):])]
+        if action in ('fold', 'check'):
+            amount = 0
+        elif (verb == 'raises') and (len(amounts) >= 2):
+            # 'raises 4 to 8' is a raise to 8 in total on this street
+            amount = amounts[1] - committed.get(seat, 0)
+        else:
+            amount = amounts[0]
+        if action != 'ante':
+            committed[seat] = committed.get(seat, 0) + amount
+        return ActionRecord(seat, action, amount)
+    return None
+
+
+def _take_back(actions:list[ActionRecord], seat:int, amount:int) -> None:
+    """
+    Helper function to take an uncalled bet back off the seat's last bet
+    """
+    for idx in range(len(actions) - 1, -1, -1):
+        if (actions[idx].seat == seat) and (actions[idx].amount > 0):
+            actions[idx] = actions[idx]._replace(amount=actions[idx].amount - amount)
+            return
+
+
+def _amount(text:str, scale:int) -> int:
+    """
+    Helper function to read an amount like '$1,234.50' in the smallest unit
+    """
+    text = text.lstrip('$€£').replace(',', '')
+    if '.' not in text:
+        return int(text) * scale
+    return int(Decimal(text) * scale)
@@ -0,0 +1,261 @@
+"""
+This file defines a multi-table tournament: a coordinator that plays many tables at
+once across worker processes, keeps the blind levels of every table in step, and
+breaks and balances tables as players are eliminated.
+"""
+
+import math
+import random as rd
+import time
+
+from typing import NamedTuple
+
+from .deck import Deck
+from .player import Player
+from .pool import worker_pool
+from .round import GameRound
+from .seats import MIN_SEATS, MAX_SEATS
+from .tournament import BlindLevel, BlindSchedule, prize_payouts
+
+
+class Entrant(NamedTuple):
+    id: int
+    strategy: str
+    bank: int
+
+
+class TableResult(NamedTuple):
+    table_id: int
+    seats: tuple
+    button: int
+    hands: int
+    busted: tuple
+
+
+class MultiTableTournament:
+    def __init__(self,
+                 strategies:list[str],
+                 bank:int = 1000,
+                 table_size:int = 9,
+                 schedule:BlindSchedule = None,
+                 hands_per_step:int = 10,
+                 workers:int = None,
+                 seed:int = 0):
+        """
+        This class runs a tournament over as many tables as the field needs. Tables
+        play hands_per_step hands at a time in worker processes, every table at the
+        same blind level. Between steps the coordinator eliminates players who cannot
+        pay the next level, breaks tables once the field fits on fewer of them and
+        moves players so table sizes differ by at most one. Tables only send back a
+        (id, strategy, bank) record per player, so the coordinator's work is per step
+        and per player rather than per hand.
+
+        Args:
+            strategies (list[str]): strategy of each entrant, entrants get ids 1, 2, ...
+            bank (int, optional): starting bank. Defaults to 1000.
+            table_size (int, optional): most players per table. Defaults to 9.
+            schedule (BlindSchedule, optional): blind levels by hands played per table or by
+                seconds. Defaults to None, see default_schedule().
+            hands_per_step (int, optional): hands each table plays between balancing. Defaults to 10.
+            workers (int, optional): worker processes, 1 runs in this process. Defaults to None,
+                one per CPU.
+            seed (int, optional): seed of the seating, decks and decisions. Defaults to 0.
+
+        Raises:
+            ValueError: raised for fewer than two entrants or an invalid table size
+        """
+        if len(strategies) < 2:
+            raise ValueError('Please pass at least two entrants')
+        if not (MIN_SEATS <= table_size <= MAX_SEATS):
+            raise ValueError(f'Please pass a table size between {MIN_SEATS} and {MAX_SEATS}')
+
+        self.entrants = [Entrant(idx + 1, strategy, bank) for idx, strategy in enumerate(strategies)]
+        self.table_size = table_size
+        self.schedule = schedule if schedule is not None else default_schedule(bank)
+        self.hands_per_step = hands_per_step
+        self.workers = workers
+        self.seed = seed
+
+        # results of the last run
+        self.standings = []
+        self.eliminated = []
+        self.steps = 0
+        self.hands = 0
+        self.coordinator_seconds = 0.0
+
+
+    def run(self) -> list[Entrant]:
+        """
+        Method to play the tournament until one player is left
+
+        Returns:
+            list[Entrant]: standings, best first, with the banks players finished with
+        """
+        rng = rd.Random(self.seed)
+        field = list(self.entrants)
+        rng.shuffle(field)
+        n_tables = math.ceil(len(field) / self.table_size)
+        tables = {table_id: field[table_id::n_tables] for table_id in range(n_tables)}
+        buttons = {table_id: 0 for table_id in tables}
+
+        self.eliminated = []
+        self.steps = 0
+        self.hands = 0
+        self.coordinator_seconds = 0.0
+        start = time.monotonic()
+
+        with worker_pool(self.workers) as pool:
+            while sum(len(seats) for seats in tables.values()) > 1:
+                hands_played = self.steps * self.hands_per_step
+                level = self.schedule.level(hands_played, time.monotonic() - start)
+                jobs = [(table_id, tuple(seats), buttons[table_id], level, self.hands_per_step,
+                         f'{self.seed}:{self.steps}:{table_id}')
+                        for table_id, seats in tables.items() if len(seats) >= 2]
+                chunksize = max(1, len(jobs) // (4 * (self.workers or 8)))
+                results = list(pool.map(_play_table, jobs, chunksize=chunksize))
+
+                coordinator_start = time.perf_counter()
+                next_level = self.schedule.level(hands_played + self.hands_per_step, time.monotonic() - start)
+                self._collect(results, tables, buttons, next_level)
+                self._balance(tables, buttons)
+                self.steps += 1
+                self.coordinator_seconds += time.perf_counter() - coordinator_start
+
+        winners = [entrant for seats in tables.values() for entrant in seats]
+        self.standings = winners + self.eliminated[::-1]
+        return self.standings
+
+
+    def prizes(self, payouts:list[float]) -> dict:
+        """
+        Method to get the prize of each entrant from the last run's standings
+
+        Args:
+            payouts (list[float]): prize of each place, first place first
+
+        Returns:
+            dict: entrant id -> prize
+        """
+        return prize_payouts(self.standings, payouts)
+
+
+    def _collect(self, results:list[TableResult], tables:dict, buttons:dict, next_level:BlindLevel) -> None:
+        """
+        Helper method to take the tables' results and eliminate players. Players out
+        in the same step are placed by the hand they went out in and then by bank.
+
+        Args:
+            results (list[TableResult]): results of the step
+            tables (dict): table id -> seated entrants, updated in place
+            buttons (dict): table id -> button position, updated in place
+            next_level (BlindLevel): level of the next step
+        """
+        threshold = next_level.big_blind + next_level.ante
+        out = []
+        for result in results:
+            self.hands += result.hands
+            buttons[result.table_id] = result.button
+            out.extend(result.busted)
+            # players who cannot pay the next level go out after every hand of this step
+            out.extend((self.hands_per_step, entrant) for entrant in result.seats if entrant.bank <= threshold)
+            tables[result.table_id] = [entrant for entrant in result.seats if entrant.bank > threshold]
+
+        out.sort(key=lambda bust: (bust[0], bust[1].bank))
+        self.eliminated.extend(entrant for _, entrant in out)
+
+
+    def _balance(self, tables:dict, buttons:dict) -> None:
+        """
+        Helper method to break tables the field no longer needs and move players from
+        the fullest tables to the emptiest until sizes differ by at most one
+
+        Args:
+            tables (dict): table id -> seated entrants, updated in place
+            buttons (dict): table id -> button position, updated in place
+        """
+        n_players = sum(len(seats) for seats in tables.values())
+        n_needed = max(1, math.ceil(n_players / self.table_size))
+        while len(tables) > n_needed:
+            broken = min(tables, key=lambda table_id: len(tables[table_id]))
+            moving = tables.pop(broken)
+            del buttons[broken]
+            for entrant in moving:
+                emptiest = min(tables, key=lambda table_id: len(tables[table_id]))
+                tables[emptiest].append(entrant)
+
+        while True:
+            fullest = max(tables, key=lambda table_id: len(tables[table_id]))
+            emptiest = min(tables, key=lambda table_id: len(tables[table_id]))
+            if len(tables[fullest]) - len(tables[emptiest]) <= 1:
+                break
+            tables[emptiest].append(tables[fullest].pop())
+
+
+
+def default_schedule(bank:int) -> BlindSchedule:
+    """
+    Function to get a schedule that starts at a big blind of 2% of the bank and goes
+    up by half every level of 10 hands, with antes from the fourth level
+
+    Args:
+        bank (int): starting bank
+
+    Returns:
+        BlindSchedule: schedule by hands
+    """
+    levels = []
+    big_blind = max(2, bank // 50)
+    for idx in range(40):
+        big_blind = big_blind + big_blind % 2
+        levels.append(BlindLevel(big_blind // 2, big_blind, big_blind // 10 if idx >= 3 else 0, 10))
+        big_blind = int(big_blind * 1.5)
+    return BlindSchedule(levels)
+
+
+def _play_table(job:tuple) -> TableResult:
+    """
+    Helper function for worker processes that plays a table for a step. The table's
+    decks and decisions use their own seeded generator, not the random module.
+
+    Args:
+        job (tuple): (table id, seated entrants, button, level, hands, seed)
+
+    Returns:
+        TableResult: entrants still seated with their banks, the next button position,
+            hands played and the (hand, entrant) of each player who went out
+    """
+    table_id, seats, button, level, n_hands, seed = job
+    rng = rd.Random(seed)
+    deck = Deck(rng=rng)
+    players = []
+    for entrant in seats:
+        player = Player(entrant.bank, entrant.id, entrant.strategy)
+        player.rng = rng
+        players.append(player)
+
+    threshold = level.big_blind + level.ante
+    busted = []
+    round = None
+    hands = 0
+    for hand_no in range(n_hands):
+        # only making a new list when someone is out so the round keeps its seat map
+        out = [player for player in players if player.bank <= threshold]
+        if len(out) > 0:
+            busted.extend((hand_no, Entrant(player.id, player.strategy, player.bank))
+                          for player in sorted(out, key=lambda player: player.bank))
+            players = [player for player in players if player.bank > threshold]
+        if len(players) < 2:
+            break
+
+        GameRound.seat_players(players, button)
+        if round is None:
+            round = GameRound(players, level.small_blind, level.big_blind, verbose=False, ante=level.ante)
+            round.deck = deck
+        else:
+            round.reset(players, level.small_blind, level.big_blind, level.ante)
+        round.play()
+        button = (button + 1) % len(players)
+        hands += 1
+
+    seated = tuple(Entrant(player.id, player.strategy, player.bank) for player in players)
+    return TableResult(table_id, seated, button, hands, tuple(busted))
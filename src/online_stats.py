@@ -0,0 +1,215 @@
+"""
+This file defines running statistics that are updated one value at a time in
+constant memory, for results that are summarized while they are being produced.
+"""
+
+import math
+
+
+class RunningStats:
+    def __init__(self):
+        """
+        This class keeps the count, mean and variance of a stream of values with
+        Welford's algorithm, which stays accurate over long runs.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+
+    def add(self, value:float) -> None:
+        """
+        Method to add a value to the stream
+
+        Args:
+            value (float): next value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+
+    def merge(self, other:"RunningStats") -> None:
+        """
+        Method to fold another stream's statistics into this one, e.g. from a worker process
+
+        Args:
+            other (RunningStats): statistics of the other stream
+        """
+        if other.count == 0:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+
+
+    @property
+    def variance(self) -> float:
+        """
+        Sample variance, nan for fewer than two values
+        """
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+
+    @property
+    def std_error(self) -> float:
+        """
+        Standard error of the mean, inf for fewer than two values
+        """
+        if self.count < 2:
+            return math.inf
+        return math.sqrt(self.variance / self.count)
+
+
+    def interval(self, z:float) -> tuple:
+        """
+        Method to get a normal confidence interval of the mean
+
+        Args:
+            z (float): critical value, e.g. 1.96 for 95%
+
+        Returns:
+            tuple: (low, high)
+        """
+        half_width = z * self.std_error
+        return (self.mean - half_width, self.mean + half_width)
+
+
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy:float = 0.01, max_buckets:int = 2048):
+        """
+        This class estimates quantiles of a stream of values in bounded memory,
+        following DDSketch: values are counted in buckets whose bounds grow
+        geometrically, so every quantile is returned within a relative error of
+        the true value. Sketches with the same accuracy merge exactly.
+
+        Args:
+            relative_accuracy (float, optional): relative error of quantiles. Defaults to 0.01.
+            max_buckets (int, optional): most buckets per sign, the buckets nearest zero are
+                combined past it, which only affects the smallest magnitudes. Defaults to 2048.
+
+        Raises:
+            ValueError: raised if relative_accuracy is not between 0 and 1
+        """
+        if not (0 < relative_accuracy < 1):
+            raise ValueError('Please pass a relative accuracy between 0 and 1')
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.zeros = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}
+        self._negative = {}
+
+
+    def add(self, value:float, count:int = 1) -> None:
+        """
+        Method to add a value to the stream
+
+        Args:
+            value (float): next value
+            count (int, optional): times the value is added. Defaults to 1.
+        """
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value == 0:
+            self.zeros += count
+            return
+
+        store = self._positive if value > 0 else self._negative
+        key = math.ceil(math.log(abs(value)) / self._log_gamma)
+        store[key] = store.get(key, 0) + count
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+
+    def merge(self, other:"QuantileSketch") -> None:
+        """
+        Method to fold another stream's sketch into this one, e.g. from a worker process
+
+        Args:
+            other (QuantileSketch): sketch of the other stream
+
+        Raises:
+            ValueError: raised if the sketches have different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('Only sketches with the same relative accuracy can be merged')
+
+        self.count += other.count
+        self.zeros += other.zeros
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for store, other_store in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+            while len(store) > self.max_buckets:
+                self._collapse(store)
+
+
+    def quantile(self, q:float) -> float:
+        """
+        Method to estimate a quantile
+
+        Args:
+            q (float): quantile between 0 and 1, e.g. 0.5 for the median
+
+        Raises:
+            ValueError: raised if q is not between 0 and 1
+
+        Returns:
+            float: estimate, nan for an empty stream
+        """
+        if not (0 <= q <= 1):
+            raise ValueError('Please pass a quantile between 0 and 1')
+        if self.count == 0:
+            return math.nan
+        # the ends are kept exactly
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+        # values in increasing order: negatives by decreasing magnitude, zeros, positives
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return max(self.min, -self._value(key))
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return min(self.max, self._value(key))
+        return self.max
+
+
+    def _value(self, key:int) -> float:
+        """
+        Helper method to get the value a bucket stands for, within the relative accuracy of all its values
+        """
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+    @staticmethod
+    def _collapse(store:dict) -> None:
+        """
+        Helper method to combine the two buckets nearest zero
+        """
+        lowest, second = sorted(store)[0:2]
+        store[second] += store.pop(lowest)
@@ -0,0 +1,272 @@
+"""
+This file defines a recorder that tracks how each player plays, the usual table
+statistics (VPIP, PFR, aggression factor, fold to bet, showdown frequency), updated
+with a few counters per action so bots can adapt to their opponents.
+"""
+
+from .recorder import HandRecorder
+
+_VOLUNTARY = ('fold', 'check', 'call', 'raise')
+
+
+class PlayerStats:
+    __slots__ = ('hands', 'vpip_hands', 'pfr_hands', 'raises', 'calls', 'bets_faced',
+                 'folds_to_bet', 'flops_seen', 'showdowns', 'showdowns_won')
+
+    def __init__(self, *counts:int):
+        """
+        This class holds one player's counters, the statistics are ratios of them.
+        Counters are plain ints so they can be snapshotted and merged.
+
+        Args:
+            *counts (int): counters in __slots__ order, all zero if not passed
+        """
+        counts = counts if counts else (0,) * len(self.__slots__)
+        for name, value in zip(self.__slots__, counts):
+            setattr(self, name, value)
+
+
+    def merge(self, other:"PlayerStats") -> None:
+        """
+        Method to add another tracker's counters for the same player, e.g. from a worker process
+
+        Args:
+            other (PlayerStats): counters to add
+        """
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+    def counts(self) -> tuple:
+        """
+        Method to get the counters in __slots__ order
+
+        Returns:
+            tuple: counters
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+    @property
+    def vpip(self) -> float:
+        """
+        Share of hands the player put chips in voluntarily before the flop
+        """
+        return _ratio(self.vpip_hands, self.hands)
+
+
+    @property
+    def pfr(self) -> float:
+        """
+        Share of hands the player raised before the flop
+        """
+        return _ratio(self.pfr_hands, self.hands)
+
+
+    @property
+    def aggression_factor(self) -> float:
+        """
+        Raises per call, inf for a player who raised but never called
+        """
+        if self.calls == 0:
+            return float('inf') if self.raises > 0 else 0.0
+        return self.raises / self.calls
+
+
+    @property
+    def fold_to_bet(self) -> float:
+        """
+        Share of bets faced after the flop that the player folded to
+        """
+        return _ratio(self.folds_to_bet, self.bets_faced)
+
+
+    @property
+    def showdown_frequency(self) -> float:
+        """
+        Share of hands the player saw the flop in that went to a showdown
+        """
+        return _ratio(self.showdowns, self.flops_seen)
+
+
+    @property
+    def showdown_win_rate(self) -> float:
+        """
+        Share of showdowns the player won at least part of the pot in
+        """
+        return _ratio(self.showdowns_won, self.showdowns)
+
+
+    def __repr__(self) -> str:
+        return (f'PlayerStats(hands={self.hands}, vpip={self.vpip:.2f}, pfr={self.pfr:.2f}, '
+                f'af={self.aggression_factor:.2f}, fold_to_bet={self.fold_to_bet:.2f}, '
+                f'wtsd={self.showdown_frequency:.2f})')
+
+
+
+class OpponentStats(HandRecorder):
+    def __init__(self):
+        """
+        This class follows the hands of the GameRounds it is passed to (as a recorder)
+        and keeps a PlayerStats per player id. Each action costs a few counter updates
+        and memory is fixed per player, whatever the number of hands.
+        """
+        self.players = {}
+
+        # state of the hand being played: flags per player and the street's highest bet
+        self._vpip = set()
+        self._pfr = set()
+        self._flop = set()
+        self._high_bet = 0
+
+
+    def __getitem__(self, player_id:int) -> PlayerStats:
+        """
+        Method to get a player's statistics, empty if the player has not been seen
+
+        Args:
+            player_id (int): player id
+
+        Returns:
+            PlayerStats: the player's statistics
+        """
+        return self.players.get(player_id, PlayerStats())
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Method to clear the hand flags
+
+        Args:
+            round (GameRound): round being played
+        """
+        self._vpip.clear()
+        self._pfr.clear()
+        self._flop.clear()
+        self._high_bet = 0
+
+
+    def log_action(self, round, player, action:str, amount:int) -> None:
+        """
+        Method to count an action
+
+        Args:
+            round (GameRound): round being played
+            player (Player): acting player
+            action (str): action name, see HandRecorder.log_action
+            amount (int): chips put in the pot by the action
+        """
+        if action in _VOLUNTARY:
+            stats = self._stats(player.id)
+            preflop = len(round.community_cards) == 0
+            # actions are logged after the chips go in, so the bet before the action is bet_amount - amount
+            facing_bet = self._high_bet > player.bet_amount - amount
+
+            if action == 'raise':
+                stats.raises += 1
+            elif action == 'call':
+                stats.calls += 1
+
+            if preflop:
+                if action in ('call', 'raise'):
+                    self._vpip.add(player.id)
+                if action == 'raise':
+                    self._pfr.add(player.id)
+            elif facing_bet:
+                stats.bets_faced += 1
+                if action == 'fold':
+                    stats.folds_to_bet += 1
+
+        self._high_bet = max(self._high_bet, player.bet_amount)
+
+
+    def log_deal(self, round, cards:list) -> None:
+        """
+        Method to start a new street, the players still in see the flop
+
+        Args:
+            round (GameRound): round being played
+            cards (list[Card]): cards added to the board
+        """
+        self._high_bet = 0
+        if len(round.community_cards) == 3:
+            self._flop.update(player.id for player in round.players if player._active is True)
+
+
+    def end_hand(self, round) -> None:
+        """
+        Method to count the finished hand for every player at the table
+
+        Args:
+            round (GameRound): round being played
+        """
+        showdown = len(round._active_players) >= 2
+        winners = {player.id for player in round.winners}
+        for player in round.players:
+            stats = self._stats(player.id)
+            at_showdown = showdown and (player in round._active_players)
+            stats.hands += 1
+            stats.vpip_hands += player.id in self._vpip
+            stats.pfr_hands += player.id in self._pfr
+            # with equity runouts a hand can be settled before the flop is dealt, the players
+            # still in when betting closed are counted as seeing it
+            stats.flops_seen += (player.id in self._flop) or at_showdown
+            if at_showdown:
+                stats.showdowns += 1
+                stats.showdowns_won += player.id in winners
+
+
+    def snapshot(self) -> dict:
+        """
+        Method to get a copy of the counters that can be pickled, e.g. to send from a worker process
+
+        Returns:
+            dict: player id -> counters tuple, see PlayerStats.counts()
+        """
+        return {player_id: stats.counts() for player_id, stats in self.players.items()}
+
+
+    def merge(self, other) -> None:
+        """
+        Method to add another tracker's counters
+
+        Args:
+            other (OpponentStats | dict): tracker or snapshot to add
+        """
+        snapshot = other.snapshot() if isinstance(other, OpponentStats) else other
+        for player_id, counts in snapshot.items():
+            self._stats(player_id).merge(PlayerStats(*counts))
+
+
+    @classmethod
+    def from_snapshot(cls, snapshot:dict) -> "OpponentStats":
+        """
+        Method to rebuild a tracker from a snapshot
+
+        Args:
+            snapshot (dict): see snapshot()
+
+        Returns:
+            OpponentStats: tracker with the snapshot's counters
+        """
+        tracker = cls()
+        tracker.merge(snapshot)
+        return tracker
+
+
+    def _stats(self, player_id:int) -> PlayerStats:
+        """
+        Helper method to get a player's counters, creating them the first time
+        """
+        stats = self.players.get(player_id)
+        if stats is None:
+            stats = self.players[player_id] = PlayerStats()
+        return stats
+
+
+
+def _ratio(count:int, total:int) -> float:
+    """
+    Helper function to divide counters, 0 when nothing was counted
+    """
+    return count / total if total > 0 else 0.0
@@ -0,0 +1,26 @@
+"""
+This file defines a sub-class to the player class whose strategy is given by its parameters
+"""
+
+from .player import Player, StrategyParams
+
+class ParamPlayer(Player):
+    def __init__(self, starting_bank:int, id:int, params:StrategyParams, name:str = 'param'):
+        """
+        A subclass of player that plays like the computer strategies with its own
+        action weights and bet cap instead of a named strategy's.
+
+        Args:
+            starting_bank (int): starting bank amount
+            id (int): numeric ID
+            params (StrategyParams): relative check/bet/fold weights and the largest
+                raise as a share of the bank
+            name (str, optional): strategy name used in results. Defaults to 'param'.
+        """
+        super().__init__(starting_bank, id, name)
+        self._params = params
+        
+        
+    @property
+    def params(self) -> StrategyParams:
+        return self._params
@@ -5,8 +5,26 @@ game.
 
 import random as rd
 
+from typing import NamedTuple
+
 from .hand import Hand
 
+
+class StrategyParams(NamedTuple):
+    check: float
+    bet: float
+    fold: float
+    bet_cap: float
+
+
+# relative action weights and the largest raise as a share of the bank
+STRATEGIES = {
+    'strict': StrategyParams(0.90, 0.05, 0.05, 0.05),
+    'soft': StrategyParams(0.70, 0.25, 0.05, 0.1),
+    'rand': StrategyParams(0.34, 0.33, 0.33, 0.15),
+}
+
+
 class Player:
     def __init__(self, starting_bank:int, id:int, strategy:str = 'strict'):
         """
@@ -36,6 +54,9 @@ class Player:
         # amount to pass along with bet
         self.bet_amount =  0
         
+        # random generator for decisions, None uses the random module
+        self.rng = None
+        
         
         
     def bet(self, amount:int):
@@ -82,21 +103,30 @@ class Player:
         
         actions = ['check', 'bet', 'fold']
         
-        if self._strategy == 'strict':
-            weight = [0.90, 0.05, 0.05]
-            bet_max = int(self.bank * 0.05)
-        elif self._strategy == 'soft':
-            weight = [0.70, 0.25, 0.05]
-            bet_max = int(self.bank * 0.1)
-        elif self._strategy == 'rand':
-            weight = [0.34, 0.33, 0.33]
-            bet_max = int(self.bank * 0.15)
+        params = self.params
+        weight = [params.check, params.bet, params.fold]
+        bet_max = int(self.bank * params.bet_cap)
    
-        self.action_str = rd.choices(actions, weight)[0]    
-        return rd.randint(min_bet, min_bet + bet_max)
+        rng = self.rng if self.rng is not None else rd
+        self.action_str = rng.choices(actions, weight)[0]    
+        return rng.randint(min_bet, min_bet + bet_max)
     
         
         
+    def observe(self, community_cards:list, n_opponents:int, pot:int, call_amt:int) -> None:
+        """
+        Method called by the round before every get_action with what the player can
+        see at the table. The fixed weight strategies ignore it.
+
+        Args:
+            community_cards (list[Card]): cards on the board
+            n_opponents (int): opponents still in the hand
+            pot (int): chips in the pot
+            call_amt (int): chips needed to call
+        """
+        return None
+        
+        
     def _set_action(self, action_str: str) -> None:
         """
         Action str to pass to round to specify action
@@ -179,6 +209,14 @@ class Player:
         self._hand = value
         
         
+    @property
+    def params(self) -> StrategyParams:
+        """
+        Action weights and bet cap of the player's strategy
+        """
+        return STRATEGIES[self._strategy]
+        
+        
     @property
     def strategy(self):
         return self._strategy
@@ -0,0 +1,37 @@
+"""
+This file defines the worker pools that parallel searches and tournaments map their
+jobs over: a process pool, or a stand in that runs the jobs in this process.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+class InProcessPool:
+    """
+    Stand in for a process pool that runs jobs in this process
+    """
+    def map(self, function, jobs, chunksize:int = 1):
+        return map(function, jobs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+
+def worker_pool(workers:int = None):
+    """
+    Function to get a pool to map jobs over
+
+    Args:
+        workers (int, optional): worker processes, 1 runs the jobs in this process. Defaults to None,
+            one per CPU.
+
+    Returns:
+        ProcessPoolExecutor | InProcessPool: pool, used as a context manager
+    """
+    if workers == 1:
+        return InProcessPool()
+    return ProcessPoolExecutor(workers)
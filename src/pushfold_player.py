@@ -0,0 +1,77 @@
+"""
+This file defines a sub-class to the player class that plays solved push/fold strategies
+"""
+
+import random as rd
+
+from .cfr import PushFoldTable, hand_class
+from .player import Player
+
+class PushFoldPlayer(Player):
+    def __init__(self, starting_bank:int, id:int, table:PushFoldTable, name:str = 'pushfold'):
+        """
+        A subclass of player for short stacks that only goes all in or folds before
+        the flop, following a PushFoldTable solved for heads-up play: unopened pots
+        are pushed with the small blind strategy and all ins are called with the big
+        blind strategy. The stack depth is the player's own stack in big blinds.
+
+        Args:
+            starting_bank (int): starting bank amount
+            id (int): numeric ID
+            table (PushFoldTable): solved strategies, see PushFoldSolver
+            name (str, optional): strategy name used in results. Defaults to 'pushfold'.
+        """
+        super().__init__(starting_bank, id, name)
+        self.table = table
+
+        # what the player last saw at the table, see observe()
+        self._table = ([], 1, 0, 0)
+
+
+    def observe(self, community_cards:list, n_opponents:int, pot:int, call_amt:int) -> None:
+        """
+        Method to remember what the player can see before a decision
+
+        Args:
+            community_cards (list[Card]): cards on the board
+            n_opponents (int): opponents still in the hand
+            pot (int): chips in the pot
+            call_amt (int): chips needed to call
+        """
+        self._table = (community_cards, n_opponents, pot, call_amt)
+
+
+    def get_action(self, min_bet:int) -> int:
+        """
+        This method looks the hand up in the table, one lookup per decision.
+
+        Args:
+            min_bet (int): big blind
+
+        Returns:
+            int: the whole bank when going all in
+        """
+        board, _, _, call_amt = self._table
+        rng = self.rng if self.rng is not None else rd
+
+        # hands that reach the flop are checked down
+        if len(board) > 0:
+            self.action_str = 'check' if call_amt == 0 else 'fold'
+            return min_bet
+
+        stack_bb = (self.bank + self.bet_amount) / min_bet
+        cards = self.hand.cards
+        hand_idx = hand_class(cards[0].card_id, cards[1].card_id)
+
+        # the pot was raised, call the all in or fold
+        if self.bet_amount + call_amt > min_bet:
+            calls = rng.random() < self.table.call_probability(stack_bb, hand_idx)
+            self.action_str = 'check' if calls else 'fold'
+            return min_bet
+
+        if rng.random() < self.table.push_probability(stack_bb, hand_idx):
+            self.action_str = 'bet'
+            return self.bank
+
+        self.action_str = 'check' if call_amt == 0 else 'fold'
+        return min_bet
@@ -0,0 +1,73 @@
+"""
+This file defines the HandRecorder base class, which receives events from GameRound and Dealer
+"""
+
+
+class HandRecorder:
+    """
+    Base class for objects that want to follow what happens in a hand (loggers,
+    exporters, statistics). GameRound calls the hand hooks as the hand is played
+    and Dealer calls the game hooks, sub-classes override the ones they need.
+    """
+    def begin_game(self, dealer) -> None:
+        """
+        Called by the Dealer once players are seated, before the first round.
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        pass
+
+
+    def end_game(self, dealer) -> None:
+        """
+        Called by the Dealer when the game is over.
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        pass
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Called when a round is set up, before blinds are taken.
+
+        Args:
+            round (GameRound): round being played
+        """
+        pass
+
+
+    def log_action(self, round, player, action:str, amount:int) -> None:
+        """
+        Called for every ante, blind and betting action.
+
+        Args:
+            round (GameRound): round being played
+            player (Player): acting player
+            action (str): 'ante', 'small_blind', 'large_blind', 'fold', 'check', 'call' or 'raise'
+            amount (int): chips put in the pot by this action
+        """
+        pass
+
+
+    def log_deal(self, round, cards:list) -> None:
+        """
+        Called when community cards are dealt.
+
+        Args:
+            round (GameRound): round being played
+            cards (list[Card]): cards added to the board
+        """
+        pass
+
+
+    def end_hand(self, round) -> None:
+        """
+        Called once the pot has been paid out.
+
+        Args:
+            round (GameRound): round being played
+        """
+        pass
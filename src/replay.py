@@ -0,0 +1,119 @@
+"""
+This file defines the HandReplayer, which rebuilds GameRound state from recorded hands
+"""
+
+from .card import Card
+from .deck import Deck
+from .hand import Hand
+from .history import HandRecord
+from .player import Player
+from .round import GameRound
+
+
+class HandReplayer:
+    def __init__(self, history):
+        """
+        This class reconstructs the state of a recorded hand at any action by
+        applying only that hand's actions to fresh objects, so nothing before
+        the hand has to be simulated again.
+
+        Args:
+            history (IndexedHandHistory): random access history to replay from
+        """
+        self.history = history
+
+
+    def state_at(self, position:int, action_idx:int = None) -> GameRound:
+        """
+        Method to get the round state of a hand after a number of its actions.
+
+        Args:
+            position (int): hand position in the history file
+            action_idx (int, optional): number of actions to apply, None replays the
+                full hand including the payout. Defaults to None.
+
+        Returns:
+            GameRound: round with players, banks, pot, board and deck as they were
+        """
+        return self.replay(self.history.hand(position), action_idx)
+
+
+    @staticmethod
+    def replay(hand:HandRecord, action_idx:int = None) -> GameRound:
+        """
+        Method to rebuild a round from a hand record.
+
+        Args:
+            hand (HandRecord): recorded hand
+            action_idx (int, optional): number of actions to apply, None replays the
+                full hand including the payout. Defaults to None.
+
+        Returns:
+            GameRound: round with players, banks, pot, board and deck as they were
+        """
+        players = []
+        for seat in hand.seats:
+            player = Player(seat.bank, seat.player_id)
+            player.hand = Hand([Card.from_id(card) for card in seat.hole])
+            player._active = True
+            players.append(player)
+
+        round = GameRound(players, hand.small_blind, hand.large_blind, verbose=False)
+
+        # deck holds the unseen cards with the recorded board on top in deal order
+        seen = set(hand.board).union(*[seat.hole for seat in hand.seats])
+        round.deck = Deck()
+        round.deck.cards = [card for card in round.deck.cards if card.card_id not in seen]
+        round.deck.cards.extend(Card.from_id(card) for card in reversed(hand.board))
+
+        actions = hand.actions if action_idx is None else hand.actions[0:action_idx]
+        for action in actions:
+            HandReplayer._apply(round, action)
+
+        round._active_players = [player for player in players if player._active]
+        if action_idx is None:
+            payouts = [0] * len(players)
+            for seat, payout in zip(hand.winners, hand.payouts):
+                payouts[seat] = payout
+            round._pay(payouts, set(hand.winners))
+
+        round._refresh_state()
+        return round
+
+
+    @staticmethod
+    def _apply(round:GameRound, action) -> None:
+        """
+        Helper method to apply one recorded action to a round
+
+        Args:
+            round (GameRound): round being rebuilt
+            action (ActionRecord): recorded action
+        """
+        if action.action == 'deal':
+            round._deal_cards(action.amount, False)
+            # new street, bets and actions start over
+            for player in round.players:
+                player._clear_action()
+                player._clear_bet_amount()
+            return
+
+        player = round.players[action.seat]
+        if action.action == 'ante':
+            # antes do not count towards the player's bet
+            player.bank = player.bank - action.amount
+            round.pot = round.pot + action.amount
+            round.contributions[action.seat] += action.amount
+            return
+        if action.action == 'small_blind':
+            player.blind = 'small'
+        elif action.action == 'large_blind':
+            player.blind = 'large'
+        elif action.action == 'fold':
+            player._active = False
+        else:
+            player.action_str = 'bet' if action.action == 'raise' else 'check'
+
+        player.bet(action.amount)
+        round.pot = round.pot + action.amount
+        round.contributions[action.seat] += action.amount
@@ -0,0 +1,271 @@
+"""
+This file defines a columnar results exporter backed by NumPy arrays and a
+memory-mapped reader for aggregate queries over the exported results.
+
+A results directory holds one sub-directory per table ('hands' and 'players'),
+one raw little endian binary file per column, and a schema.json with column
+dtypes, row counts and the strategy code table.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .recorder import HandRecorder
+
+NO_HAND_TYPE = -1
+
+HAND_COLUMNS = {
+    'hand_no': '<i8',
+    'small_blind': '<i8',
+    'large_blind': '<i8',
+    'pot': '<i8',
+    'n_players': '<u1',
+    'n_winners': '<u1',
+    'first_winner_id': '<i4',
+    'hand_type': '<i1',
+}
+
+PLAYER_COLUMNS = {
+    'hand_no': '<i8',
+    'player_id': '<i4',
+    'strategy': '<u2',
+    'hand_type': '<i1',
+    'is_winner': '<u1',
+    'bank_delta': '<i8',
+    'bank': '<i8',
+}
+
+
+class _ColumnBuffer:
+    def __init__(self, directory:str, columns:dict, chunk_size:int):
+        """
+        This class keeps one preallocated chunk per column and appends full
+        chunks to the column files, so memory use does not grow with the run.
+
+        Args:
+            directory (str): table directory
+            columns (dict): column name -> numpy dtype string
+            chunk_size (int): rows per chunk
+        """
+        self.directory = directory
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._fill = 0
+        self._chunks = {name: np.empty(chunk_size, dtype=dtype) for name, dtype in columns.items()}
+        os.makedirs(directory, exist_ok=True)
+
+        # column files left by an export that never wrote its schema are started over, not appended to
+        for name in columns:
+            open(os.path.join(directory, f'{name}.bin'), 'wb').close()
+
+
+    def append(self, row:tuple) -> None:
+        """
+        Method to add a row, in column order, flushing when the chunk is full
+
+        Args:
+            row (tuple): column values
+        """
+        for chunk, value in zip(self._chunks.values(), row):
+            chunk[self._fill] = value
+        self._fill += 1
+        if self._fill == self.chunk_size:
+            self.flush()
+
+
+    def flush(self) -> None:
+        """
+        Method to append the filled part of the chunk to the column files
+        """
+        if self._fill == 0:
+            return
+
+        for name, chunk in self._chunks.items():
+            with open(os.path.join(self.directory, f'{name}.bin'), 'ab') as file:
+                file.write(chunk[0:self._fill].tobytes())
+        self.rows += self._fill
+        self._fill = 0
+
+
+
+class ResultsExporter(HandRecorder):
+    def __init__(self, directory:str, chunk_size:int = 65536):
+        """
+        This class records per-hand and per-player results of every hand
+        played by the GameRounds it is passed to (as a recorder) into a
+        columnar results directory.
+
+        Args:
+            directory (str): results directory, created if missing
+            chunk_size (int, optional): rows kept in memory per column before
+                they are written. Defaults to 65536.
+
+        Raises:
+            ValueError: raised if the directory already holds results
+        """
+        self.directory = str(directory)
+        if os.path.exists(os.path.join(self.directory, 'schema.json')):
+            raise ValueError(f'{self.directory} already holds exported results')
+
+        self.strategies = {}
+        self._hands = _ColumnBuffer(os.path.join(self.directory, 'hands'), HAND_COLUMNS, chunk_size)
+        self._players = _ColumnBuffer(os.path.join(self.directory, 'players'), PLAYER_COLUMNS, chunk_size)
+        self._banks = None
+        self._hand_no = 0
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Method to save starting banks for the bank deltas
+
+        Args:
+            round (GameRound): round being played
+        """
+        self._banks = [player.bank for player in round.players]
+
+
+    def end_hand(self, round) -> None:
+        """
+        Method to add the finished hand's rows
+
+        Args:
+            round (GameRound): round being played
+        """
+        # hand types were set on the hands by WinnerFinder, only meaningful at a showdown
+        showdown = round._active_players if len(round._active_players) >= 2 else []
+        hand_types = {id(player): player.hand._type_int for player in showdown}
+        winners = {id(player) for player in round.winners}
+
+        best_type = max(hand_types.values(), default=NO_HAND_TYPE)
+        self._hands.append((self._hand_no, round.small_blind_amt, round.large_blind_amt, round.pot,
+                            len(round.players), len(round.winners), round.winners[0].id, best_type))
+
+        for player, bank in zip(round.players, self._banks):
+            self._players.append((self._hand_no,
+                                  player.id,
+                                  self._strategy_code(player.strategy),
+                                  hand_types.get(id(player), NO_HAND_TYPE),
+                                  id(player) in winners,
+                                  player.bank - bank,
+                                  player.bank))
+        self._hand_no += 1
+
+
+    def _strategy_code(self, strategy:str) -> int:
+        """
+        Helper method to map a strategy name to a small integer code
+
+        Args:
+            strategy (str): strategy name
+
+        Raises:
+            ValueError: raised if there are more strategies than the strategy column can code
+
+        Returns:
+            int: strategy code
+        """
+        code = self.strategies.get(strategy)
+        if code is None:
+            code = len(self.strategies)
+            if code > np.iinfo(PLAYER_COLUMNS['strategy']).max:
+                raise ValueError(f'Cannot export more than {code} strategies')
+            self.strategies[strategy] = code
+        return code
+
+
+    def flush(self) -> None:
+        """
+        Method to write buffered rows and the schema so results can be read
+        """
+        self._hands.flush()
+        self._players.flush()
+        schema = {
+            'hands': {'rows': self._hands.rows, 'columns': HAND_COLUMNS},
+            'players': {'rows': self._players.rows, 'columns': PLAYER_COLUMNS},
+            'strategies': self.strategies,
+        }
+        with open(os.path.join(self.directory, 'schema.json'), 'w') as file:
+            json.dump(schema, file, indent=1)
+
+
+    def close(self) -> None:
+        """
+        Method to write anything left in memory
+        """
+        self.flush()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+
+class ResultsReader:
+    def __init__(self, directory:str):
+        """
+        This class memory-maps the columns of an exported results directory.
+        Columns are read only numpy arrays: reader.hands['pot'], reader.players['bank_delta'].
+
+        Args:
+            directory (str): results directory written by ResultsExporter
+        """
+        self.directory = str(directory)
+        with open(os.path.join(self.directory, 'schema.json')) as file:
+            schema = json.load(file)
+
+        self.strategies = schema['strategies']
+        self.hands = self._map_table('hands', schema['hands'])
+        self.players = self._map_table('players', schema['players'])
+
+
+    def _map_table(self, table:str, table_schema:dict) -> dict:
+        """
+        Helper method to memory-map every column of a table
+
+        Args:
+            table (str): table name
+            table_schema (dict): rows and column dtypes of the table
+
+        Returns:
+            dict: column name -> memory-mapped array
+        """
+        columns = {}
+        rows = table_schema['rows']
+        for name, dtype in table_schema['columns'].items():
+            path = os.path.join(self.directory, table, f'{name}.bin')
+            if rows == 0:
+                columns[name] = np.empty(0, dtype=dtype)
+            else:
+                columns[name] = np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+        return columns
+
+
+    def strategy_summary(self) -> dict:
+        """
+        Method to aggregate per-hand results by strategy.
+
+        Returns:
+            dict: strategy -> dict with hands played, hands won, total and mean bank delta
+        """
+        codes = self.players['strategy']
+        n_codes = len(self.strategies)
+        played = np.bincount(codes, minlength=n_codes)
+        won = np.bincount(codes, weights=self.players['is_winner'], minlength=n_codes)
+        delta = np.bincount(codes, weights=self.players['bank_delta'], minlength=n_codes)
+
+        summary = {}
+        for strategy, code in self.strategies.items():
+            summary[strategy] = {
+                'hands': int(played[code]),
+                'wins': int(won[code]),
+                'total_delta': int(delta[code]),
+                'mean_delta': float(delta[code] / played[code]) if played[code] else 0.0,
+            }
+        return summary
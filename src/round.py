@@ -3,87 +3,251 @@ This file defines a GameRound which represents the stages of a round in poker
 """
 
 from .deck import Deck
+from .hand import Hand
+from .equity import split_pot, expected_payouts, round_payouts
 from .winner import WinnerFinder
 from .player import Player
 from .human_player import HumanPlayer
+from .equity_player import EquityPlayer
+from .game_state import GameState
+from .seats import SeatMap
+from .variants import Variant, HOLDEM
+
+HIDDEN_CARDS = ('card 1', 'card 2')
 
 
 class GameRound:
     def __init__(self, 
                  players:list[Player], 
                  small_blind_amt:int, 
-                 large_blind_amt:int):
+                 large_blind_amt:int,
+                 recorders:list = None,
+                 verbose:bool = True,
+                 equity_runouts:bool = False,
+                 ante:int = 0,
+                 variant:Variant = None):
         """
         This class represents a typical game round of Texas HoldEm. It will be 
         used in conjunction with the Dealer class to run a Texas HoldEm game.
+        Omaha and short deck are dealt and settled by passing their variant.
+        
+        Players with an empty bank are all in: they stay in the hand without acting
+        and can only win the side pots they put chips in for.
 
         Args:
             players (list[Player]): list of players to play round.
             small_blind_amt (int): small blind amount (determined by Dealer).
             large_blind_amt (int): large blind amount (determined by Dealer).
+            recorders (list[HandRecorder], optional): recorders notified of hand events. Defaults to None.
+            verbose (bool, optional): print table talk to the terminal. Defaults to True.
+            equity_runouts (bool, optional): once betting is closed, settle the pot by each
+                player's exact equity instead of dealing the rest of the board. Defaults to False.
+            ante (int, optional): ante every player puts in before the blinds. Defaults to 0.
+            variant (Variant, optional): hole cards, deck and hand ranking, see variants.py.
+                Defaults to None, Texas Hold'em.
         """
+        self.variant = variant if variant is not None else HOLDEM
+        self.recorders = recorders if recorders is not None else []
+        self.verbose = verbose
+        self.equity_runouts = equity_runouts
+        self.community_cards = []
+        self.deck = None
+        self.state = GameState()
+        self._players = None
+        self.reset(players, small_blind_amt, large_blind_amt, ante)
+        
         
+    def reset(self, 
+              players:list[Player], 
+              small_blind_amt:int, 
+              large_blind_amt:int,
+              ante:int = 0) -> None:
+        """
+        Method to get the round ready for a new hand, reusing the deck, card lists
+        and game state instead of allocating new ones.
+
+        Args:
+            players (list[Player]): list of players to play round.
+            small_blind_amt (int): small blind amount (determined by Dealer).
+            large_blind_amt (int): large blind amount (determined by Dealer).
+            ante (int, optional): ante every player puts in before the blinds. Defaults to 0.
+        """
+        # seats are only looked up again when the table changed
+        if (players is not self._players) or (len(players) != len(self.seats)):
+            self._human = None
+            for player in players:
+                if isinstance(player, HumanPlayer) is True:
+                    self._human = player
+                # its equity estimates deal from the 52 card deck and rank by Hold'em
+                if isinstance(player, EquityPlayer) and (self.variant is not HOLDEM):
+                    raise ValueError(f'EquityPlayer cannot play {self.variant.name}')
+            self.seats = SeatMap(players)
+            
         self._players = players
         self._active_players = players
         self._small_blind_amt = small_blind_amt
         self._large_blind_amt = large_blind_amt
+        self.ante = ante
         self.pot = 0
-        self.community_cards = []
+        self.contributions = [0] * len(players)
+        self.community_cards.clear()
         self.winners = None
-
+        self.payouts = None
         
+        # the game state is then updated in place as events happen
+        self._refresh_state()
+
+
+    @staticmethod
+    def seat_players(players:list[Player], button:int = 0) -> None:
+        """
+        Method to get players ready for a new hand the way the Dealer does between
+        rounds: hands from the last hand are emptied (or made), everyone is active
+        with no action or bet, and the blinds sit to the left of the button.
+
+        Args:
+            players (list[Player]): players in seat order
+            button (int, optional): seat of the small blind. Defaults to 0.
+        """
+        for player in players:
+            if player.hand is None:
+                player.hand = Hand([])
+            else:
+                player.hand.clear()
+            player._active = True
+            player.blind = None
+            player._clear_action()
+            player._clear_bet_amount()
+        players[button % len(players)].blind = 'small'
+        players[(button + 1) % len(players)].blind = 'large'
+
+
     def set_up_round(self) -> None: 
         """
         Pipeline to set up round to be played 
         """
         self._shuffle_deck()
+        for recorder in self.recorders:
+            recorder.begin_hand(self)
         self._take_blinds()
         
         
-    def deal_hand(self) -> dict:
+    def play(self) -> GameState:
+        """
+        Pipeline to play the whole round without a display, in the same order
+        as the Dealer's phases.
+
+        Returns:
+            GameState: game state after the pot is paid out
+        """
+        self.set_up_round()
+        self.deal_hand()
+        for deal in (self.deal_flop, self.deal_turn, self.deal_river):
+            self.take_bets()
+            if self.betting_closed() is True:
+                return self.run_out()
+            deal()
+        self.take_bets()
+        return self.finish_round()
+    
+    
+    def betting_closed(self) -> bool:
+        """
+        Method to check if any betting is left in the hand: it is over once the pot
+        is paid, everyone else folded, or at most one player still has chips and 
+        they have matched the bet.
+
+        Returns:
+            bool: True if no more bets can be made this hand
+        """
+        if self.winners is not None:
+            return True
+        
+        active_players = [player for player in self._active_players if (player._active is True)]
+        if len(active_players) < 2:
+            return True
+        
+        can_bet = [player for player in active_players if player.bank > 0]
+        if len(can_bet) == 0:
+            return True
+        
+        current_bet = max([player.bet_amount for player in active_players])
+        return (len(can_bet) == 1) and (can_bet[0].bet_amount >= current_bet)
+    
+    
+    def run_out(self) -> GameState:
+        """
+        Method to finish a hand that has no betting left without any more betting 
+        rounds: the rest of the board is dealt and the pot paid out, or with 
+        equity_runouts the pot is split by each player's equity over every 
+        possible rest of the board.
+
+        Returns:
+            GameState: game state after the pot is paid out
+        """
+        self._active_players = [player for player in self._active_players if (player._active is True)]
+        if (self.equity_runouts is True) and (self.winners is None) and (len(self._active_players) > 1):
+            # hands are only typed when the board is big enough to score them, the pot goes by equity
+            if len(self.community_cards) >= self.variant.min_board:
+                self._get_winner()
+            self._pay_out_equity()
+            self._show_down_state()
+            for recorder in self.recorders:
+                recorder.end_hand(self)
+            return self.state
+        
+        # betting is closed so the streets are dealt straight after each other
+        if self.winners is None:
+            for target in (3, 4, 5):
+                if len(self.community_cards) < target:
+                    self._deal_cards(target - len(self.community_cards), False)
+        return self.finish_round()
+        
+        
+    def deal_hand(self) -> GameState:
         """
         Method to deal hand to players
 
         Returns:
-            dict: game state dict for visualization
+            GameState: game state for visualization
         """
-        self._deal_cards(2, True)
-        return self._game_state_dict()
+        self._deal_cards(self.variant.hole_cards, True)
+        return self.state
         
         
-    def deal_flop(self) -> None:
+    def deal_flop(self) -> GameState:
         """
         Method to deal flop to community
 
         Returns:
-            dict: game state dict for visualization
+            GameState: game state for visualization
         """
         self._deal_cards(3, False)
-        return self._game_state_dict()
+        return self.state
     
     
-    def deal_turn(self) -> None:
+    def deal_turn(self) -> GameState:
         """
         Method to deal turn to community
 
         Returns:
-            dict: game state dict for visualization
+            GameState: game state for visualization
         """
         self._deal_cards(1, False)
-        return self._game_state_dict()
+        return self.state
     
-    def deal_river(self) -> None:
+    def deal_river(self) -> GameState:
         """
         Method to deal river to community
 
         Returns:
-            dict: game state dict for visualization
+            GameState: game state for visualization
         """
         self._deal_cards(1, False)
-        return self._game_state_dict()   
+        return self.state
                 
     
-    def take_bets(self) -> dict: 
+    def take_bets(self) -> GameState: 
         # setting current bet amount        
         idx = 0
              
@@ -94,20 +258,25 @@ class GameRound:
             
             # checking how many active players
             if len(active_players) == 1:
+                self._active_players = active_players
                 self.finish_round()
                 break
             
             # getting current max bet of active players
-            current_bet = max([player.bet_amount for player in active_players])
+            current_bet = max([player.bet_amount for player in active_players], default=0)
+            
+            # all in players stay in the hand but do not act
+            can_bet = [player for player in active_players if player.bank > 0]
                         
             # getting bet end flags
             active_players_flag = not active_players
-            match_bet_flag = all([(player.bet_amount == current_bet) for player in active_players])
-            action_flag = (len([player for player in active_players if player.action_str != None]) == len(active_players))
+            match_bet_flag = all([(player.bet_amount == current_bet) for player in can_bet])
+            action_flag = (len([player for player in can_bet if player.action_str != None]) == len(can_bet))
+            lone_flag = (len(can_bet) <= 1) and match_bet_flag
             
 
             # if bet end flags are met, end betting round
-            if active_players_flag or ((match_bet_flag) and (action_flag)):
+            if active_players_flag or lone_flag or ((match_bet_flag) and (action_flag)):
                 self._active_players = [player for player in active_players if (player._active)]                
                 break
             
@@ -115,8 +284,8 @@ class GameRound:
             player = active_players[idx % len(active_players)]
             idx = idx + 1
             
-            # if player already folded, continue
-            if player._active is False:
+            # if player already folded or is all in, continue
+            if (player._active is False) or (player.bank == 0):
                 continue
             
             # getting diff to meet current bet
@@ -128,40 +297,52 @@ class GameRound:
             
             # computer action
             else:
+                player.observe(self.community_cards, len(active_players) - 1, self.pot, call_amt)
                 player_amt = player.get_action(self._large_blind_amt)
                         
             
-            # if a player cannot afford bank, make them fold
+            # if a player cannot afford the call, they call all in for what is left
             if call_amt > player.bank:
-                player.action_str = 'fold'
+                call_amt = player.bank
+                if player.action_str != 'fold':
+                    player.action_str = 'check'
+            
+            # a raise is capped at what is left in the bank after calling
+            elif (player.action_str == 'bet') and (player_amt >= player.bank - call_amt):
+                player_amt = player.bank - call_amt
+                if player_amt == 0:
+                    player.action_str = 'check'
                 
-            print('----------------')
+            self._announce('----------------')
             
             # if player folds, make them inactive and tell table
             if player.action_str == 'fold': 
                 if player.id == 1:
-                    print(f'You folded.')
+                    self._announce(f'You folded.')
                 else:
-                    print(f'Player {player.id} folded.')
+                    self._announce(f'Player {player.id} folded.')
                     
                 player._active = False
-                print('----------------')
+                self._record_action(player, 'fold', 0)
+                self._announce('----------------')
             
             # if player check/calls,
             elif player.action_str == 'check':
                 if call_amt > 0:
                     player.check(call_amt)
                     self.pot += call_amt
+                    self._record_action(player, 'call', call_amt)
                     if player.id == 1:
-                        print(f"You call for {call_amt}.")
+                        self._announce(f"You call for {call_amt}.")
                     else:
-                        print(f"Player {player.id} calls for {call_amt}.")
+                        self._announce(f"Player {player.id} calls for {call_amt}.")
                 else:
+                    self._record_action(player, 'check', 0)
                     if player.id == 1:
-                        print("You checked.")
+                        self._announce("You checked.")
                     else:
-                        print(f"Player {player.id} checks.")
-                print('----------------')
+                        self._announce(f"Player {player.id} checks.")
+                self._announce('----------------')
                     
             # if player is raising
             else:
@@ -170,11 +351,12 @@ class GameRound:
                     self.pot += call_amt
                 player.bet(player_amt)
                 self.pot = self.pot + player_amt
+                self._record_action(player, 'raise', call_amt + player_amt)
                 if player.id == 1:
-                    print(f"You raise by {player_amt} for a total of {player.bet_amount}")
+                    self._announce(f"You raise by {player_amt} for a total of {player.bet_amount}")
                 else:
-                    print(f"Player {player.id} raises by {player_amt} for a total of {player.bet_amount}")
-                print('----------------')
+                    self._announce(f"Player {player.id} raises by {player_amt} for a total of {player.bet_amount}")
+                self._announce('----------------')
                 
             # for other in active_players:
             #     if other != player:
@@ -187,19 +369,29 @@ class GameRound:
             
         #print(f'Betting round complete. Pot is ${self.pot}')
         
-        return self._game_state_dict()
+        return self.state
         
         
-    def finish_round(self) -> dict:
+    def finish_round(self) -> GameState:
         """
         Pipe line to run post-round tasks
 
         Returns:
-            dict: game_state_dict for visualization
+            GameState: game state for visualization
         """
-        self._get_winner()
-        self._pay_out_pot()
-        return self._game_state_dict()
+        # round can be finished early when all but one player fold, only pay once
+        if self.winners is None:
+            if len(self._active_players) == 1:
+                # everyone else folded, there is no showdown so the hand is not scored
+                lone_rank = self._seat_values({id(self._active_players[0]): 0})
+                self._pay(*split_pot(self.contributions, lone_rank))
+            else:
+                self._get_winner()
+                self._pay_out_pot()
+            self._show_down_state()
+            for recorder in self.recorders:
+                recorder.end_hand(self)
+        return self.state
         
         
         
@@ -207,20 +399,35 @@ class GameRound:
         """
         method to shuffle deck in prep for game
         """
-        self.deck = Deck()
+        if self.deck is None:
+            self.deck = Deck(ranks=self.variant.ranks if self.variant.deck_size < 52 else None)
+        else:
+            self.deck.reset()
         self.deck.shuffle()
         
     def _take_blinds(self) -> None:
         """
-        takes blind from players 
+        takes antes and blinds from players, a player who cannot pay a blind in full is all in for their bank
         """
+        # antes are dead money, they go in the pot without counting towards the bets
+        if self.ante > 0:
+            for player in self._players:
+                amount = min(self.ante, player.bank)
+                player.bank = player.bank - amount
+                self.pot = self.pot + amount
+                self._record_action(player, 'ante', amount)
+            
         for player in self._players:
             if player.blind == "large":
-                player.bet(self.large_blind_amt)
-                self.pot = self.pot + self.large_blind_amt
+                amount = min(self.large_blind_amt, player.bank)
+                player.bet(amount)
+                self.pot = self.pot + amount
+                self._record_action(player, 'large_blind', amount)
             elif player.blind == 'small':
-                player.bet(self.small_blind_amt)
-                self.pot = self.pot + self.small_blind_amt
+                amount = min(self.small_blind_amt, player.bank)
+                player.bet(amount)
+                self.pot = self.pot + amount
+                self._record_action(player, 'small_blind', amount)
             else:
                 continue
             
@@ -242,6 +449,8 @@ class GameRound:
                     i = i + 1
                     card = self.deck.draw()
                     player.hand.add_card(card)
+            if self._human is not None:
+                self.state.set('player_cards', self._human.hand.cards[0:self.variant.hole_cards])
                         
         # dealing to community cards
         else:
@@ -250,6 +459,37 @@ class GameRound:
                 i = i + 1
                 card = self.deck.draw()
                 self.community_cards.append(card)
+            self.state.set('community_cards', self.community_cards)
+            for recorder in self.recorders:
+                recorder.log_deal(self, self.community_cards[-count:])
+        
+        
+    def _record_action(self, player:Player, action:str, amount:int) -> None:
+        """
+        Helper method to pass an action on to the game state and the recorders
+
+        Args:
+            player (Player): acting player
+            action (str): action name, see HandRecorder.log_action
+            amount (int): chips put in the pot by the action
+        """
+        self.contributions[self.seats.seat_of(player.id)] += amount
+        self.state.set('pot', self.pot)
+        if player is self._human:
+            self.state.set('player_bank', player.bank)
+        for recorder in self.recorders:
+            recorder.log_action(self, player, action, amount)
+            
+            
+    def _announce(self, message:str) -> None:
+        """
+        Helper method to print table talk when running verbose
+
+        Args:
+            message (str): message to print
+        """
+        if self.verbose is True:
+            print(message)
         
         
     def _get_winner(self) -> list: 
@@ -262,7 +502,7 @@ class GameRound:
         for player in self._active_players:
             player.hand._cards.extend(self.community_cards)
         
-        self.winners = WinnerFinder(self._active_players).winner
+        self.winners = WinnerFinder(self._active_players, self.variant).winner
         
         
     def _make_winner_str(self) -> str: 
@@ -282,47 +522,102 @@ class GameRound:
         
     def _pay_out_pot(self) -> None:
         """
-        Method to split pot
+        Method to split the pot, and any side pots, between the best hands
         """
-        # splitting pot by number of players
-        split_pot = self.pot/len(self.winners)
-        for winner in self.winners:
-            winner.earn(int(split_pot))
+        ranks = self._seat_values({id(player): player.hand._type_int for player in self._active_players})
+        payouts, winners = split_pot(self.contributions, ranks)
+        self._pay(payouts, winners)
         
-  
-                
-    def _game_state_dict(self) -> dict:
+        
+    def _pay_out_equity(self, max_runouts:int = 20000) -> None:
+        """
+        Method to split the pot by each player's expected share over the ways the
+        board can still be completed, see expected_payouts()
+
+        Args:
+            max_runouts (int, optional): most boards to evaluate. Defaults to 20000.
+        """
+        n_hole = self.variant.hole_cards
+        holes = self._seat_values({id(player): [card.card_id for card in player.hand.cards[0:n_hole]] 
+                                   for player in self._active_players})
+        board = [card.card_id for card in self.community_cards]
+        unseen = [card.card_id for card in self.deck.cards]
+        # boards are sampled with the deck's generator, seeded decks then settle the same way every time
+        expected = expected_payouts(holes, board, unseen, self.contributions, max_runouts, self.variant,
+                                    self.deck.rng)
+        winners = {seat for seat, value in enumerate(expected) if value > 0}
+        self._pay(round_payouts(expected), winners)
+        
+        
+    def _pay(self, payouts:list[int], winners:set) -> None:
+        """
+        Helper method to pay each seat and keep the payouts and winners on the round
+
+        Args:
+            payouts (list[int]): chips paid to each seat
+            winners (set): seats that won a share of the pot
+        """
+        for player, payout in zip(self._players, payouts):
+            if payout > 0:
+                player.earn(payout)
+        self.payouts = payouts
+        self.winners = [player for seat, player in enumerate(self._players) if seat in winners]
+        
+        
+    def _seat_values(self, values:dict) -> list:
         """
-        This method crates the state dict to pass to
-        the display.
+        Helper method to put per player values in seat order
+
+        Args:
+            values (dict): values keyed by id(player)
 
         Returns:
-            dict: dictionary of game state
+            list: value of each seat, None for players not in values
         """
+        return [values.get(id(player)) for player in self._players]
         
-        # pulling player hand
-        for player in self._players:
-            if isinstance(player, HumanPlayer) is True: 
-                human_hand = player.hand
-                human_bank = player.bank
-        
-        game_state_dict = {
-            'player_cards': human_hand._cards[0:2],
-            'player_bank': human_bank,
-            'community_cards': self.community_cards,
-            'pot': self.pot,
-            'left_opp_cards': ['card 1', 'card 2'],
-            'top_opp_cards': ['card 1', 'card 2'],
-            'right_opp_cards': ['card 1', 'card 2']
-        }
+  
                 
-        if self.winners != None: 
-            game_state_dict['winner_str'] = self._make_winner_str()
-            game_state_dict['left_opp_cards'] = [player.hand._cards for player in self._players if (player.id == 2)][0][0:2],
-            game_state_dict['top_opp_cards'] = [player.hand._cards for player in self._players if (player.id == 3)][0][0:2],
-            game_state_dict['right_opp_cards'] = [player.hand._cards for player in self._players if (player.id == 4)][0][0:2]
+    def _refresh_state(self) -> None:
+        """
+        Helper method to set every game state field from the round, used when the
+        round is built and when its attributes were changed from outside (replays)
+        """
+        self.state.reset()
+        if self._human is not None:
+            self.state.update(player_cards=self._human.hand.cards[0:self.variant.hole_cards] if self._human.hand else [],
+                              player_bank=self._human.bank)
+        self.state.update(community_cards=self.community_cards, 
+                          pot=self.pot,
+                          opponents=[(player.id, HIDDEN_CARDS) for player in self._opponents()])
+        if self.winners is not None:
+            self._show_down_state()
+            
+            
+    def _show_down_state(self) -> None:
+        """
+        Helper method to update the game state once the pot is paid out
+        """
+        if self._human is not None:
+            self.state.set('player_bank', self._human.bank)
             
-        return game_state_dict
+        self.state.update(winner_str=self._make_winner_str(),
+                          opponents=[(player.id, tuple(player.hand.cards[0:self.variant.hole_cards]))
+                                     for player in self._opponents()])
+    
+    
+    def _opponents(self) -> list[Player]:
+        """
+        Helper method to get the opponents of the human player in seat order after
+        the human, or every player if no human is seated
+
+        Returns:
+            list[Player]: opponents to show on the display
+        """
+        if self._human is None:
+            return list(self.seats)
+        
+        return self.seats.clockwise_from(self.seats.seat_of(self._human.id))
             
 
     @property
@@ -0,0 +1,144 @@
+"""
+This file defines a parallel successive halving search over computer strategy
+parameters (action weights and bet cap, see StrategyParams).
+"""
+
+import random as rd
+
+from typing import NamedTuple
+
+from .evaluation import DuplicateEvaluator
+from .online_stats import RunningStats
+from .player import StrategyParams
+from .pool import worker_pool
+
+CANDIDATE = 'candidate'
+
+
+class ConfigResult(NamedTuple):
+    params: StrategyParams
+    deals: int
+    mean: float
+    std_error: float
+
+
+class StrategySearch:
+    def __init__(self,
+                 field:tuple = ('strict', 'soft', 'rand'),
+                 bank:int = 200,
+                 seed:int = 0,
+                 workers:int = None,
+                 equity_runouts:bool = False):
+        """
+        This class searches strategy parameters by successive halving: many
+        configurations are played on a few deals, the better half carries on to
+        twice as many deals, and so on until one is left. Every configuration
+        plays the same duplicate deals against the same field of opponents, so
+        they are compared on equal luck.
+
+        Args:
+            field (tuple, optional): strategies of the opponents. Defaults to ('strict', 'soft', 'rand').
+            bank (int, optional): bank every player starts each hand with. Defaults to 200.
+            seed (int, optional): seed of the configurations and deals. Defaults to 0.
+            workers (int, optional): worker processes, 1 runs in this process. Defaults to None,
+                one per CPU.
+            equity_runouts (bool, optional): settle all in hands by equity. Defaults to False.
+        """
+        self.field = tuple(field)
+        self.bank = bank
+        self.seed = seed
+        self.workers = workers
+        self.equity_runouts = equity_runouts
+        self.rungs = []
+
+
+    def run(self,
+            n_configs:int = 64,
+            min_deals:int = 25,
+            eta:int = 2,
+            configs:list[StrategyParams] = None) -> list[ConfigResult]:
+        """
+        Method to run the search.
+
+        Args:
+            n_configs (int, optional): random configurations to start with. Defaults to 64.
+            min_deals (int, optional): deals every configuration plays in the first rung. Defaults to 25.
+            eta (int, optional): survivors are 1/eta of each rung and play eta times the deals. Defaults to 2.
+            configs (list[StrategyParams], optional): configurations to search instead of random ones.
+                Defaults to None.
+
+        Returns:
+            list[ConfigResult]: every configuration, those that went furthest first and then
+                by chips won per deal against the field
+        """
+        if eta < 2:
+            raise ValueError('Please pass an eta of at least 2')
+
+        if configs is None:
+            rng = rd.Random(self.seed)
+            configs = [random_params(rng) for _ in range(n_configs)]
+
+        stats = [RunningStats() for _ in configs]
+        alive = list(range(len(configs)))
+        played = 0
+        budget = min_deals
+        self.rungs = []
+        with worker_pool(self.workers) as pool:
+            while True:
+                # survivors only play the deals they have not played yet
+                jobs = [(configs[idx], played, budget, self.field, self.bank, self.seed, self.equity_runouts)
+                        for idx in alive]
+                for idx, result in zip(alive, pool.map(_evaluate_config, jobs)):
+                    stats[idx].merge(result)
+                played = budget
+                self.rungs.append([self._result(configs[idx], stats[idx]) for idx in alive])
+
+                if len(alive) == 1:
+                    break
+                alive = sorted(alive, key=lambda idx: stats[idx].mean, reverse=True)
+                alive = alive[0:max(1, len(alive) // eta)]
+                budget *= eta
+
+        results = [self._result(config, config_stats) for config, config_stats in zip(configs, stats)]
+        return sorted(results, key=lambda result: (result.deals, result.mean), reverse=True)
+
+
+    @staticmethod
+    def _result(params:StrategyParams, stats:RunningStats) -> ConfigResult:
+        """
+        Helper method to summarize a configuration
+        """
+        return ConfigResult(params, stats.count, stats.mean, stats.std_error)
+
+
+
+def random_params(rng:rd.Random) -> StrategyParams:
+    """
+    Function to draw strategy parameters, weights uniformly over the ways to split
+    them and a bet cap between 1% and 30% of the bank
+
+    Args:
+        rng (random.Random): random generator
+
+    Returns:
+        StrategyParams: random configuration
+    """
+    weights = [rng.expovariate(1.0) for _ in range(3)]
+    total = sum(weights)
+    return StrategyParams(*(round(weight / total, 3) for weight in weights), round(rng.uniform(0.01, 0.3), 3))
+
+
+def _evaluate_config(job:tuple) -> RunningStats:
+    """
+    Helper function for worker processes that plays a configuration against the field
+
+    Args:
+        job (tuple): (params, first deal, stop deal, field, bank, seed, equity_runouts)
+
+    Returns:
+        RunningStats: chips won per deal by the configuration
+    """
+    params, start, stop, field, bank, seed, equity_runouts = job
+    evaluator = DuplicateEvaluator([CANDIDATE, *field], bank=bank, seed=seed,
+                                   equity_runouts=equity_runouts, params={CANDIDATE: params})
+    return evaluator.deal_stats(start, stop)[CANDIDATE]
@@ -0,0 +1,92 @@
+"""
+This file defines the SeatMap, which gives O(1) lookup of players by id and by seat
+"""
+
+from .player import Player
+
+MIN_SEATS = 2
+MAX_SEATS = 10
+
+
+class SeatMap:
+    def __init__(self, players:list[Player]):
+        """
+        This class maps the seats at a table (index in the seating order) to the
+        players sitting in them, and player ids back to players and seats.
+
+        Args:
+            players (list[Player]): players in seating order
+
+        Raises:
+            ValueError: raised if there are not 2-10 players or ids repeat
+        """
+        if (len(players) < MIN_SEATS) or (len(players) > MAX_SEATS):
+            raise ValueError(f'Please seat between {MIN_SEATS} and {MAX_SEATS} players')
+
+        self._players = list(players)
+        self._seats = {player.id: seat for seat, player in enumerate(self._players)}
+        if len(self._seats) != len(self._players):
+            raise ValueError('Please give every player a unique id')
+
+
+    def by_id(self, player_id:int) -> Player:
+        """
+        Method to get a player by id
+
+        Args:
+            player_id (int): player id
+
+        Returns:
+            Player: player with the id, None if not seated
+        """
+        seat = self._seats.get(player_id)
+        if seat is None:
+            return None
+        return self._players[seat]
+
+
+    def seat_of(self, player_id:int) -> int:
+        """
+        Method to get the seat of a player id
+
+        Args:
+            player_id (int): player id
+
+        Returns:
+            int: seat index, None if not seated
+        """
+        return self._seats.get(player_id)
+
+
+    def player_at(self, seat:int) -> Player:
+        """
+        Method to get the player in a seat
+
+        Args:
+            seat (int): seat index
+
+        Returns:
+            Player: player in the seat
+        """
+        return self._players[seat]
+
+
+    def clockwise_from(self, seat:int) -> list[Player]:
+        """
+        Method to get the other players in seat order, starting after a seat
+
+        Args:
+            seat (int): seat index to start after
+
+        Returns:
+            list[Player]: players in the following seats
+        """
+        return self._players[seat + 1:] + self._players[0:seat]
+
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+
+    def __iter__(self):
+        return iter(self._players)
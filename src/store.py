@@ -0,0 +1,308 @@
+"""
+This file defines an SQLite results store for games, rounds, actions and showdowns,
+written in batches by a background thread.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+
+from .recorder import HandRecorder
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id INTEGER PRIMARY KEY,
+    started_at REAL,
+    n_players INTEGER,
+    winner_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    round_id INTEGER PRIMARY KEY,
+    game_id INTEGER,
+    hand_no INTEGER,
+    small_blind INTEGER,
+    large_blind INTEGER,
+    pot INTEGER
+);
+CREATE TABLE IF NOT EXISTS actions (
+    round_id INTEGER,
+    seq INTEGER,
+    player_id INTEGER,
+    strategy TEXT,
+    action TEXT,
+    amount INTEGER
+);
+CREATE TABLE IF NOT EXISTS showdowns (
+    round_id INTEGER,
+    player_id INTEGER,
+    strategy TEXT,
+    hand_type TEXT,
+    is_winner INTEGER,
+    bank_delta INTEGER
+);
+CREATE INDEX IF NOT EXISTS rounds_game ON rounds (game_id);
+CREATE INDEX IF NOT EXISTS actions_player ON actions (player_id);
+CREATE INDEX IF NOT EXISTS actions_strategy ON actions (strategy, action);
+CREATE INDEX IF NOT EXISTS showdowns_player ON showdowns (player_id);
+CREATE INDEX IF NOT EXISTS showdowns_strategy ON showdowns (strategy);
+CREATE INDEX IF NOT EXISTS showdowns_hand_type ON showdowns (hand_type);
+"""
+
+INSERTS = {
+    'games': 'INSERT INTO games VALUES (?, ?, ?, ?)',
+    'game_winners': 'UPDATE games SET winner_id = ? WHERE game_id = ?',
+    'rounds': 'INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?)',
+    'actions': 'INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?)',
+    'showdowns': 'INSERT INTO showdowns VALUES (?, ?, ?, ?, ?, ?)',
+}
+
+
+class ResultsStore(HandRecorder):
+    def __init__(self, path:str, batch_size:int = 5000, max_pending:int = 8):
+        """
+        This class stores the games and hands played by a Dealer it is passed to
+        (as a recorder) in an SQLite database in WAL mode. Rows are collected in
+        memory and handed in batches to a background thread that inserts each
+        batch in a single transaction, so the game never waits on the disk
+        unless max_pending batches are already queued.
+
+        Args:
+            path (str): database file path, created if missing
+            batch_size (int, optional): rows per batch. Defaults to 5000.
+            max_pending (int, optional): batches queued before the game blocks. Defaults to 8.
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+
+        # creating schema and finding the next ids
+        with sqlite3.connect(self.path) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+            self._game_id = conn.execute('SELECT COALESCE(MAX(game_id), 0) FROM games').fetchone()[0]
+            self._round_id = conn.execute('SELECT COALESCE(MAX(round_id), 0) FROM rounds').fetchone()[0]
+        conn.close()
+
+        self._batch = {table: [] for table in INSERTS}
+        self._batch_rows = 0
+        self._hand_no = 0
+        self._seq = 0
+        self._banks = None
+
+        # background writer
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._writer = threading.Thread(target=self._write_loop, name='ResultsStore', daemon=True)
+        self._writer.start()
+
+
+    def begin_game(self, dealer) -> None:
+        """
+        Method to add a game row
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        self._game_id += 1
+        self._hand_no = 0
+        self._add('games', (self._game_id, time.time(), len(dealer.players), None))
+
+
+    def end_game(self, dealer) -> None:
+        """
+        Method to set the game winner and hand over the rows still in memory
+
+        Args:
+            dealer (Dealer): dealer running the game
+        """
+        if len(dealer.players) == 1:
+            self._add('game_winners', (dealer.players[0].id, self._game_id))
+        self.flush()
+
+
+    def begin_hand(self, round) -> None:
+        """
+        Method to start a round row and save starting banks
+
+        Args:
+            round (GameRound): round being played
+        """
+        self._round_id += 1
+        self._seq = 0
+        self._banks = {id(player): player.bank for player in round.players}
+
+
+    def log_action(self, round, player, action:str, amount:int) -> None:
+        """
+        Method to add an action row
+
+        Args:
+            round (GameRound): round being played
+            player (Player): acting player
+            action (str): action name
+            amount (int): chips put in the pot by this action
+        """
+        self._add('actions', (self._round_id, self._seq, player.id, player.strategy, action, amount))
+        self._seq += 1
+
+
+    def end_hand(self, round) -> None:
+        """
+        Method to add the round row and a showdown row per showdown player
+
+        Args:
+            round (GameRound): round being played
+        """
+        self._add('rounds', (self._round_id, self._game_id, self._hand_no,
+                             round.small_blind_amt, round.large_blind_amt, round.pot))
+        self._hand_no += 1
+
+        if len(round._active_players) < 2:
+            return
+
+        winners = {id(player) for player in round.winners}
+        for player in round._active_players:
+            self._add('showdowns', (self._round_id, player.id, player.strategy, player.hand._type_str,
+                                    int(id(player) in winners), player.bank - self._banks[id(player)]))
+
+
+    def _add(self, table:str, row:tuple) -> None:
+        """
+        Helper method to add a row to the batch, handing it over when full
+
+        Args:
+            table (str): key of INSERTS
+            row (tuple): row values
+        """
+        self._batch[table].append(row)
+        self._batch_rows += 1
+        if self._batch_rows >= self.batch_size:
+            self._submit()
+
+
+    def _submit(self) -> None:
+        """
+        Helper method to hand the current batch to the writer thread
+        """
+        self._raise_writer_error()
+        if self._batch_rows == 0:
+            return
+
+        self._queue.put(self._batch)
+        self._batch = {table: [] for table in INSERTS}
+        self._batch_rows = 0
+
+
+    def _write_loop(self) -> None:
+        """
+        Writer thread loop, inserts one batch per transaction until it gets None
+        """
+        conn = sqlite3.connect(self.path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    self._queue.task_done()
+                    return
+
+                try:
+                    if self._error is None:
+                        with conn:
+                            for table, rows in batch.items():
+                                if rows:
+                                    conn.executemany(INSERTS[table], rows)
+                except Exception as error:
+                    # any error is kept for the caller, the thread keeps draining the queue so flush() returns
+                    self._error = error
+                finally:
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+
+    def _raise_writer_error(self) -> None:
+        """
+        Helper method to surface an error raised in the writer thread
+
+        Raises:
+            RuntimeError: raised if a batch failed to insert, from the writer's error
+        """
+        if self._error is not None:
+            raise RuntimeError(f'Writing results to {self.path} failed') from self._error
+
+
+    def flush(self) -> None:
+        """
+        Method to hand over buffered rows and wait until everything is written
+        """
+        self._submit()
+        self._queue.join()
+        self._raise_writer_error()
+
+
+    def close(self) -> None:
+        """
+        Method to write everything left and stop the writer thread
+        """
+        if self._writer.is_alive() is False:
+            return
+
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+
+
+    def query(self, sql:str, params:tuple = ()) -> list:
+        """
+        Method to run a read query on a separate connection, after a flush
+
+        Args:
+            sql (str): SQL query
+            params (tuple, optional): query parameters. Defaults to ().
+
+        Returns:
+            list: result rows
+        """
+        self.flush()
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+
+    def strategy_summary(self) -> list:
+        """
+        Method to summarize showdown results by strategy
+
+        Returns:
+            list: rows of (strategy, showdowns, wins, total bank delta)
+        """
+        return self.query('SELECT strategy, COUNT(*), SUM(is_winner), SUM(bank_delta) '
+                          'FROM showdowns GROUP BY strategy ORDER BY strategy')
+
+
+    def hand_type_counts(self, player_id:int = None) -> list:
+        """
+        Method to count showdown hand types, optionally for one player
+
+        Args:
+            player_id (int, optional): player id to filter on. Defaults to None.
+
+        Returns:
+            list: rows of (hand type, count)
+        """
+        if player_id is None:
+            return self.query('SELECT hand_type, COUNT(*) FROM showdowns GROUP BY hand_type')
+        return self.query('SELECT hand_type, COUNT(*) FROM showdowns WHERE player_id = ? '
+                          'GROUP BY hand_type', (player_id,))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
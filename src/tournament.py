@@ -0,0 +1,187 @@
+"""
+This file defines tournament structure: blind level schedules (by hands played or by
+time, with antes) and Independent Chip Model (ICM) prize equities for strategies and
+result reporting.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import NamedTuple
+
+UNITS = ('hands', 'seconds')
+
+
+class BlindLevel(NamedTuple):
+    small_blind: int
+    big_blind: int
+    ante: int = 0
+    duration: float = 1
+
+
+class BlindSchedule:
+    def __init__(self, levels:list[BlindLevel], unit:str = 'hands'):
+        """
+        This class gives the blinds and ante in play after a number of hands or
+        seconds. Each level lasts its duration in the schedule's unit, the last
+        level stays in play once the schedule is over.
+
+        Args:
+            levels (list[BlindLevel]): levels in order
+            unit (str, optional): 'hands' or 'seconds'. Defaults to 'hands'.
+
+        Raises:
+            ValueError: raised if there are no levels, the unit is unknown or a
+                level is not a valid blind level
+        """
+        if len(levels) == 0:
+            raise ValueError('Please pass at least one blind level')
+        if unit not in UNITS:
+            raise ValueError(f'Please pass a unit in {UNITS}')
+
+        self.levels = [BlindLevel(*level) for level in levels]
+        for level in self.levels:
+            if (level.small_blind < 0) or (level.big_blind < level.small_blind) or (level.ante < 0):
+                raise ValueError(f'{level} is not a valid blind level')
+            if level.duration <= 0:
+                raise ValueError('Please pass positive level durations')
+        self.unit = unit
+
+        # where each level ends, for a binary search
+        self._ends = list(accumulate(level.duration for level in self.levels))
+
+
+    @classmethod
+    def linear(cls, small_blind:int = 2, big_blind:int = 4, step:int = 2, n_levels:int = 100,
+               hands_per_level:int = 1, ante:int = 0) -> "BlindSchedule":
+        """
+        Method to get a schedule that raises both blinds by the same step every level,
+        the defaults match the Dealer without a schedule
+
+        Args:
+            small_blind (int, optional): first small blind. Defaults to 2.
+            big_blind (int, optional): first big blind. Defaults to 4.
+            step (int, optional): blind increase per level. Defaults to 2.
+            n_levels (int, optional): levels in the schedule. Defaults to 100.
+            hands_per_level (int, optional): hands per level. Defaults to 1.
+            ante (int, optional): ante of every level. Defaults to 0.
+
+        Returns:
+            BlindSchedule: schedule by hands
+        """
+        return cls([BlindLevel(small_blind + idx * step, big_blind + idx * step, ante, hands_per_level)
+                    for idx in range(n_levels)], 'hands')
+
+
+    def level_index(self, hands:int, seconds:float = 0.0) -> int:
+        """
+        Method to get the index of the level in play
+
+        Args:
+            hands (int): hands played so far
+            seconds (float, optional): seconds played so far. Defaults to 0.0.
+
+        Returns:
+            int: level index
+        """
+        played = hands if self.unit == 'hands' else seconds
+        return min(bisect_right(self._ends, played), len(self.levels) - 1)
+
+
+    def level(self, hands:int, seconds:float = 0.0) -> BlindLevel:
+        """
+        Method to get the level in play
+
+        Args:
+            hands (int): hands played so far
+            seconds (float, optional): seconds played so far. Defaults to 0.0.
+
+        Returns:
+            BlindLevel: blinds and ante in play
+        """
+        return self.levels[self.level_index(hands, seconds)]
+
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+
+
+def icm_equities(stacks:list[int], payouts:list[float]) -> list[float]:
+    """
+    Function to get each player's expected prize under the Independent Chip Model:
+    a player finishes first with probability stack / total chips, and the next
+    places are drawn the same way among the players left. Results are memoized.
+
+    Args:
+        stacks (list[int]): chips of each player
+        payouts (list[float]): prize of each place, first place first
+
+    Raises:
+        ValueError: raised for negative stacks or more than 20 players
+
+    Returns:
+        list[float]: expected prize of each player, in stack order
+    """
+    if any(stack < 0 for stack in stacks):
+        raise ValueError('Please pass non-negative stacks')
+    if len(stacks) > 20:
+        raise ValueError('ICM is only computed for up to 20 players')
+    return list(_icm(tuple(stacks), tuple(payouts[0:len(stacks)])))
+
+
+@lru_cache(maxsize=4096)
+def _icm(stacks:tuple, payouts:tuple) -> tuple:
+    """
+    Helper function to compute ICM equities by dynamic programming over the subsets
+    of players that took the first places: the chance of each subset is shared out
+    to the subsets one player larger, and the player added takes the next place.
+    Only subsets smaller than the number of paid places are expanded, so a field
+    of 10 takes at most 2**10 subsets.
+
+    Returns:
+        tuple: expected prize of each player
+    """
+    n_players = len(stacks)
+    n_paid = len(payouts)
+    equities = [0.0] * n_players
+    if n_paid == 0:
+        return tuple(equities)
+
+    total = sum(stacks)
+    probs = {0: 1.0}
+    # players who finished so far -> their chips, built one player at a time
+    placed_chips = {0: 0}
+    for place in range(n_paid):
+        next_probs = {}
+        for mask, prob in probs.items():
+            left = [idx for idx in range(n_players) if not (mask >> idx) & 1]
+            remaining = total - placed_chips[mask]
+            for idx in left:
+                # when only empty stacks are left they are equally likely to place
+                share = stacks[idx] / remaining if remaining > 0 else 1 / len(left)
+                if share == 0:
+                    continue
+                chance = prob * share
+                equities[idx] += chance * payouts[place]
+                child = mask | (1 << idx)
+                next_probs[child] = next_probs.get(child, 0.0) + chance
+                placed_chips[child] = placed_chips[mask] + stacks[idx]
+        probs = next_probs
+
+    return tuple(equities)
+
+
+def prize_payouts(standings:list, payouts:list[float]) -> dict:
+    """
+    Function to get the prize of each player from the finishing order
+
+    Args:
+        standings (list[Player]): players best first, see Dealer.standings
+        payouts (list[float]): prize of each place, first place first
+
+    Returns:
+        dict: player id -> prize
+    """
+    return {player.id: (payouts[place] if place < len(payouts) else 0)
+            for place, player in enumerate(standings)}
@@ -0,0 +1,166 @@
+"""
+This file defines the poker variants a GameRound can deal: Texas Hold'em, Omaha (four
+hole cards, of which exactly two are used with three from the board) and short deck
+Hold'em (36 cards from six to ace, where a flush beats a full house).
+"""
+
+from .card import RANKS
+from .evaluator import (CATEGORY_SHIFT, HAND_TYPES, SHORT_DECK_TYPES, BoardEvaluator,
+                        evaluate, evaluate_short_deck)
+
+
+class Variant:
+    def __init__(self,
+                 name:str,
+                 hole_cards:int = 2,
+                 hole_used:int = None,
+                 ranks:tuple = RANKS,
+                 short_deck:bool = False):
+        """
+        This class describes a variant: how many hole cards are dealt, how many of
+        them a hand must use, which ranks are in the deck and how hands are ranked.
+        Scores compare the same way as evaluate() scores, and the hand type index
+        of a score (score >> CATEGORY_SHIFT) orders hand types by the variant's ranking.
+
+        Args:
+            name (str): variant name
+            hole_cards (int, optional): hole cards dealt to each player. Defaults to 2.
+            hole_used (int, optional): hole cards every hand must use. Defaults to None,
+                any number as in Hold'em.
+            ranks (tuple, optional): ranks in the deck. Defaults to every rank.
+            short_deck (bool, optional): rank hands as in short deck. Defaults to False.
+
+        Raises:
+            ValueError: raised if the hole card numbers or ranks are not valid
+        """
+        if hole_cards < 1:
+            raise ValueError('Please pass at least one hole card')
+        if (hole_used is not None) and not (1 <= hole_used <= min(hole_cards, 4)):
+            raise ValueError(f'A hand cannot use {hole_used} of {hole_cards} hole cards')
+        if any(rank not in RANKS for rank in ranks):
+            raise ValueError(f'Please pass ranks in {RANKS}')
+
+        self.name = name
+        self.hole_cards = hole_cards
+        self.hole_used = hole_used
+        self.ranks = tuple(ranks)
+        self.short_deck = short_deck
+        self.hand_types = SHORT_DECK_TYPES if short_deck else HAND_TYPES
+        self._evaluate = evaluate_short_deck if short_deck else evaluate
+
+
+    @property
+    def deck_size(self) -> int:
+        return 4 * len(self.ranks)
+
+
+    @property
+    def min_board(self) -> int:
+        """
+        Fewest board cards a hand can be scored on, three for Omaha
+        """
+        return 0 if self.hole_used is None else 5 - self.hole_used
+
+
+    def scorer(self, board:list[int]):
+        """
+        Method to get a function that scores hole cards on a board, the work on the
+        board is done once so scoring every player at a showdown shares it
+
+        Args:
+            board (list[int]): board card ids
+
+        Returns:
+            callable: hole card ids -> score
+        """
+        if self.hole_used is None:
+            board = list(board)
+            return lambda hole: self._evaluate(list(hole) + board)
+        return BoardEvaluator(board, self.hole_used, self.short_deck).evaluate
+
+
+    def score(self, hole:list[int], board:list[int]) -> int:
+        """
+        Method to score the best hand of hole cards on a board
+
+        Args:
+            hole (list[int]): hole card ids
+            board (list[int]): board card ids
+
+        Returns:
+            int: hand score
+        """
+        return self.scorer(board)(hole)
+
+
+    def scores(self, holes:list, board:list[int]) -> list:
+        """
+        Method to score every player's hole cards on the same board
+
+        Args:
+            holes (list): hole card ids of each seat, None for seats that folded
+            board (list[int]): board card ids
+
+        Returns:
+            list: score of each seat, None for seats that folded
+        """
+        scorer = self.scorer(board)
+        return [scorer(hole) if hole is not None else None for hole in holes]
+
+
+    def category(self, score:int) -> int:
+        """
+        Method to get the hand type index of a score, ordered by the variant's ranking
+
+        Args:
+            score (int): hand score
+
+        Returns:
+            int: hand type index, see hand_types
+        """
+        return score >> CATEGORY_SHIFT
+
+
+    def hand_type(self, score:int) -> str:
+        """
+        Method to get the hand type name of a score
+
+        Args:
+            score (int): hand score
+
+        Returns:
+            str: hand type name
+        """
+        return self.hand_types[score >> CATEGORY_SHIFT]
+
+
+    def __repr__(self) -> str:
+        return f'Variant({self.name!r})'
+
+
+
+HOLDEM = Variant('holdem')
+OMAHA = Variant('omaha', hole_cards=4, hole_used=2)
+SHORT_DECK = Variant('short_deck', ranks=RANKS[4:], short_deck=True)
+
+VARIANTS = {variant.name: variant for variant in (HOLDEM, OMAHA, SHORT_DECK)}
+
+
+def get_variant(variant) -> Variant:
+    """
+    Function to get a variant by name
+
+    Args:
+        variant (str | Variant): variant name, see VARIANTS, or a Variant
+
+    Raises:
+        ValueError: raised if there is no variant of that name
+
+    Returns:
+        Variant: the variant
+    """
+    if isinstance(variant, Variant):
+        return variant
+    if variant not in VARIANTS:
+        raise ValueError(f'Please pass a variant in {tuple(VARIANTS)}')
+    return VARIANTS[variant]
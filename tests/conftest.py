@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from src import Player
+from src import Dealer
+
+
+@pytest.fixture
+def play_game():
+    """Function to play seeded headless games, each hand reported to the recorders"""
+    def play(recorders:list, seed:int, strategies:tuple = ("rand", "soft", "strict"), n_games:int = 1) -> list:
+        """
+        Helper function to play headless games of players with 300 chips each
+
+        Args:
+            recorders (list[HandRecorder]): recorders passed to every game
+            seed (int): random seed
+            strategies (tuple, optional): strategy of each player, players get ids 1, 2, ...
+                Defaults to ("rand", "soft", "strict").
+            n_games (int, optional): games to play one after another. Defaults to 1.
+
+        Returns:
+            list[list[Player]]: players that started each game, in seat order
+        """
+        random.seed(seed)
+        games = []
+        for _ in range(n_games):
+            players = [Player(300, idx + 1, strategy) for idx, strategy in enumerate(strategies)]
+            Dealer(list(players), show_display=False, recorders=recorders, verbose=False)
+            games.append(players)
+        return games
+    return play
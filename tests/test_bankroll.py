@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.bankroll import BankrollTracker
+from src.online_stats import QuantileSketch
+
+
+def test_sketch_quantiles_and_merge():
+    """Check quantiles are within the relative accuracy and merging matches one sketch"""
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.lognormal(3, 1, 5000), -rng.lognormal(2, 1, 3000), np.zeros(500)])
+    rng.shuffle(values)
+    whole, first, second = QuantileSketch(0.01), QuantileSketch(0.01), QuantileSketch(0.01)
+    for idx, value in enumerate(values):
+        whole.add(value)
+        (first if idx % 2 else second).add(value)
+    first.merge(second)
+
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        exact = np.quantile(values, q, method='lower')
+        assert whole.quantile(q) == first.quantile(q)
+        assert abs(whole.quantile(q) - exact) <= 0.011 * abs(exact) + 1e-9
+    assert whole.quantile(0) == values.min() and whole.quantile(1) == values.max()
+    with pytest.raises(ValueError):
+        whole.merge(QuantileSketch(0.02))
+
+def test_tracker_counts_hands_and_games(play_game):
+    """Check per-hand deltas add up to the bank change and games are counted"""
+    tracker = BankrollTracker()
+    games = play_game([tracker], seed=5, n_games=3)
+    for player_id in (1, 2, 3):
+        stats = tracker[player_id]
+        assert stats.games == 3
+        assert stats.hands > 0
+        # deltas of each game add up to the final bank minus the starting 300
+        total = sum(players[player_id - 1].bank - 300 for players in games)
+        assert stats.deltas.mean * stats.hands == pytest.approx(total)
+        assert 0 <= stats.risk_of_ruin <= 1
+        assert stats.risk_below(0.25) <= stats.risk_below(0.5)
+    # someone is eliminated in every game
+    assert sum(tracker[player_id].busts for player_id in (1, 2, 3)) >= 3
+
+    other = BankrollTracker()
+    play_game([other], seed=6, n_games=2)
+    games = tracker[1].games
+    tracker.merge(other)
+    assert tracker[1].games == games + 2
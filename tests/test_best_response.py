@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from src.best_response import BettingAbstraction, params_policy, strategy_exploitability, FOLD, CALL, RAISE
+from src.cfr import deal_weights, equity_matrix
+from src.player import StrategyParams
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return {"equities": equity_matrix(samples=4, seed=2), "weights": deal_weights()}
+
+def test_always_fold_is_exploited_by_the_blinds(tables):
+    """Check a policy whose best response value is known exactly"""
+    abstraction = BettingAbstraction(**tables)
+    always_fold = lambda history, call_amt, can_raise: np.array([1.0, 0.0, 0.0])
+    # as the small blind anything but folding wins the big blind, as the big blind the small blind folds
+    assert abstraction.best_response(always_fold, 0).value == pytest.approx(4)
+    assert abstraction.best_response(always_fold, 1).value == pytest.approx(2)
+    assert abstraction.exploitability(always_fold) == pytest.approx(3)
+
+def test_best_response_beats_other_counters(tables):
+    """Check that the best response wins at least as much as fixed counter strategies"""
+    abstraction = BettingAbstraction(**tables)
+    rand = params_policy(StrategyParams(0.34, 0.33, 0.33, 0.15))
+    best = [abstraction.best_response(rand, seat).value for seat in (0, 1)]
+    for counter in ([0, 1, 0], [0, 0, 1], [0, 0.5, 0.5], [0.2, 0.5, 0.3]):
+        policy = lambda history, call_amt, can_raise, counter=counter: np.array(counter, dtype=float)
+        assert best[0] >= abstraction.profile_value(policy, rand) - 1e-9
+        assert best[1] >= -abstraction.profile_value(rand, policy) - 1e-9
+
+def test_profile_value_is_zero_sum_in_self_play(tables):
+    """Check that a policy against itself nets zero over both seats"""
+    abstraction = BettingAbstraction(**tables)
+    soft = params_policy(StrategyParams(0.70, 0.25, 0.05, 0.1))
+    always_fold = lambda history, call_amt, can_raise: np.array([1.0, 0.0, 0.0])
+    assert abstraction.profile_value(always_fold, soft) == pytest.approx(-2)
+    value = abstraction.profile_value(soft, soft)
+    assert abs(value) < 10
+    best = abstraction.best_response(soft, 0)
+    # the best responder's own policy does at least as well as copying the strategy
+    assert best.value >= value - 1e-9
+    assert set(np.unique(best.policy[''])) <= {FOLD, CALL, RAISE}
+
+def test_builtin_strategies_are_exploitable(tables):
+    """Check the exploitability of the built in strategies"""
+    values = {name: strategy_exploitability(name, **tables) for name in ["strict", "soft", "rand"]}
+    assert all(value > 0 for value in values.values())
+    assert values["rand"] > values["strict"]
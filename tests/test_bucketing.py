@@ -0,0 +1,64 @@
+import numpy as np
+
+from src import Card
+from src.bucketing import (BucketIndex, canonical_key, canonical_keys, decode_keys, equity_histograms,
+                           kmeans, sample_states)
+
+
+def test_canonical_keys_ignore_suit_names():
+    """Check that renaming suits gives the same key and decoding gives back a state"""
+    hole = np.array([[Card("A", "spade").card_id, Card("K", "spade").card_id]])
+    board = np.array([[Card("2", "spade").card_id, Card("7", "heart").card_id, Card("9", "club").card_id]])
+    renamed_hole = np.array([[Card("K", "diamond").card_id, Card("A", "diamond").card_id]])
+    renamed_board = np.array([[Card("9", "heart").card_id, Card("2", "diamond").card_id, Card("7", "club").card_id]])
+    key = canonical_keys(hole, board)
+    assert key == canonical_keys(renamed_hole, renamed_board)
+    assert key[0] == canonical_key(list(renamed_hole[0]), list(renamed_board[0]))
+    decoded_hole, decoded_board = decode_keys(key, 3)
+    assert canonical_keys(decoded_hole, decoded_board) == key
+    assert sorted(card >> 2 for card in decoded_hole[0]) == [11, 12]
+
+def test_histograms_and_kmeans():
+    """Check histogram sums and that k-means separates obvious clusters"""
+    keys = sample_states(3, 50, seed=1)
+    assert len(np.unique(keys)) == 50
+    histograms = equity_histograms(keys, 3, bins=6, runouts=8, opponents=4)
+    assert np.allclose(histograms.sum(axis=1), 1)
+
+    rng = np.random.default_rng(0)
+    data = np.concatenate([rng.normal(0, 0.1, (40, 2)), rng.normal(5, 0.1, (40, 2))])
+    centroids, labels = kmeans(data, 2)
+    assert len(set(labels[0:40])) == 1 and len(set(labels[40:])) == 1 and labels[0] != labels[40]
+
+def test_bucket_index(tmp_path):
+    """Check building, lazy loading and looking up a bucket file"""
+    path = tmp_path / "flop.tcb"
+    BucketIndex.build(path, n_board=3, n_states=200, n_buckets=5, runouts=8, opponents=4)
+    index = BucketIndex(path)
+    assert len(index) == 200 and index._keys is None
+
+    index._map()
+    keys = np.asarray(index._keys)
+    assert np.all(np.diff(keys) > 0)
+    buckets = index.bucket_of_keys(keys)
+    assert np.array_equal(buckets, np.asarray(index._buckets))
+    assert set(buckets.tolist()) <= set(range(5))
+
+    # a stored state looked up with its suits renamed, and a state that was not precomputed
+    hole, board = decode_keys(keys[0:1], 3)
+    cards = [Card.from_id(int(card) ^ 1) for card in np.concatenate([hole[0], board[0]])]
+    assert index.bucket(cards[0:2], cards[2:]) == buckets[0]
+    assert 0 <= index.bucket([Card("A", "spade"), Card("A", "heart")],
+                             [Card("A", "club"), Card("A", "diamond"), Card("2", "spade")]) < 5
+
+def test_bucket_fallback_uses_build_settings(tmp_path):
+    """Check that states missing from the file are measured with the runouts, opponents and seed it was built with"""
+    path = tmp_path / "flop.tcb"
+    index = BucketIndex.build(path, n_board=3, n_states=50, n_buckets=4, bins=6, runouts=4, opponents=2, seed=9)
+    assert (index.runouts, index.opponents, index.seed) == (4, 2, 9)
+
+    index._map()
+    missing = np.setdiff1d(sample_states(3, 200, seed=1), np.asarray(index._keys))[0:20]
+    histograms = equity_histograms(missing, 3, bins=6, runouts=4, opponents=2, seed=9)
+    nearest = ((np.cumsum(histograms, axis=1)[:, None, :] - index._centroids[None]) ** 2).sum(axis=2).argmin(axis=1)
+    assert np.array_equal(index.bucket_of_keys(missing), nearest)
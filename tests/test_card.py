@@ -1,5 +1,6 @@
 import pytest
 from src import Card
+from src import Deck
 
 def test_card_str_spade():
     """Test that a spade card returns the correct string """
@@ -32,4 +33,11 @@ def test_rank_type_error():
 def test_suit_type_error():
     """Test that providing a non-string suit raises TypeError"""
     with pytest.raises(TypeError):
-        Card("A", 10)  # suit must be a string
\ No newline at end of file
+        Card("A", 10)  # suit must be a string
+
+def test_card_id_round_trip():
+    """Test that every deck card maps to a unique id in 0-51 and back"""
+    ids = [card.card_id for card in Deck().cards]
+    assert sorted(ids) == list(range(52))
+    card = Card.from_id(Card("Q", "diamond").card_id)
+    assert (card.rank, card.suit) == ("Q", "diamond")
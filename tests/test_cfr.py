@@ -0,0 +1,75 @@
+import random
+
+import numpy as np
+import pytest
+
+from src import Card
+from src import Dealer
+from src import Hand
+from src import Player
+from src.cfr import (N_CLASSES, PushFoldSolver, PushFoldTable, categories, class_name,
+                     deal_weights, equity_matrix, hand_class)
+from src.evaluator import evaluate, hand_category
+from src.pushfold_player import PushFoldPlayer
+
+
+@pytest.fixture(scope="module")
+def solver():
+    return PushFoldSolver(equity_matrix(samples=4, seed=1), deal_weights())
+
+def test_hand_classes():
+    """Check class indexes and names"""
+    ace_spade, king_spade, king_heart = Card("A", "spade").card_id, Card("K", "spade").card_id, Card("K", "heart").card_id
+    assert class_name(hand_class(ace_spade, king_spade)) == "AKs"
+    assert class_name(hand_class(king_heart, ace_spade)) == "AKo"
+    assert class_name(hand_class(king_heart, king_spade)) == "KK"
+    assert len({class_name(idx) for idx in range(N_CLASSES)}) == N_CLASSES
+
+def test_vector_categories_match_evaluator():
+    """Check the vectorized hand types against the scalar evaluator"""
+    rng = np.random.default_rng(0)
+    cards = np.argsort(rng.random((3000, 52)), axis=1)[:, 0:7]
+    expected = [hand_category(evaluate(row)) for row in cards.tolist()]
+    assert categories(cards).tolist() == expected
+
+def test_deal_weights_count_card_removal():
+    """Check the deal weights against the number of non overlapping combo pairs"""
+    weights = deal_weights()
+    assert weights.sum() == 1326 * 1225
+    aces = hand_class(Card("A", "spade").card_id, Card("A", "heart").card_id)
+    # 6 ace pairs each leave one other ace pair
+    assert weights[aces, aces] == 6
+
+def test_solver_strategies(solver):
+    """Check the solved strategies at short and deeper stacks"""
+    table = solver.solve_table([2, 15], iterations=500)
+    aces = hand_class(Card("A", "spade").card_id, Card("A", "heart").card_id)
+    trash = hand_class(Card("7", "spade").card_id, Card("2", "heart").card_id)
+    # two big blinds deep everything is pushed and called
+    assert table.push_probability(2, trash) > 0.95
+    assert table.call_probability(2, trash) > 0.95
+    assert table.push_probability(15, aces) > 0.95
+    assert table.call_probability(15, aces) > 0.95
+    assert table.push_probability(15, trash) < 0.05
+    # nearest solved depth is used
+    assert table.push_probability(13.4, trash) == table.push_probability(15, trash)
+    assert table.push_probability(100, trash) == table.push_probability(15, trash)
+
+def test_table_round_trip(tmp_path, solver):
+    """Check that a saved table loads back the same"""
+    table = solver.solve_table([3, 6], iterations=50)
+    table.save(tmp_path / "pushfold.npz")
+    loaded = PushFoldTable.load(tmp_path / "pushfold.npz")
+    assert np.array_equal(loaded.push, table.push) and np.array_equal(loaded.depths, table.depths)
+
+def test_push_fold_player(solver):
+    """Check that the player only pushes or folds preflop and plays through a game"""
+    table = solver.solve_table([2, 5, 10, 20], iterations=200)
+    player = PushFoldPlayer(40, 1, table)
+    player.hand = Hand([Card("A", "spade"), Card("A", "heart")])
+    player.observe([], 1, 6, 2)
+    assert player.get_action(4) == 40 and player.action_str == 'bet'
+
+    random.seed(9)
+    players = [PushFoldPlayer(60, 1, table), Player(60, 2, "soft")]
+    Dealer(players, show_display=False, verbose=False)
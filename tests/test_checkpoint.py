@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src import Player
+from src import Dealer
+from src.checkpoint import Checkpointer, load_checkpoint
+from src.history import HandHistoryWriter, read_hands
+
+
+def test_resume_is_identical(tmp_path):
+    """Check that resuming from the last checkpoint replays the rest of the game exactly"""
+    random.seed(21)
+    players = [Player(400, 1, "rand"), Player(400, 2, "soft"), Player(400, 3, "rand"), Player(400, 4)]
+    checkpointer = Checkpointer(tmp_path / "game.ckpt", every=3)
+    with HandHistoryWriter(tmp_path / "full.tch") as writer:
+        full = Dealer(players, show_display=False, recorders=[writer], verbose=False, checkpointer=checkpointer)
+    checkpointer.close()
+    assert checkpointer.saved >= 1
+
+    state = load_checkpoint(tmp_path / "game.ckpt")
+    assert state['round_idx'] % 3 == 0
+
+    # messing up the global RNG, as a new process would have it
+    random.seed(0)
+    with HandHistoryWriter(tmp_path / "resumed.tch") as writer:
+        resumed = Dealer.resume(tmp_path / "game.ckpt", show_display=False, recorders=[writer], verbose=False)
+
+    full_hands = list(read_hands(tmp_path / "full.tch"))
+    resumed_hands = list(read_hands(tmp_path / "resumed.tch"))
+    assert len(resumed_hands) > 0
+    tail = full_hands[len(full_hands) - len(resumed_hands):]
+    assert [hand[1:] for hand in tail] == [hand[1:] for hand in resumed_hands]
+    assert [(p.id, p.bank) for p in resumed.players] == [(p.id, p.bank) for p in full.players]
+
+def test_foreground_checkpoint(tmp_path):
+    """Check that a foreground checkpointer writes the file directly"""
+    random.seed(2)
+    players = [Player(200, 1, "rand"), Player(200, 2, "rand")]
+    checkpointer = Checkpointer(tmp_path / "game.ckpt", every=1, background=False)
+    Dealer(players, show_display=False, verbose=False, checkpointer=checkpointer)
+    assert checkpointer.saved >= 1
+    assert not (tmp_path / "game.ckpt.tmp").exists()
+
+def test_bad_version(tmp_path):
+    """Check that a checkpoint from another format version raises a ValueError"""
+    import pickle
+    import zlib
+    path = tmp_path / "old.ckpt"
+    path.write_bytes(zlib.compress(pickle.dumps({'version': -1})))
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+
+def test_writer_error_is_raised(tmp_path, monkeypatch):
+    """Check that any error in the writer thread reaches the caller instead of hanging flush()"""
+    random.seed(2)
+    players = [Player(200, 1, "rand"), Player(200, 2, "rand")]
+    dealer = Dealer(players, show_display=False, verbose=False)
+    checkpointer = Checkpointer(tmp_path / "game.ckpt", every=1)
+    monkeypatch.setattr(checkpointer, "_write", lambda data: 1 / 0)
+    checkpointer.save(dealer)
+    checkpointer.save(dealer)
+    with pytest.raises(RuntimeError):
+        checkpointer.flush()
+    assert isinstance(checkpointer._error, ZeroDivisionError)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src import Card, Deck
+from src.codec import (NO_CARD, format_card, format_cards, parse_card, parse_cards, parse_file,
+                       parse_hand, parse_lines)
+
+
+def test_every_card_round_trips():
+    """Check both text forms of every card parse back to its id"""
+    for card in Deck().cards:
+        assert parse_card(format_card(card.card_id)) == card.card_id
+        assert format_card(card.card_id, symbols=True) == str(card)
+        assert parse_card(str(card)) == card.card_id
+    assert parse_card('th') == parse_card('10h') == parse_card('Th') == Card('10', 'heart').card_id
+    with pytest.raises(ValueError):
+        parse_card('1h')
+
+def test_parse_and_format_cards():
+    """Check card lists with and without separators, and hands"""
+    ids = parse_cards('Ah Kd, 10c')
+    assert ids == parse_cards('AhKdTc') == parse_cards("['A♥', 'K♦', '10♣']")
+    assert format_cards(ids) == 'Ah Kd Tc'
+    hand = parse_hand('As 2c')
+    assert str(hand) == str(['A♠', '2♣'])
+    with pytest.raises(ValueError):
+        parse_cards('Ah Kx')
+
+def test_bulk_parsing(tmp_path):
+    """Check the bulk path against the per-card parser, ragged lines and chunked files"""
+    text = 'Ah Kd 2c 3c 4c\n10s 9s 8s\n\nA♥ K♦ 7h\n'
+    ids = parse_lines(text.encode())
+    assert ids.shape == (3, 5) and ids.dtype == np.uint8
+    assert list(ids[0]) == parse_cards('Ah Kd 2c 3c 4c')
+    assert list(ids[1]) == parse_cards('Ts 9s 8s') + [NO_CARD, NO_CARD]
+    assert list(ids[2][0:3]) == parse_cards('Ah Kd 7h')
+    with pytest.raises(ValueError):
+        parse_lines(b'Ah Kx\n')
+    with pytest.raises(ValueError, match='Line 3 '):
+        parse_lines(b'Ah Kd\n\nXx Yy\n')
+    with pytest.raises(ValueError, match='Line 2 '):
+        parse_lines(b'\nAh K\nAh Kd\n')
+
+    path = tmp_path / 'hands.txt'
+    rng = np.random.default_rng(0)
+    deals = np.array([rng.permutation(52)[0:7] for _ in range(500)])
+    path.write_text('\n'.join(format_cards(deal) for deal in deals) + '\n')
+    chunks = list(parse_file(path, chunk_size=1000))
+    assert len(chunks) > 1
+    assert np.array_equal(np.concatenate(chunks), deals)
+
+    # errors give the line of the file, not of the chunk
+    lines = [format_cards(deal) for deal in deals[0:120]]
+    lines[100] = 'Ah Xx'
+    path.write_text('\n'.join(lines) + '\n')
+    with pytest.raises(ValueError, match='Line 101 '):
+        list(parse_file(path, chunk_size=64))
+
+def test_bulk_and_card_parsers_agree():
+    """Check that the bulk path accepts and rejects the same text as parse_cards()"""
+    for text in ['Ah Kd', 'AhKd', "['A♥', '10♦']", '10h,9s;8c', 'A h K d', 'Ah K d', 'Ah Kx', 'hA']:
+        try:
+            expected = parse_cards(text)
+        except ValueError:
+            expected = None
+        if expected is None:
+            with pytest.raises(ValueError):
+                parse_lines(text.encode())
+        else:
+            assert list(parse_lines(text.encode())[0]) == expected
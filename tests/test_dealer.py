@@ -0,0 +1,28 @@
+import random
+
+from src import Player
+from src import Dealer
+
+
+def test_headless_game_runs_to_a_winner():
+    """Check that a computer only game runs without a display until one player is left"""
+    random.seed(7)
+    players = [Player(200, 1, "rand"), Player(200, 2, "soft"), Player(200, 3, "strict")]
+    dealer = Dealer(players, show_display=False)
+    assert dealer.display is None
+    assert len(dealer.players) <= 1
+
+def test_seat_limits():
+    """Check that a Dealer only accepts 2-10 players"""
+    import pytest
+    with pytest.raises(ValueError):
+        Dealer([Player(200, 1)], show_display=False)
+    with pytest.raises(ValueError):
+        Dealer([Player(200, i) for i in range(11)], show_display=False)
+
+def test_full_ring_game():
+    """Check that a ten handed headless game runs to a winner"""
+    random.seed(3)
+    players = [Player(300, i, ["strict", "soft", "rand"][i % 3]) for i in range(1, 11)]
+    dealer = Dealer(players, show_display=False, verbose=False)
+    assert len(dealer.players) <= 1
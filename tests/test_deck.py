@@ -37,3 +37,14 @@ def test_shuffle_changes_order():
     deck = Deck()
     original_order = deck.cards.copy()
     deck.shuffle()
+
+def test_reset_reuses_cards():
+    """Checking reset puts the same card objects back instead of making new ones"""
+    deck = Deck()
+    cards = {id(card) for card in deck.cards}
+    deck.shuffle()
+    for _ in range(10):
+        deck.draw()
+    deck.reset()
+    assert len(deck) == 52
+    assert {id(card) for card in deck.cards} == cards
@@ -0,0 +1,90 @@
+import random
+
+from src import Card
+from src import Dealer
+from src import Player
+from src.equity import split_pot, expected_payouts, round_payouts
+from src.history import HandHistoryWriter, read_hands
+from src.round import GameRound
+
+
+def test_split_pot_side_pots():
+    """Check that an all in player only wins what they matched"""
+    # seat 0 is all in for 50 with the best hand, seat 3 folded after putting in 20
+    payouts, winners = split_pot([50, 100, 100, 20], [5, 3, 1, None])
+    assert payouts == [170, 100, 0, 0]
+    assert winners == {0, 1}
+    payouts, _ = split_pot([30, 30, 30], [2, 2, 0], exact=True)
+    assert payouts == [45.0, 45.0, 0]
+
+def test_expected_payouts():
+    """Check exact runout equity against known spots"""
+    royal = [Card(rank, "spade").card_id for rank in ["10", "J", "Q", "K", "A"]]
+    board = royal[2:]
+    unseen = [card for card in range(52) if card not in royal + [0, 1]]
+    # the royal flush is already made, every runout pays seat 0
+    assert expected_payouts([royal[0:2], [0, 1]], board, unseen, [40, 40]) == [80.0, 0.0]
+    # the same hand types in other suits split every runout
+    split = expected_payouts([[0, 4], [1, 5]], [], [card for card in range(52) if card not in (0, 1, 4, 5)],
+                             [10, 10], max_runouts=500)
+    assert sum(split) == 20.0
+    assert round_payouts([10.5, 9.25, 0.25]) == [11, 9, 0]
+
+    # sampled boards come from the generator passed in, not the random module
+    unseen = [card for card in range(52) if card not in (0, 1, 4, 5)]
+    state = random.getstate()
+    first = expected_payouts([[0, 12], [1, 30]], [], unseen, [10, 10], max_runouts=500, rng=random.Random(3))
+    assert random.getstate() == state
+    assert expected_payouts([[0, 12], [1, 30]], [], unseen, [10, 10], max_runouts=500, rng=random.Random(3)) == first
+
+def make_round(banks:list[int], equity_runouts:bool = False) -> GameRound:
+    """
+    Helper function to seat players for a single round
+
+    Args:
+        banks (list[int]): starting banks
+        equity_runouts (bool, optional): settle by equity. Defaults to False.
+
+    Returns:
+        GameRound: round ready to play
+    """
+    players = [Player(bank, idx + 1, "soft") for idx, bank in enumerate(banks)]
+    GameRound.seat_players(players)
+    return GameRound(players, 2, 4, verbose=False, equity_runouts=equity_runouts)
+
+def test_short_stack_calls_all_in():
+    """Check that a player who cannot cover a bet calls all in instead of folding"""
+    random.seed(4)
+    for _ in range(50):
+        round = make_round([200, 200, 10])
+        round.play()
+        short = round.players[2]
+        # the short stack can only win up to three times what it put in
+        assert round.payouts[2] <= 3 * round.contributions[2]
+        assert sum(round.payouts) == round.pot
+        assert sum(player.bank for player in round.players) == 410
+        if short.bank == 0 and round.contributions[2] == 10:
+            assert short._active is True
+
+def test_equity_runout_conserves_chips():
+    """Check that settling by equity pays out the whole pot without dealing the board"""
+    random.seed(8)
+    settled = 0
+    for _ in range(40):
+        round = make_round([20, 20, 20], equity_runouts=True)
+        round.play()
+        assert sum(round.payouts) == round.pot
+        assert sum(player.bank for player in round.players) == 60
+        if len([player for player in round._active_players if player._active]) > 1:
+            settled += len(round.community_cards) < 5
+    assert settled > 0
+
+def test_dealer_skips_dead_streets(tmp_path):
+    """Check that a game with equity runouts deals no board once everyone is all in"""
+    random.seed(13)
+    players = [Player(60, 1, "rand"), Player(60, 2, "rand"), Player(60, 3, "soft")]
+    with HandHistoryWriter(tmp_path / "hands.tch") as writer:
+        Dealer(players, show_display=False, verbose=False, recorders=[writer], equity_runouts=True)
+    hands = list(read_hands(tmp_path / "hands.tch"))
+    assert all(sum(hand.payouts) <= hand.pot for hand in hands)
+    assert any(len(hand.winners) > 0 and len(hand.board) < 5 for hand in hands)
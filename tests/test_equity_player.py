@@ -0,0 +1,63 @@
+import random
+
+from functools import partial
+
+from src import Card
+from src import Dealer
+from src import Hand
+from src import Player
+from src.equity_player import EquityPlayer
+from src.evaluation import DuplicateEvaluator
+
+
+def make_player(cards:list[tuple], **kwargs) -> EquityPlayer:
+    """
+    Helper function to make an equity player holding cards
+
+    Args:
+        cards (list[tuple]): hole cards as (rank, suit)
+
+    Returns:
+        EquityPlayer: player with a seeded generator
+    """
+    player = EquityPlayer(200, 1, **kwargs)
+    player.hand = Hand([Card(rank, suit) for rank, suit in cards])
+    player.rng = random.Random(0)
+    return player
+
+def test_equity_estimates():
+    """Check the estimate of a made hand and a weak hand"""
+    board = [Card(rank, "spade") for rank in ["10", "J", "Q"]]
+    royal = make_player([("K", "spade"), ("A", "spade")], time_budget=None, max_samples=300)
+    royal.observe(board, 2, 30, 10)
+    assert royal.get_action(4) >= 4
+    assert royal.equity == 1.0 and royal.action_str == 'bet'
+
+    weak = make_player([("2", "club"), ("7", "diamond")], time_budget=None, max_samples=300)
+    weak.observe(board, 3, 30, 60)
+    weak.get_action(4)
+    assert weak.equity < 0.25 and weak.action_str == 'fold'
+    weak.observe(board, 3, 30, 0)
+    weak.get_action(4)
+    assert weak.action_str == 'check'
+
+def test_time_budget_is_respected():
+    """Check that sampling stops at the time budget and falls back to a fair share"""
+    import time
+    player = make_player([("A", "heart"), ("A", "club")], time_budget=0.002, max_samples=10**9)
+    start = time.perf_counter()
+    player.estimate_equity([], 9)
+    assert time.perf_counter() - start < 0.05
+    assert 0 < player.samples < 10**9
+    player.time_budget = 0.0
+    assert player.estimate_equity([], 3) == 0.25 and player.samples == 0
+
+def test_equity_player_in_games():
+    """Check that equity players run in Dealer games and beat random play on duplicate deals"""
+    random.seed(6)
+    players = [EquityPlayer(150, 1, time_budget=None, max_samples=50), Player(150, 2, "rand"), Player(150, 3, "soft")]
+    Dealer(players, show_display=False, verbose=False)
+    equity = partial(EquityPlayer, time_budget=None, max_samples=100)
+    comparison = DuplicateEvaluator(["equity", "rand"], seed=1, params={"equity": equity}).run(60)
+    mean, std_error = comparison.difference("equity", "rand")
+    assert mean > 0
@@ -0,0 +1,67 @@
+import pytest
+
+from src.evaluation import DuplicateEvaluator
+
+
+def test_deals_are_zero_sum_and_repeatable():
+    """Check that every deal's scores sum to zero and the same seed replays them"""
+    evaluator = DuplicateEvaluator(["strict", "soft", "rand"], seed=3)
+    comparison = evaluator.run(20)
+    for deal in comparison.scores:
+        assert sum(deal) == pytest.approx(0)
+    assert DuplicateEvaluator(["strict", "soft", "rand"], seed=3).run(20).scores == comparison.scores
+
+def test_identical_strategies_cancel_exactly():
+    """Check that duplicate deals with common random numbers give equal players equal scores"""
+    comparison = DuplicateEvaluator(["rand", "rand", "rand", "rand"], seed=1).run(10)
+    for deal in comparison.scores:
+        assert deal == pytest.approx([0, 0, 0, 0])
+    independent = DuplicateEvaluator(["rand", "rand", "rand", "rand"], seed=1, duplicate=False).run(10)
+    assert any(deal != pytest.approx([0, 0, 0, 0]) for deal in independent.scores)
+
+def test_summary_and_difference():
+    """Check the per strategy summary"""
+    comparison = DuplicateEvaluator(["strict", "rand", "strict", "rand"], seed=2).run(30)
+    summary = comparison.summary()
+    assert {result.strategy for result in summary} == {"strict", "rand"}
+    assert summary[0].mean >= summary[1].mean
+    mean, std_error = comparison.difference("strict", "rand")
+    assert mean == pytest.approx(comparison.result("strict").mean - comparison.result("rand").mean)
+    assert std_error > 0
+    with pytest.raises(ValueError):
+        comparison.result("soft")
+
+def test_sequential_stops_early():
+    """Check that a clear winner stops the run early and reports the saved hands"""
+    result = DuplicateEvaluator(["strict", "rand"], seed=4).run_sequential(2000, alpha=0.01, check_every=25)
+    assert result.reason == 'significance'
+    assert result.leader == 'strict'
+    assert result.deals < 2000 and result.deals % 25 == 0
+    assert result.hands == 2 * result.deals
+    assert result.hands_saved == 2 * (2000 - result.deals)
+    assert len(result.comparison.scores) == result.deals
+
+def test_sequential_precision_and_limit():
+    """Check the precision stop and the deal limit"""
+    evaluator = DuplicateEvaluator(["rand", "rand"], seed=5)
+    # a single strategy has nothing to beat, so only precision or the limit can stop the run
+    assert evaluator.run_sequential(100, check_every=20).reason == 'max_deals'
+    result = evaluator.run_sequential(1000, alpha=None, precision=50.0, check_every=20)
+    assert result.reason == 'precision' and result.deals == 20
+    with pytest.raises(ValueError):
+        evaluator.run_sequential(100, alpha=None)
+
+def test_running_stats_match_batch():
+    """Check that online statistics and merges match the batch formulas"""
+    import statistics
+    from src.online_stats import RunningStats
+    values = [3.0, -1.5, 7.25, 0.0, 2.5, 11.0, -4.0]
+    left, right, both = RunningStats(), RunningStats(), RunningStats()
+    for idx, value in enumerate(values):
+        both.add(value)
+        (left if idx < 3 else right).add(value)
+    left.merge(right)
+    for stats in (both, left):
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
@@ -0,0 +1,49 @@
+import random
+
+from itertools import combinations
+
+from src.card import Card
+from src.evaluator import evaluate, hand_type, hand_category, FLUSH, STRAIGHT
+
+
+def ids(*cards) -> list[int]:
+    """
+    Helper function to get card ids from (rank, suit) tuples
+
+    Returns:
+        list[int]: card ids
+    """
+    return [Card(rank, suit).card_id for rank, suit in cards]
+
+def test_seven_cards_score_best_five():
+    """Check that a 7 card score is the best score of its 5 card subsets"""
+    random.seed(5)
+    for _ in range(300):
+        cards = random.sample(range(52), 7)
+        assert evaluate(cards) == max(evaluate(five) for five in combinations(cards, 5))
+
+def test_hand_types():
+    """Check the hand types the old classifier got wrong"""
+    wheel = ids(("A", "heart"), ("2", "club"), ("3", "spade"), ("4", "heart"), ("5", "diamond"), ("9", "club"))
+    assert hand_type(evaluate(wheel)) == 'straight'
+    flush = ids(("2", "heart"), ("7", "heart"), ("9", "heart"), ("J", "heart"), ("K", "heart"), ("3", "club"))
+    assert hand_category(evaluate(flush)) == FLUSH
+    two_trips = ids(("2", "heart"), ("2", "club"), ("2", "spade"), ("9", "heart"), ("9", "club"), ("9", "spade"))
+    assert hand_type(evaluate(two_trips)) == 'full_house'
+    three_pairs = ids(("2", "heart"), ("2", "club"), ("5", "spade"), ("5", "heart"), ("9", "club"), ("9", "spade"))
+    assert hand_type(evaluate(three_pairs)) == 'two_pair'
+    # broad straight and a flush in other cards is not a royal flush
+    mixed = ids(("10", "heart"), ("J", "heart"), ("Q", "heart"), ("K", "club"), ("A", "heart"), ("2", "heart"))
+    assert hand_type(evaluate(mixed)) == 'flush'
+    royal = ids(("10", "spade"), ("J", "spade"), ("Q", "spade"), ("K", "spade"), ("A", "spade"))
+    assert hand_type(evaluate(royal)) == 'royal_flush'
+
+def test_kickers_break_ties():
+    """Check that kickers order hands of the same type"""
+    ace_kicker = ids(("2", "heart"), ("2", "club"), ("A", "spade"), ("7", "diamond"), ("5", "heart"))
+    king_kicker = ids(("2", "heart"), ("2", "club"), ("K", "spade"), ("7", "diamond"), ("5", "heart"))
+    assert evaluate(ace_kicker) > evaluate(king_kicker)
+    six_high = ids(("2", "heart"), ("3", "club"), ("4", "spade"), ("5", "diamond"), ("6", "heart"))
+    wheel = ids(("A", "heart"), ("2", "club"), ("3", "spade"), ("4", "heart"), ("5", "diamond"))
+    assert hand_category(evaluate(six_high)) == STRAIGHT
+    assert evaluate(six_high) > evaluate(wheel)
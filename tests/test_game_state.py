@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from src import Card
+from src import Player
+from src import HumanPlayer
+from src.game_state import GameState
+from src.gui import TexasHoldemDisplay
+from src.round import GameRound
+
+
+def test_set_bumps_version_only_on_change():
+    """Check that only real changes bump the version"""
+    state = GameState()
+    state.set('pot', 10)
+    assert state.version == 1
+    state.set('pot', 10)
+    assert state.version == 1
+    with pytest.raises(KeyError):
+        state.set('not_a_field', 1)
+
+def test_delta_has_only_changed_fields():
+    """Check that deltas hold the fields changed after a version"""
+    state = GameState()
+    state.update(pot=6, player_bank=94)
+    seen = state.version
+    state.set('community_cards', [Card("A", "spade")])
+    delta = state.delta(seen)
+    assert list(delta) == ['community_cards']
+    assert isinstance(delta['community_cards'], tuple)
+    assert set(state.delta(0)) == {'pot', 'player_bank', 'community_cards'}
+
+def test_mapping_hides_unset_winner():
+    """Check that winner_str is only part of the state once it is set"""
+    state = GameState()
+    assert 'winner_str' not in state
+    state.set('winner_str', 'The final pot was 10')
+    assert state['winner_str'] == 'The final pot was 10'
+    assert 'winner_str' in TexasHoldemDisplay.make_snapshot(state)
+
+def test_round_updates_state_in_place():
+    """Check that a round keeps one state object and only changes what happened"""
+    random.seed(1)
+    human = HumanPlayer(100, 1)
+    players = [human, Player(100, 2), Player(100, 3), Player(100, 4)]
+    GameRound.seat_players(players)
+    round = GameRound(players, 2, 4, verbose=False)
+    round.set_up_round()
+    assert round.state['pot'] == 6
+    assert round.state['player_bank'] == 98
+
+    seen = round.state.version
+    state = round.deal_hand()
+    assert state is round.state
+    assert list(state.delta(seen)) == ['player_cards']
+    assert state['player_cards'] == tuple(human.hand.cards[0:2])
+
+    seen = state.version
+    round.deal_flop()
+    assert list(state.delta(seen)) == ['community_cards']
+    assert len(state['community_cards']) == 3
+
+def test_round_reset_reuses_objects():
+    """Check that a reset round keeps its deck, board list and state"""
+    random.seed(2)
+    players = [Player(100, 1), Player(100, 2), Player(100, 3)]
+    GameRound.seat_players(players)
+    round = GameRound(players, 2, 4, verbose=False)
+    round.play()
+    deck, board, state, seats = round.deck, round.community_cards, round.state, round.seats
+    GameRound.seat_players(players)
+    round.reset(players, 4, 6)
+    assert round.pot == 0 and round.winners is None
+    assert 'winner_str' not in round.state
+    round.play()
+    assert round.deck is deck and round.community_cards is board
+    assert round.state is state and round.seats is seats
+    assert len(board) == 5
@@ -0,0 +1,77 @@
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src import Card
+from src.gui import TexasHoldemDisplay
+
+
+def make_state(pot:int) -> dict:
+    """
+    Helper function to make a minimal game state dict
+
+    Args:
+        pot (int): pot amount to mark the state with
+
+    Returns:
+        dict: game state dict
+    """
+    return {
+        'player_cards': [Card("A", "spade"), Card("K", "heart")],
+        'player_bank': 100,
+        'community_cards': [],
+        'pot': pot,
+        'opponents': [(2, ('card 1', 'card 2')), (3, ('card 1', 'card 2'))]
+    }
+
+def test_snapshot_is_immutable():
+    """Check that a snapshot cannot be changed and does not follow the source dict"""
+    state = make_state(10)
+    snapshot = TexasHoldemDisplay.make_snapshot(state)
+    state['community_cards'].append(Card("2", "club"))
+    assert snapshot['community_cards'] == ()
+    with pytest.raises(TypeError):
+        snapshot['pot'] = 20
+
+def test_submit_drops_stale_snapshots():
+    """Check that a full queue keeps the newest snapshots and never blocks"""
+    display = TexasHoldemDisplay(threaded=True, queue_size=2)
+    for pot in range(10):
+        display.submit(make_state(pot))
+    assert display._next_snapshot(0)['pot'] == 9
+    assert display._next_snapshot(0) is None
+
+def test_threaded_render_loop():
+    """Check that the render thread starts, draws submitted states and stops"""
+    display = TexasHoldemDisplay(threaded=True, fps=60)
+    display.start()
+    try:
+        for pot in range(5):
+            display.run(make_state(pot))
+        time.sleep(0.1)
+    finally:
+        display.stop()
+    assert display._render_thread is None
+    assert display._snapshots.empty()
+
+def test_opponent_layout_is_cached_and_fits():
+    """Check that opponent positions are computed once per count and stay on screen"""
+    display = TexasHoldemDisplay(threaded=True)
+    for n_opponents in range(1, 10):
+        positions, card_size = display._opponent_layout(n_opponents)
+        assert display._opponent_layout(n_opponents)[0] is positions
+        assert len(positions) == n_opponents
+        for x, y in positions:
+            assert 0 <= x <= display.WIDTH - 2 * card_size[0]
+            assert 0 <= y <= display.HEIGHT - card_size[1]
+
+def test_engine_import_skips_pygame():
+    """Check that importing the package does not import pygame"""
+    import subprocess
+    import sys
+    out = subprocess.run([sys.executable, '-c', "import sys, src; print('pygame' in sys.modules)"],
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'False'
@@ -42,3 +42,13 @@ def test_cards_setter_invalid_item():
     hand = Hand([card1])
     with pytest.raises(TypeError):
         hand.cards = [card1, "not a card"]
+
+def test_clear():
+    """Test that clear empties the hand in place"""
+    hand = Hand([Card("A", "spade")])
+    cards = hand.cards
+    hand._type_int = 1
+    hand.clear()
+    assert len(hand) == 0
+    assert hand.cards is cards
+    assert hand._type_int is None
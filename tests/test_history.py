@@ -0,0 +1,69 @@
+import struct
+
+import pytest
+
+from src.history import HandHistoryWriter, read_hands, count_hands
+
+
+def test_hands_are_recorded(tmp_path, play_game):
+    """Check that every hand is written and decodes into consistent records"""
+    path = tmp_path / "hands.tch"
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=3)
+    hands = list(read_hands(path))
+    assert len(hands) > 0
+    assert [hand.hand_no for hand in hands] == list(range(len(hands)))
+    for hand in hands:
+        # every chip in the pot comes from a logged action
+        assert hand.pot == sum(action.amount for action in hand.actions if action.action != 'deal')
+        assert {action.action for action in hand.actions[0:2]} == {'small_blind', 'large_blind'}
+        # no card is dealt twice
+        cards = [card for seat in hand.seats for card in seat.hole] + list(hand.board)
+        assert len(cards) == len(set(cards))
+        assert len(hand.winners) >= 1
+
+def test_reader_is_lazy(tmp_path, play_game):
+    """Check that read_hands is a generator that can be stopped early"""
+    path = tmp_path / "hands.tch"
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=3)
+    reader = read_hands(path)
+    first = next(reader)
+    assert first.hand_no == 0
+    reader.close()
+
+def test_writer_appends(tmp_path, play_game):
+    """Check that a second writer continues numbering at the end of the file"""
+    path = tmp_path / "hands.tch"
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=3)
+    first_count = count_hands(path)
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=4)
+    hands = list(read_hands(path))
+    assert len(hands) > first_count
+    assert hands[first_count].hand_no == first_count
+
+def test_writer_drops_partial_record(tmp_path, play_game):
+    """Check that appending after a crash mid record drops the partial record"""
+    path = tmp_path / "hands.tch"
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=3)
+    first_count = count_hands(path)
+    complete = path.read_bytes()
+    # a length prefix promising more bytes than were written
+    path.write_bytes(complete + struct.pack('<I', 100) + bytes(10))
+    assert count_hands(path) == first_count
+
+    with HandHistoryWriter(path) as writer:
+        play_game([writer], seed=4)
+    hands = list(read_hands(path))
+    assert path.read_bytes()[0:len(complete)] == complete
+    assert [hand.hand_no for hand in hands] == list(range(len(hands)))
+
+def test_invalid_file(tmp_path):
+    """Check that a non history file raises a ValueError"""
+    path = tmp_path / "bad.tch"
+    path.write_bytes(b"not a history file")
+    with pytest.raises(ValueError):
+        list(read_hands(path))
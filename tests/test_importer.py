@@ -0,0 +1,108 @@
+import pytest
+
+from src.codec import parse_cards
+from src.evaluator import evaluate
+from src.importer import import_files, parse_text_hand, read_text_hands
+
+CASH_HAND = """PokerStars Hand #200000000001:  Hold'em No Limit ($0.01/$0.02 USD) - 2020/01/01 12:00:00 ET
+Table 'Alpha' 6-max Seat #3 is the button
+Seat 1: alice ($2.00 in chips)
+Seat 2: bob smith ($1.50 in chips)
+Seat 3: carol ($3.10 in chips)
+alice: posts small blind $0.01
+bob smith: posts big blind $0.02
+*** HOLE CARDS ***
+Dealt to alice [Ah Kd]
+carol: folds
+alice: raises $0.04 to $0.06
+bob smith: calls $0.04
+*** FLOP *** [2c 3d 4h]
+alice: bets $0.10
+bob smith: raises $0.20 to $0.30
+alice: calls $0.20
+*** TURN *** [2c 3d 4h] [5s]
+alice: checks
+bob smith: bets $0.50
+alice: folds
+Uncalled bet ($0.50) returned to bob smith
+bob smith collected $0.70 from pot
+bob smith: doesn't show hand
+*** SUMMARY ***
+Total pot $0.72 | Rake $0.02
+Board [2c 3d 4h 5s]
+Seat 1: alice (small blind) folded on the Turn
+Seat 2: bob smith (big blind) collected ($0.70)
+Seat 3: carol (button) folded before Flop (didn't bet)
+
+
+
+"""
+
+TOURNAMENT_HAND = """PokerStars Hand #200000000002: Tournament #3000, $0.91+$0.09 USD Hold'em No Limit - Level II (15/30) - 2020/01/01 12:05:00 ET
+Table '3000 1' 9-max Seat #1 is the button
+Seat 1: alice (1,500 in chips)
+Seat 2: dave (1,000 in chips)
+alice: posts the ante 5
+dave: posts the ante 5
+alice: posts small blind 15
+dave: posts big blind 30
+*** HOLE CARDS ***
+Dealt to alice [Tc Th]
+alice: raises 970 to 1000
+dave: calls 970 and is all-in
+*** FLOP *** [2c 7d 9h]
+*** TURN *** [2c 7d 9h] [Js]
+*** RIVER *** [2c 7d 9h Js] [Qs]
+*** SHOW DOWN ***
+alice: shows [Tc Th] (a pair of Tens)
+dave: shows [As Ks] (high card Ace)
+alice collected 2010 from pot
+*** SUMMARY ***
+Total pot 2010 | Rake 0
+Board [2c 7d 9h Js Qs]
+Seat 1: alice (button) showed [Tc Th] and won (2010) with a pair of Tens
+Seat 2: dave (big blind) showed [As Ks] and lost with high card Ace
+
+"""
+
+
+def test_parse_cash_hand():
+    """Check seats, cards, actions and amounts in cents"""
+    hand = parse_text_hand([line for line in CASH_HAND.splitlines() if line])
+    assert hand.hand_id == 200000000001
+    assert (hand.small_blind, hand.big_blind, hand.button) == (1, 2, 2)
+    assert [seat.name for seat in hand.seats] == ['alice', 'bob smith', 'carol']
+    assert [seat.bank for seat in hand.seats] == [200, 150, 310]
+    assert hand.seats[0].hole == tuple(parse_cards('Ah Kd')) and hand.seats[1].hole == ()
+    assert hand.board == tuple(parse_cards('2c 3d 4h 5s'))
+    # every chip put in, less the uncalled bet, is the pot
+    assert sum(action.amount for action in hand.actions if action.action != 'deal') == hand.pot == 72
+    raises = [action for action in hand.actions if action.action == 'raise']
+    assert [action.amount for action in raises] == [5, 10, 30, 0]
+    assert (hand.rake, hand.payouts) == (2, (0, 70, 0))
+
+def test_stream_and_parallel_import(tmp_path):
+    """Check streaming a file, parsing in ranges across workers and evaluating showdowns"""
+    path = tmp_path / 'session.txt'
+    path.write_text((CASH_HAND + TOURNAMENT_HAND) * 40, encoding='utf-8')
+    hands = list(read_text_hands(path))
+    assert len(hands) == 80
+    tournament = hands[1]
+    assert (tournament.small_blind, tournament.big_blind) == (15, 30)
+    assert [action.action for action in tournament.actions[0:2]] == ['ante', 'ante']
+    assert tournament.pot == sum(action.amount for action in tournament.actions if action.action != 'deal')
+    scores = [evaluate(list(seat.hole) + list(tournament.board)) for seat in tournament.seats]
+    assert scores[0] > scores[1]
+
+    # ranges smaller than a hand still give every hand exactly once, in order
+    assert list(import_files([path, path], workers=1, chunk_size=700)) == hands * 2
+    assert list(import_files([path], workers=2, chunk_size=4096)) == hands
+
+def test_bad_hands(tmp_path):
+    """Check strict parsing raises and lenient parsing skips"""
+    bad = "PokerStars Hand #1: Hold'em No Limit - no stakes\nSeat 1: a (5 in chips)\n\n"
+    path = tmp_path / 'session.txt'
+    path.write_text(CASH_HAND + bad + TOURNAMENT_HAND, encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(read_text_hands(path))
+    assert [hand.hand_id for hand in read_text_hands(path, strict=False)] == [200000000001, 200000000002]
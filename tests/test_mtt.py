@@ -0,0 +1,34 @@
+from src.mtt import Entrant, MultiTableTournament
+from src.tournament import BlindLevel, BlindSchedule
+
+
+def test_tournament_finishes_and_conserves_chips():
+    """Check every entrant is placed once and no chips are made or lost"""
+    strategies = ['strict', 'soft', 'rand'] * 10
+    tournament = MultiTableTournament(strategies, bank=500, table_size=6, workers=1, seed=3)
+    standings = tournament.run()
+    assert sorted(entrant.id for entrant in standings) == list(range(1, 31))
+    assert sum(entrant.bank for entrant in standings) == 30 * 500
+    assert standings[0].bank > standings[1].bank
+    assert tournament.hands > 0 and tournament.steps > 0
+
+    prizes = tournament.prizes([50, 30, 20])
+    assert prizes[standings[0].id] == 50 and prizes[standings[3].id] == 0
+
+    # the same seed plays the same tournament, with or without worker processes
+    again = MultiTableTournament(strategies, bank=500, table_size=6, workers=2, seed=3).run()
+    assert again == standings
+
+def test_balance_breaks_and_evens_tables():
+    """Check tables are broken once the field fits on fewer and sizes stay within one"""
+    tournament = MultiTableTournament(['strict'] * 4, table_size=6,
+                                      schedule=BlindSchedule([BlindLevel(1, 2)]), workers=1)
+    entrant = lambda idx: Entrant(idx, 'strict', 100)
+    tables = {0: [entrant(idx) for idx in range(6)], 1: [entrant(idx) for idx in range(6, 8)],
+              2: [entrant(idx) for idx in range(8, 11)]}
+    buttons = {0: 0, 1: 0, 2: 0}
+    tournament._balance(tables, buttons)
+    assert len(tables) == 2 and set(buttons) == set(tables)
+    sizes = sorted(len(seats) for seats in tables.values())
+    assert sizes == [5, 6]
+    assert sorted(entrant.id for seats in tables.values() for entrant in seats) == list(range(11))
@@ -0,0 +1,90 @@
+import random
+
+from src import Player
+from src.history import HandHistoryWriter, read_hands
+from src.opponent_stats import OpponentStats, PlayerStats
+from src.round import GameRound
+
+
+def test_counts_match_history(tmp_path, play_game):
+    """Check hand, VPIP and PFR counts against the recorded hand history"""
+    path = tmp_path / "hands.tch"
+    tracker = OpponentStats()
+    with HandHistoryWriter(path) as writer:
+        play_game([writer, tracker], seed=3, strategies=("rand", "strict", "rand"))
+    expected = {}
+    for hand in read_hands(path):
+        preflop = []
+        for action in hand.actions:
+            if action.action == 'deal':
+                break
+            preflop.append(action)
+        for seat, record in enumerate(hand.seats):
+            counts = expected.setdefault(record.player_id, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += any(a.seat == seat and a.action in ('call', 'raise') for a in preflop)
+            counts[2] += any(a.seat == seat and a.action == 'raise' for a in preflop)
+
+    assert set(tracker.players) == set(expected)
+    for player_id, (hands, vpip_hands, pfr_hands) in expected.items():
+        stats = tracker[player_id]
+        assert (stats.hands, stats.vpip_hands, stats.pfr_hands) == (hands, vpip_hands, pfr_hands)
+        assert stats.showdowns_won <= stats.showdowns <= stats.flops_seen <= stats.hands
+        assert stats.folds_to_bet <= stats.bets_faced
+
+    # the strict strategy mostly checks, the random one raises a third of the time
+    assert tracker[2].aggression_factor < tracker[1].aggression_factor
+
+def test_snapshot_and_merge(play_game):
+    """Check that merged trackers add up and snapshots round trip"""
+    first, second = OpponentStats(), OpponentStats()
+    play_game([first], seed=3, strategies=("rand", "strict", "rand"))
+    play_game([second], seed=4, strategies=("rand", "strict", "rand"))
+    merged = OpponentStats.from_snapshot(first.snapshot())
+    merged.merge(second)
+    for player_id in (1, 2, 3):
+        assert merged[player_id].counts() == tuple(a + b for a, b in
+                                                   zip(first[player_id].counts(), second[player_id].counts()))
+    assert merged[99].hands == 0 and PlayerStats().vpip == 0.0
+
+def test_bets_faced_match_history(tmp_path, play_game):
+    """Check that every action facing a bet after the flop is counted, raises included"""
+    path = tmp_path / "hands.tch"
+    tracker = OpponentStats()
+    with HandHistoryWriter(path) as writer:
+        play_game([writer, tracker], seed=5, strategies=("rand", "strict", "rand"))
+    faced = {}
+    raised_into_bet = 0
+    for hand in read_hands(path):
+        street = None
+        for action in hand.actions:
+            if action.action == 'deal':
+                street = {}
+                continue
+            if (street is None) or (action.action not in ('fold', 'check', 'call', 'raise')):
+                continue
+            before = street.get(action.seat, 0)
+            if max(street.values(), default=0) > before:
+                player_id = hand.seats[action.seat].player_id
+                faced[player_id] = faced.get(player_id, 0) + 1
+                raised_into_bet += action.action == 'raise'
+            street[action.seat] = before + action.amount
+
+    assert raised_into_bet > 0
+    for player_id, stats in tracker.players.items():
+        assert stats.bets_faced == faced.get(player_id, 0)
+
+def test_equity_runout_showdowns_see_the_flop():
+    """Check that a hand settled by equity before the flop keeps the showdown frequency at most 1"""
+    random.seed(6)
+    players = [Player(2, 1), Player(4, 2)]
+    GameRound.seat_players(players)
+    tracker = OpponentStats()
+    # both players are all in from the blinds, so the pot is settled with no board dealt
+    round = GameRound(players, 2, 4, recorders=[tracker], verbose=False, equity_runouts=True)
+    round.play()
+    assert len(round.community_cards) == 0
+    for player_id in (1, 2):
+        stats = tracker[player_id]
+        assert stats.showdowns == stats.flops_seen == 1
+        assert stats.showdown_frequency == 1.0
@@ -0,0 +1,79 @@
+import os
+import random
+
+from src import Player
+from src import Dealer
+from src.history import HandHistoryWriter, read_hands
+from src.history_index import IndexedHandHistory, HandHistoryIndex
+from src.replay import HandReplayer
+
+
+def make_history(path) -> list:
+    """
+    Helper function to play a logged headless game
+
+    Args:
+        path (str): history file path
+
+    Returns:
+        list: all hands read back sequentially
+    """
+    random.seed(11)
+    players = [Player(300, 1, "rand"), Player(300, 2, "soft"), Player(300, 3, "rand"), Player(300, 4)]
+    with HandHistoryWriter(path) as writer:
+        Dealer(players, show_display=False, recorders=[writer], verbose=False)
+    return list(read_hands(path))
+
+def test_random_access_matches_sequential(tmp_path):
+    """Check that seeking to hand N returns the same hand as reading in order"""
+    path = tmp_path / "hands.tch"
+    hands = make_history(path)
+    with IndexedHandHistory(path) as history:
+        assert len(history) == len(hands)
+        for position in [len(hands) - 1, 0, len(hands) // 2]:
+            assert history[position] == hands[position]
+
+def test_postings(tmp_path):
+    """Check the player and hand type posting lists"""
+    path = tmp_path / "hands.tch"
+    hands = make_history(path)
+    with IndexedHandHistory(path) as history:
+        player_hands = list(history.hands_for_player(4))
+        assert player_hands == [hand for hand in hands if 4 in [seat.player_id for seat in hand.seats]]
+        assert sum(len(postings) for postings in history.index.types.values()) == len(hands)
+        assert list(history.hands_for_player(99)) == []
+
+def test_sidecar_index_is_reused(tmp_path):
+    """Check that the sidecar index is saved and loads back the same offsets"""
+    path = tmp_path / "hands.tch"
+    make_history(path)
+    IndexedHandHistory(path).close()
+    assert os.path.exists(str(path) + '.idx')
+    index = HandHistoryIndex.load(str(path) + '.idx')
+    assert list(index.offsets) == list(HandHistoryIndex.build(path).offsets)
+
+def test_replay_full_hand_matches_next_hand(tmp_path):
+    """Check that replaying a whole hand gives the banks the next hand started with"""
+    path = tmp_path / "hands.tch"
+    hands = make_history(path)
+    with IndexedHandHistory(path) as history:
+        replayer = HandReplayer(history)
+        for position in range(len(hands) - 1):
+            round = replayer.state_at(position)
+            banks = {player.id: player.bank for player in round.players}
+            for seat in hands[position + 1].seats:
+                assert banks[seat.player_id] == seat.bank
+
+def test_replay_mid_hand(tmp_path):
+    """Check the round state part way through a hand"""
+    path = tmp_path / "hands.tch"
+    hands = make_history(path)
+    hand = hands[0]
+    with IndexedHandHistory(path) as history:
+        for action_idx in range(len(hand.actions) + 1):
+            round = HandReplayer(history).state_at(0, action_idx)
+            played = hand.actions[0:action_idx]
+            assert round.pot == sum(action.amount for action in played if action.action != 'deal')
+            dealt = sum(action.amount for action in played if action.action == 'deal')
+            assert [card.card_id for card in round.community_cards] == list(hand.board[0:dealt])
+            assert round.winners is None
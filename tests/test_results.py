@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.results import PLAYER_COLUMNS, ResultsExporter, ResultsReader
+
+
+def test_export_round_trip(tmp_path, play_game):
+    """Check that exported columns read back consistently across chunks"""
+    with ResultsExporter(tmp_path / "results", chunk_size=7) as exporter:
+        players = play_game([exporter], seed=5)[0]
+    reader = ResultsReader(tmp_path / "results")
+    n_hands = len(reader.hands['pot'])
+    assert n_hands > 7
+    assert isinstance(reader.players['bank'], np.memmap)
+    assert list(reader.hands['hand_no']) == list(range(n_hands))
+    assert reader.hands['n_players'].sum() == len(reader.players['hand_no'])
+
+    # chips only leave a hand through the rounding of split pots
+    per_hand = np.bincount(reader.players['hand_no'], weights=reader.players['bank_delta'])
+    assert np.all(per_hand <= 0)
+    assert np.all(per_hand > -reader.hands['n_winners'].astype(np.int64))
+
+    # the last recorded bank of each player is their final bank
+    for player in players:
+        rows = reader.players['player_id'] == player.id
+        assert reader.players['bank'][rows][-1] == player.bank
+
+def test_strategy_summary(tmp_path, play_game):
+    """Check that the strategy summary covers every player row"""
+    with ResultsExporter(tmp_path / "results", chunk_size=7) as exporter:
+        play_game([exporter], seed=5)
+    reader = ResultsReader(tmp_path / "results")
+    summary = reader.strategy_summary()
+    assert set(summary) == {"rand", "soft", "strict"}
+    assert sum(row['hands'] for row in summary.values()) == len(reader.players['player_id'])
+
+def test_existing_results_are_not_overwritten(tmp_path, play_game):
+    """Check that exporting into a used directory raises a ValueError"""
+    with ResultsExporter(tmp_path / "results", chunk_size=7) as exporter:
+        play_game([exporter], seed=5)
+    with pytest.raises(ValueError):
+        ResultsExporter(tmp_path / "results")
+
+def test_unfinished_export_is_started_over(tmp_path, play_game):
+    """Check that column files without a schema are cleared instead of appended to"""
+    (tmp_path / "results" / "players").mkdir(parents=True)
+    (tmp_path / "results" / "players" / "bank.bin").write_bytes(b"\x01" * 24)
+    with ResultsExporter(tmp_path / "results", chunk_size=7) as exporter:
+        players = play_game([exporter], seed=5)[0]
+    reader = ResultsReader(tmp_path / "results")
+    assert (tmp_path / "results" / "players" / "bank.bin").stat().st_size == 8 * len(reader.players['bank'])
+    rows = reader.players['player_id'] == players[0].id
+    assert reader.players['bank'][rows][-1] == players[0].bank
+
+def test_many_strategies(tmp_path):
+    """Check that strategy codes above 255 are kept"""
+    exporter = ResultsExporter(tmp_path / "results")
+    codes = [exporter._strategy_code(f'config {idx}') for idx in range(300)]
+    assert codes == list(range(300))
+    assert np.array(codes, dtype=PLAYER_COLUMNS['strategy']).tolist() == codes
@@ -0,0 +1,35 @@
+import random
+
+from src.player import Player, StrategyParams, STRATEGIES
+from src.param_player import ParamPlayer
+from src.search import StrategySearch, random_params
+
+
+def test_param_player_matches_named_strategy():
+    """Check that a ParamPlayer with a strategy's parameters decides the same way"""
+    named = Player(200, 1, "soft")
+    param = ParamPlayer(200, 2, STRATEGIES["soft"], "soft_copy")
+    named.rng, param.rng = random.Random(3), random.Random(3)
+    for _ in range(20):
+        assert named.get_action(4) == param.get_action(4)
+        assert named.action_str == param.action_str
+    assert param.strategy == "soft_copy"
+
+def test_successive_halving():
+    """Check the rung sizes and that the survivor played the most deals"""
+    rng = random.Random(1)
+    configs = [random_params(rng) for _ in range(8)]
+    search = StrategySearch(field=("strict", "rand"), seed=2, workers=1)
+    results = search.run(configs=configs, min_deals=4)
+    assert [len(rung) for rung in search.rungs] == [8, 4, 2, 1]
+    assert [rung[0].deals for rung in search.rungs] == [4, 8, 16, 32]
+    assert results[0].deals == 32 and results[0] == search.rungs[-1][0]
+    assert sorted(result.params for result in results) == sorted(configs)
+
+def test_parallel_matches_in_process():
+    """Check that worker processes give the same results as running in process"""
+    configs = [StrategyParams(0.9, 0.05, 0.05, 0.05), StrategyParams(0.3, 0.3, 0.4, 0.2),
+               StrategyParams(0.6, 0.35, 0.05, 0.1), StrategyParams(0.1, 0.1, 0.8, 0.01)]
+    in_process = StrategySearch(field=("soft",), workers=1).run(configs=configs, min_deals=3)
+    parallel = StrategySearch(field=("soft",), workers=2).run(configs=configs, min_deals=3)
+    assert in_process == parallel
@@ -0,0 +1,25 @@
+import pytest
+
+from src import Player
+from src.seats import SeatMap
+
+
+def test_lookup_by_id_and_seat():
+    """Check lookups by id, seat and seat order"""
+    players = [Player(100, i) for i in [7, 3, 9, 1]]
+    seats = SeatMap(players)
+    assert seats.by_id(9) is players[2]
+    assert seats.seat_of(1) == 3
+    assert seats.player_at(0) is players[0]
+    assert seats.by_id(42) is None
+    assert [player.id for player in seats.clockwise_from(1)] == [9, 1, 7]
+    assert len(seats) == 4
+
+def test_invalid_tables():
+    """Check seat count and unique id validation"""
+    with pytest.raises(ValueError):
+        SeatMap([Player(100, 1)])
+    with pytest.raises(ValueError):
+        SeatMap([Player(100, i) for i in range(11)])
+    with pytest.raises(ValueError):
+        SeatMap([Player(100, 1), Player(100, 1)])
@@ -0,0 +1,56 @@
+import sqlite3
+
+import pytest
+
+from src.store import ResultsStore
+
+
+def test_games_and_rounds_are_stored(tmp_path, play_game):
+    """Check that every game and round lands in the database"""
+    path = tmp_path / "results.db"
+    with ResultsStore(path, 50) as store:
+        play_game([store], seed=9, n_games=2)
+    conn = sqlite3.connect(path)
+    assert conn.execute('SELECT COUNT(*) FROM games').fetchone()[0] == 2
+    assert conn.execute('SELECT COUNT(*) FROM games WHERE winner_id IS NULL').fetchone()[0] == 0
+    n_rounds = conn.execute('SELECT COUNT(*) FROM rounds').fetchone()[0]
+    assert n_rounds > 0
+    # blinds are logged for every round
+    blinds = conn.execute("SELECT COUNT(*) FROM actions WHERE action LIKE '%blind'").fetchone()[0]
+    assert blinds == 2 * n_rounds
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    conn.close()
+
+def test_ids_continue_on_reopen(tmp_path, play_game):
+    """Check that a reopened store keeps adding games after the existing ones"""
+    path = tmp_path / "results.db"
+    for _ in range(2):
+        with ResultsStore(path, 50) as store:
+            play_game([store], seed=9)
+    conn = sqlite3.connect(path)
+    assert [row[0] for row in conn.execute('SELECT game_id FROM games')] == [1, 2]
+    conn.close()
+
+def test_summary_queries(tmp_path, play_game):
+    """Check the summary queries and that they use the analytical indexes"""
+    path = tmp_path / "results.db"
+    with ResultsStore(path, 50) as store:
+        play_game([store], seed=9, n_games=2)
+    with ResultsStore(path) as store:
+        summary = store.strategy_summary()
+        assert {row[0] for row in summary} <= {"rand", "soft", "strict"}
+        counts = store.hand_type_counts(player_id=1)
+        assert all(count > 0 for _, count in counts)
+        plan = store.query('EXPLAIN QUERY PLAN SELECT COUNT(*) FROM showdowns WHERE hand_type = ?', ('pair',))
+        assert 'showdowns_hand_type' in str(plan)
+
+def test_writer_error_is_raised(tmp_path):
+    """Check that any error in the writer thread is raised by flush() instead of hanging it"""
+    store = ResultsStore(tmp_path / "results.db")
+    # a batch for a table the store does not know makes the writer raise a KeyError
+    store._queue.put({'missing': [(1,)]})
+    with pytest.raises(RuntimeError) as error:
+        store.flush()
+    assert isinstance(error.value.__cause__, KeyError)
+    with pytest.raises(RuntimeError):
+        store.close()
@@ -0,0 +1,109 @@
+import itertools
+import random
+
+from itertools import permutations
+
+import pytest
+
+from src import Player
+from src import Dealer
+from src.history import HandHistoryWriter, read_hands
+from src.replay import HandReplayer
+from src.round import GameRound
+from src.tournament import BlindLevel, BlindSchedule, icm_equities, prize_payouts
+
+
+def brute_force_icm(stacks:list[int], payouts:list[float]) -> list[float]:
+    """
+    Helper function to get ICM equities by going through every finishing order
+    """
+    equities = [0.0] * len(stacks)
+    for order in permutations(range(len(stacks))):
+        prob = 1.0
+        remaining = sum(stacks)
+        for idx in order:
+            prob *= stacks[idx] / remaining
+            remaining -= stacks[idx]
+        for place, idx in enumerate(order[0:len(payouts)]):
+            equities[idx] += prob * payouts[place]
+    return equities
+
+def test_schedule_levels():
+    """Check levels by hands and by time, and that the last level stays in play"""
+    schedule = BlindSchedule([BlindLevel(5, 10, 0, 3), BlindLevel(10, 20, 2, 3), (20, 40, 5, 3)])
+    assert [schedule.level(hands).big_blind for hands in range(10)] == [10] * 3 + [20] * 3 + [40] * 4
+    assert schedule.level(4).ante == 2
+    timed = BlindSchedule([BlindLevel(5, 10, 0, 60), BlindLevel(10, 20, 0, 60)], unit='seconds')
+    assert timed.level(1000, 59.9).big_blind == 10 and timed.level(0, 60).big_blind == 20
+    assert BlindSchedule.linear().level(3) == BlindLevel(8, 10, 0, 1)
+    with pytest.raises(ValueError):
+        BlindSchedule([BlindLevel(10, 5)])
+    with pytest.raises(ValueError):
+        BlindSchedule([BlindLevel(5, 10)], unit='levels')
+
+def test_icm_matches_brute_force():
+    """Check the dynamic program against every finishing order"""
+    stacks = [5000, 3000, 2000, 1500, 800, 200]
+    payouts = [50, 30, 20]
+    assert icm_equities(stacks, payouts) == pytest.approx(brute_force_icm(stacks, payouts))
+    assert sum(icm_equities(stacks, payouts)) == pytest.approx(100)
+    assert icm_equities([100, 100, 100], [60, 40]) == pytest.approx([100 / 3] * 3)
+    # an empty stack finishes last
+    assert icm_equities([100, 0], [70, 30]) == pytest.approx([70, 30])
+    # ten players with every place paid
+    equities = icm_equities(list(range(100, 1100, 100)), list(range(10, 0, -1)))
+    assert sum(equities) == pytest.approx(55)
+    assert equities == sorted(equities)
+
+def test_dealer_schedule_antes_and_standings(tmp_path):
+    """Check a scheduled game with antes, its replays and the finishing order"""
+    random.seed(2)
+    path = tmp_path / "hands.tch"
+    players = [Player(300, 1, "rand"), Player(300, 2, "soft"), Player(300, 3, "strict")]
+    schedule = BlindSchedule([BlindLevel(5, 10, 1, 4), BlindLevel(10, 20, 2, 4), BlindLevel(20, 40, 5, 4)])
+    with HandHistoryWriter(path) as writer:
+        dealer = Dealer(list(players), show_display=False, recorders=[writer], verbose=False, schedule=schedule)
+
+    hands = list(read_hands(path))
+    for position, hand in enumerate(hands):
+        assert (hand.small_blind, hand.large_blind) == schedule.level(position)[0:2]
+        antes = [action for action in hand.actions if action.action == 'ante']
+        assert len(antes) == len(hand.seats)
+        assert hand.pot == sum(action.amount for action in hand.actions if action.action != 'deal')
+
+    # replaying a hand with antes gives the banks the next hand started with
+    for position in range(len(hands) - 1):
+        round = HandReplayer.replay(hands[position])
+        banks = {player.id: player.bank for player in round.players}
+        for seat in hands[position + 1].seats:
+            assert banks[seat.player_id] == seat.bank
+
+    standings = dealer.standings
+    assert sorted(player.id for player in standings) == [1, 2, 3]
+    prizes = prize_payouts(standings, [60, 40])
+    assert prizes[standings[0].id] == 60 and prizes[standings[2].id] == 0
+    assert sum(dealer.prize_equities([60, 40]).values()) == pytest.approx(100)
+
+def test_time_levels_never_overdraw_a_bank(tmp_path, monkeypatch):
+    """Check that a level going up between the eliminations and the next hand cannot make a bank negative"""
+    random.seed(1)
+    # every look at the clock moves it on, so the level can change between two calls
+    clock = itertools.count(0.0, 1.0)
+    monkeypatch.setattr(Dealer, '_elapsed', lambda self: next(clock))
+    schedule = BlindSchedule([BlindLevel(5 * 2 ** idx, 10 * 2 ** idx, 2 ** idx, 1) for idx in range(12)], 'seconds')
+    players = [Player(500, 1, "rand"), Player(500, 2, "soft"), Player(500, 3, "strict")]
+    with HandHistoryWriter(tmp_path / "hands.tch") as writer:
+        Dealer(list(players), show_display=False, recorders=[writer], verbose=False, schedule=schedule)
+    assert all(player.bank >= 0 for player in players)
+    assert sum(player.bank for player in players) == 1500
+    for hand in read_hands(tmp_path / "hands.tch"):
+        assert all(seat.bank >= 0 for seat in hand.seats)
+
+def test_short_blind_is_all_in():
+    """Check that a player with less than the big blind posts their whole bank"""
+    players = [Player(100, 1), Player(3, 2)]
+    GameRound.seat_players(players)
+    round = GameRound(players, 2, 4, verbose=False)
+    round.set_up_round()
+    assert players[1].bank == 0
+    assert round.pot == 5
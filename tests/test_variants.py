@@ -0,0 +1,164 @@
+import random
+
+import pytest
+
+from itertools import combinations
+
+from src import Deck
+from src.card import Card
+from src.equity import expected_payouts
+from src.equity_player import EquityPlayer
+from src.evaluator import BoardEvaluator, evaluate, evaluate_short_deck
+from src.hand import Hand
+from src.history import HandHistoryWriter
+from src.player import Player
+from src.round import GameRound
+from src.variants import HOLDEM, OMAHA, SHORT_DECK, get_variant
+from src.winner import HandClassifier
+
+
+class FoldingPlayer(Player):
+    def get_action(self, min_bet:int) -> int:
+        """
+        Method to fold every time the player acts
+        """
+        self.action_str = 'fold'
+        return 0
+
+
+def ids(*cards) -> list[int]:
+    """
+    Helper function to get card ids from (rank, suit) tuples
+
+    Returns:
+        list[int]: card ids
+    """
+    return [Card(rank, suit).card_id for rank, suit in cards]
+
+def test_omaha_matches_brute_force():
+    """Check the board evaluator against every 2 hole and 3 board card hand"""
+    rng = random.Random(3)
+    for short_deck, score in ((False, evaluate), (True, evaluate_short_deck)):
+        deck = [card for card in range(52) if (not short_deck) or (card >= 16)]
+        for _ in range(300):
+            cards = rng.sample(deck, 9)
+            hole, board = cards[0:4], cards[4:9]
+            best = max(score(list(two) + list(three))
+                       for two in combinations(hole, 2) for three in combinations(board, 3))
+            assert BoardEvaluator(board, 2, short_deck).evaluate(hole) == best
+
+def test_omaha_uses_exactly_two_hole_cards():
+    """Check that four hearts in hand and one on the board is no flush, and a board flush needs two"""
+    hole = ids(("A", "heart"), ("K", "heart"), ("Q", "heart"), ("J", "heart"))
+    board = ids(("2", "heart"), ("7", "club"), ("8", "spade"), ("3", "diamond"), ("4", "club"))
+    assert OMAHA.hand_type(OMAHA.score(hole, board)) == 'high'
+    assert HOLDEM.hand_type(HOLDEM.score(hole, board)) == 'flush'
+
+    board = ids(("2", "spade"), ("5", "spade"), ("7", "spade"), ("9", "spade"), ("J", "spade"))
+    one_spade = ids(("A", "spade"), ("K", "club"), ("Q", "diamond"), ("3", "heart"))
+    assert OMAHA.hand_type(OMAHA.score(one_spade, board)) == 'high'
+
+def test_short_deck_ranking():
+    """Check that a flush beats a full house and A-6-7-8-9 is a straight in short deck"""
+    flush = ids(("6", "heart"), ("8", "heart"), ("10", "heart"), ("Q", "heart"), ("A", "heart"))
+    full_house = ids(("K", "club"), ("K", "spade"), ("K", "heart"), ("9", "club"), ("9", "spade"))
+    assert evaluate(flush) < evaluate(full_house)
+    assert evaluate_short_deck(flush) > evaluate_short_deck(full_house)
+    assert SHORT_DECK.hand_type(evaluate_short_deck(flush)) == 'flush'
+
+    wheel = ids(("A", "heart"), ("6", "club"), ("7", "spade"), ("8", "heart"), ("9", "diamond"))
+    six_high = ids(("10", "heart"), ("6", "club"), ("7", "spade"), ("8", "heart"), ("9", "diamond"))
+    assert SHORT_DECK.hand_type(evaluate_short_deck(wheel)) == 'straight'
+    assert evaluate_short_deck(wheel) < evaluate_short_deck(six_high)
+
+    hand = Hand([Card.from_id(card) for card in flush])
+    assert HandClassifier(hand, SHORT_DECK).calc_hand_rank() == (6, 'flush')
+    assert HandClassifier(hand).calc_hand_rank() == (5, 'flush')
+
+def test_short_deck_cards():
+    """Check the short deck has the 36 cards from six to ace"""
+    deck = Deck(ranks=SHORT_DECK.ranks)
+    assert len(deck) == SHORT_DECK.deck_size == 36
+    assert min(card.card_id for card in deck.cards) == 16
+    assert get_variant('short_deck') is SHORT_DECK
+    with pytest.raises(ValueError):
+        get_variant('razz')
+
+@pytest.mark.parametrize("variant", [OMAHA, SHORT_DECK])
+def test_variant_rounds(variant):
+    """Check that variant rounds deal the variant's cards and keep the chips"""
+    random.seed(7)
+    everyone = [Player(200, idx + 1) for idx in range(5)]
+    players = everyone
+    round = None
+    for _ in range(30):
+        GameRound.seat_players(players)
+        if round is None:
+            round = GameRound(players, 2, 4, verbose=False, variant=variant)
+        else:
+            round.reset(players, 2, 4)
+        round.play()
+        assert all(len(player.hand.cards) in (variant.hole_cards, variant.hole_cards + 5) for player in players)
+        assert len(round.deck) + len(round.community_cards) == variant.deck_size - variant.hole_cards * len(players)
+        assert all(player.hand._type_str in variant.hand_types for player in round.winners if player.hand._type_str)
+        assert sum(player.bank for player in everyone) == 1000
+        players = [player for player in players if player.bank > 4]
+        if len(players) < 2:
+            break
+
+@pytest.mark.parametrize("variant", [HOLDEM, OMAHA, SHORT_DECK])
+def test_everyone_folds_preflop(variant):
+    """Check that the pot goes to the last player when everyone else folds before the flop"""
+    random.seed(0)
+    players = [FoldingPlayer(100, idx + 1) for idx in range(3)]
+    GameRound.seat_players(players)
+    round = GameRound(players, 2, 4, verbose=False, variant=variant)
+    round.play()
+    assert len(round.community_cards) == 0
+    assert len(round.winners) == 1
+    winner = round.winners[0]
+    assert winner._active is True
+    assert [player for player in players if player._active] == [winner]
+    assert winner.bank == 100 + sum(round.contributions) - round.contributions[players.index(winner)]
+    assert sum(player.bank for player in players) == 300
+
+@pytest.mark.parametrize("variant", [HOLDEM, OMAHA, SHORT_DECK])
+def test_all_in_preflop_equity_runout(variant):
+    """Check that a preflop all in settled by equity pays the pot in every variant"""
+    random.seed(1)
+    players = [Player(2, 1), Player(4, 2)]
+    GameRound.seat_players(players)
+    round = GameRound(players, 2, 4, verbose=False, equity_runouts=True, variant=variant)
+    round.play()
+    assert len(round.community_cards) == 0
+    assert len(round.winners) >= 1
+    assert sum(player.bank for player in players) == 6
+
+def test_omaha_equity_sums_to_pot():
+    """Check that Omaha runout equity ranks by the exact two card rule and pays the pot"""
+    hole_a = ids(("A", "heart"), ("K", "heart"), ("Q", "heart"), ("J", "heart"))
+    hole_b = ids(("2", "club"), ("2", "spade"), ("7", "diamond"), ("8", "diamond"))
+    board = ids(("2", "heart"), ("9", "club"), ("3", "spade"), ("4", "diamond"))
+    unseen = [card for card in range(52) if card not in hole_a + hole_b + board]
+    expected = expected_payouts([hole_a, hole_b], board, unseen, [50, 50], variant=OMAHA)
+    assert sum(expected) == pytest.approx(100)
+    # the trips are ahead, the four hearts only make a flush with two of them
+    assert expected[1] > expected[0]
+
+def test_holdem_only_components_reject_variants(tmp_path):
+    """Check that the hand history and EquityPlayer refuse variants they would get wrong"""
+    players = [Player(100, idx + 1) for idx in range(3)]
+    GameRound.seat_players(players)
+    with HandHistoryWriter(tmp_path / "omaha.tch") as writer:
+        round = GameRound(players, 2, 4, recorders=[writer], verbose=False, variant=OMAHA)
+        with pytest.raises(ValueError):
+            round.play()
+
+    equity_players = [EquityPlayer(100, 1), Player(100, 2)]
+    GameRound.seat_players(equity_players)
+    with pytest.raises(ValueError):
+        GameRound(equity_players, 2, 4, verbose=False, variant=SHORT_DECK)
+
+    equity_players[0].hand = Hand([Card.from_id(card) for card in range(4)])
+    with pytest.raises(ValueError):
+        equity_players[0].estimate_equity([], 1)